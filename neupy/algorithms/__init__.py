@@ -3,6 +3,7 @@ from .gd.lev_marq import *
 from .gd.quasi_newton import *
 from .gd.conjgrad import *
 from .gd.hessian import *
+from .gd.hessian_free import *
 from .gd.hessdiag import *
 from .gd.rprop import *
 from .gd.momentum import *
@@ -14,6 +15,7 @@ from .gd.adamax import *
 
 from .gd.step_updates import *
 from .gd.regularizers import *
+from .gd.pruning import *
 
 from .memory.discrete_hopfield_network import *
 from .memory.bam import *
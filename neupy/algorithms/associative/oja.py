@@ -1,6 +1,8 @@
+import inspect
+
 import numpy as np
 
-from neupy.utils import format_data
+from neupy.utils import format_data, iters
 from neupy.exceptions import NotTrained
 from neupy.core.properties import IntProperty, ParameterProperty
 from neupy.algorithms.base import BaseNetwork
@@ -40,6 +42,15 @@ class Oja(BaseNetwork):
         Defines networks weights.
         Defaults to :class:`XavierNormal() <neupy.init.XavierNormal>`.
 
+    batch_size : int or None
+        Number of samples propagated through the network per one
+        weight update. Intermediate arrays allocated during the
+        update are proportional to the mini-batch size, which makes
+        it possible to train network on the ``np.memmap`` arrays
+        that don't fit into memory. The ``None`` value means that
+        all samples will be used in one update.
+        Defaults to ``None``.
+
     {BaseNetwork.Parameters}
 
     Methods
@@ -51,6 +62,12 @@ class Oja(BaseNetwork):
         Trains the network to the data X. Network trains until maximum
         number of ``epochs`` was reached.
 
+    partial_fit(X)
+        Makes one pass over the data ``X`` and updates weights after
+        each mini-batch. Input can be an iterator or generator that
+        yields chunks of the data, which makes it possible to learn
+        principal components from the stream.
+
     predict(X)
         Returns hidden representation of the input data ``X``. Basically,
         it applies dimensionality reduction.
@@ -85,8 +102,22 @@ class Oja(BaseNetwork):
     """
     minimized_data_size = IntProperty(minval=1)
     weight = ParameterProperty(default=init.XavierNormal())
+    batch_size = IntProperty(default=None, minval=1, allow_none=True)
+
+    def init_weight(self, n_input_features):
+        if isinstance(self.weight, init.Initializer):
+            weight_shape = (n_input_features, self.minimized_data_size)
+            self.weight = self.weight.sample(weight_shape, return_array=True)
 
-    def one_training_update(self, X, y_train):
+        if n_input_features != self.weight.shape[0]:
+            raise ValueError(
+                "Invalid number of features. Expected {}, got {}"
+                "".format(self.weight.shape[0], n_input_features))
+
+    def one_training_update(self, X, y_train=None):
+        # Input might be a slice from the memory-mapped array, and
+        # we convert to float only samples from the mini-batch
+        X = format_data(X)
         weight = self.weight
 
         minimized = np.dot(X, weight)
@@ -104,20 +135,41 @@ class Oja(BaseNetwork):
         return mae
 
     def train(self, X, epochs=100):
-        X = format_data(X)
-        n_input_features = X.shape[1]
-
-        if isinstance(self.weight, init.Initializer):
-            weight_shape = (n_input_features, self.minimized_data_size)
-            self.weight = self.weight.sample(weight_shape, return_array=True)
-
-        if n_input_features != self.weight.shape[0]:
-            raise ValueError(
-                "Invalid number of features. Expected {}, got {}"
-                "".format(self.weight.shape[0], n_input_features))
-
+        X = format_data(X, make_float=False)
+        self.init_weight(n_input_features=X.shape[1])
         super(Oja, self).train(X, epochs=epochs)
 
+    def partial_fit(self, X):
+        """
+        Makes one pass over the data and updates weights after
+        each mini-batch.
+
+        Parameters
+        ----------
+        X : array-like, iterator or generator
+            Input data. In case if input is an iterator or generator,
+            each yielded value will be treated as a separate chunk
+            of the data.
+
+        Returns
+        -------
+        Oja
+            Network itself.
+        """
+        if inspect.isgenerator(X) or iter(X) is X:
+            for X_chunk in X:
+                self.partial_fit(X_chunk)
+            return self
+
+        X = format_data(X, make_float=False)
+        self.init_weight(n_input_features=X.shape[1])
+
+        for X_batch in iters.minibatches(X, self.batch_size):
+            self.one_training_update(X_batch)
+            self.n_updates_made += 1
+
+        return self
+
     def reconstruct(self, X):
         if not isinstance(self.weight, np.ndarray):
             raise NotTrained("Network hasn't been trained yet")
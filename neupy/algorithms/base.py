@@ -218,6 +218,61 @@ class BaseNetwork(BaseSkeleton):
             **figkwargs
         )
 
+    def training_batches(self, X_train, y_train, batch_size):
+        """
+        Creates iterator that produces training mini-batches
+        for one epoch.
+
+        Parameters
+        ----------
+        X_train : array-like
+        y_train : array-like or None
+
+        batch_size : int or None
+            Mini-batch size.
+
+        Returns
+        -------
+        iterable
+            Iterator that produces ``(X_batch, y_batch)`` pairs.
+        """
+        return iters.minibatches(
+            (X_train, y_train),
+            batch_size,
+            self.shuffle_data,
+        )
+
+    def train_epoch(self, iterator, epoch):
+        """
+        Applies training updates for each mini-batch
+        produced by the iterator.
+
+        Parameters
+        ----------
+        iterator : iterable
+            Iterator that produces ``(X_batch, y_batch)`` pairs.
+
+        epoch : int
+            Current epoch number.
+        """
+        for X_batch, y_batch in iterator:
+            self.events.trigger('update_start')
+            update_start_time = time.time()
+
+            train_error = self.one_training_update(X_batch, y_batch)
+            self.n_updates_made += 1
+
+            self.events.trigger(
+                name='train_error',
+                value=train_error,
+                eta=time.time() - update_start_time,
+                epoch=epoch,
+                n_updates=self.n_updates_made,
+                n_samples=iters.count_samples(X_batch),
+                store_data=True,
+            )
+            self.events.trigger('update_end')
+
     def train(self, X_train, y_train=None, X_test=None, y_test=None,
               epochs=100, batch_size=None):
         """
@@ -257,29 +312,10 @@ class BaseNetwork(BaseSkeleton):
                 self.events.trigger('epoch_start')
 
                 self.last_epoch = epoch
-                iterator = iters.minibatches(
-                    (X_train, y_train),
-                    batch_size,
-                    self.shuffle_data,
-                )
-
-                for X_batch, y_batch in iterator:
-                    self.events.trigger('update_start')
-                    update_start_time = time.time()
+                iterator = self.training_batches(
+                    X_train, y_train, batch_size)
 
-                    train_error = self.one_training_update(X_batch, y_batch)
-                    self.n_updates_made += 1
-
-                    self.events.trigger(
-                        name='train_error',
-                        value=train_error,
-                        eta=time.time() - update_start_time,
-                        epoch=epoch,
-                        n_updates=self.n_updates_made,
-                        n_samples=iters.count_samples(X_batch),
-                        store_data=True,
-                    )
-                    self.events.trigger('update_end')
+                self.train_epoch(iterator, epoch)
 
                 if X_test is not None:
                     test_start_time = time.time()
@@ -140,3 +140,163 @@ def randomized_pca(data, n_componets):
     eigenvectors = V / S[:, np.newaxis] * np.sqrt(n_samples)
 
     return eigenvectors, eigenvalues
+
+
+def iter_chunks(data, chunk_size):
+    """
+    Iterates over the data in chunks of rows. Each chunk will
+    be loaded into the memory separately.
+
+    Parameters
+    ----------
+    data : array-like or function
+        Data source that supports slicing over rows, for
+        instance ``np.memmap`` or HDF5 dataset. In addition, it can
+        be a function that returns new iterator over the chunks
+        every time it's been called, since some of the algorithms
+        require multiple passes over the data.
+
+    chunk_size : int
+        Maximum number of rows in each chunk. Ignored in case
+        if data was specified as a function.
+
+    Yields
+    ------
+    2D array
+    """
+    if callable(data):
+        for chunk in data():
+            yield np.atleast_2d(np.asarray(chunk, dtype=float))
+        return
+
+    n_samples = data.shape[0]
+
+    for start in range(0, n_samples, chunk_size):
+        chunk = data[start:start + chunk_size]
+        yield np.asarray(chunk, dtype=float)
+
+
+def chunked_mean_std(data, chunk_size):
+    """
+    Computes mean and standard deviation per each feature making
+    only one pass over the data.
+
+    Parameters
+    ----------
+    data : array-like or function
+        Check ``iter_chunks`` for more information.
+
+    chunk_size : int
+        Maximum number of rows loaded into the memory at once.
+
+    Returns
+    -------
+    (mean, std)
+    """
+    n_samples, mean, squared_diff = 0, 0, 0
+
+    for chunk in iter_chunks(data, chunk_size):
+        n_chunk_samples = chunk.shape[0]
+        chunk_mean = chunk.mean(axis=0)
+        chunk_squared_diff = ((chunk - chunk_mean) ** 2).sum(axis=0)
+
+        # Pairwise update that avoids catastrophic cancellation
+        # in case of the large number of samples
+        total = n_samples + n_chunk_samples
+        delta = chunk_mean - mean
+
+        mean = mean + delta * n_chunk_samples / total
+        squared_diff = (
+            squared_diff + chunk_squared_diff +
+            delta ** 2 * n_samples * n_chunk_samples / total)
+        n_samples = total
+
+    return mean, np.sqrt(squared_diff / n_samples)
+
+
+def chunked_randomized_pca(data, n_componets, chunk_size=1024,
+                           n_oversamples=10, n_iter=4,
+                           mean=0, std=1):
+    """
+    Randomized PCA for the data that doesn't fit into memory.
+    Algorithm makes ``n_iter + 1`` passes over the data and loads
+    only one chunk of rows at a time.
+
+    Parameters
+    ----------
+    data : array-like or function
+        Check ``iter_chunks`` for more information.
+
+    n_components : int
+        Number of PCA components
+
+    chunk_size : int
+        Maximum number of rows loaded into the memory at once.
+        Defaults to ``1024``.
+
+    n_oversamples : int
+        Additional number of random vectors used to sample the
+        range of the data. Defaults to ``10``.
+
+    n_iter : int
+        Number of power iterations. Defaults to ``4``.
+
+    mean, std : array-like or float
+        Each chunk will be normalized with these values before
+        applying PCA. Defaults to ``0`` and ``1`` respectively.
+
+    Returns
+    -------
+    (eigenvectors, eigenvalues)
+    """
+    n_random = n_componets + n_oversamples
+    Q = None
+
+    # Each power iteration multiplies random basis by the A.T * A
+    # matrix. Product accumulated over chunks and range is
+    # recovered from the small matrix with QR decomposition.
+    for i in range(n_iter):
+        AtAQ = 0
+
+        for chunk in iter_chunks(data, chunk_size):
+            chunk = (chunk - mean) / std
+
+            if Q is None:
+                n_random = min(n_random, chunk.shape[1])
+                Q = np.random.normal(size=(chunk.shape[1], n_random))
+
+            AtAQ += np.dot(chunk.T, np.dot(chunk, Q))
+
+        Q, _ = linalg.qr(AtAQ, mode='economic')
+
+    R = None
+    n_samples = 0
+
+    # Tall-skinny QR decomposition of the A * Q product. Matrix R
+    # has the same singular values and right singular vectors.
+    for chunk in iter_chunks(data, chunk_size):
+        chunk = (chunk - mean) / std
+        n_samples += chunk.shape[0]
+
+        if Q is None:
+            n_random = min(n_random, chunk.shape[1])
+            Q = linalg.qr(
+                np.random.normal(size=(chunk.shape[1], n_random)),
+                mode='economic')[0]
+
+        AQ = np.dot(chunk, Q)
+        stacked = AQ if R is None else np.concatenate([R, AQ], axis=0)
+        R = linalg.qr(stacked, mode='r')[0][:n_random]
+
+    _, S, W = linalg.svd(R, full_matrices=False)
+    V = np.dot(Q, W.T).T
+
+    # The same sign correction as in the ``svd_flip`` function
+    max_abs_rows = np.argmax(np.abs(V), axis=1)
+    V *= np.sign(V[range(V.shape[0]), max_abs_rows])[:, np.newaxis]
+
+    S, V = S[:n_componets], V[:n_componets]
+    eigenvalues = (S ** 2) / n_samples
+    eigenvectors = V / S[:, np.newaxis] * np.sqrt(n_samples)
+
+    return eigenvectors, eigenvalues
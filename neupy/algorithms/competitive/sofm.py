@@ -14,7 +14,8 @@ from neupy.algorithms.associative.base import BaseAssociative
 from neupy.core.properties import (BaseProperty, TypedListProperty,
                                    ChoiceProperty, NumberProperty,
                                    ParameterProperty, IntProperty)
-from .randomized_pca import randomized_pca
+from .randomized_pca import (randomized_pca, chunked_randomized_pca,
+                             chunked_mean_std)
 from .neighbours import (find_step_scaler_on_rect_grid,
                          find_neighbours_on_rect_grid,
                          find_neighbours_on_hexagon_grid,
@@ -105,17 +106,27 @@ def sample_data(data, features_grid):
     return data[indices].T
 
 
-def linear_initialization(data, features_grid):
+def linear_initialization(data, features_grid, chunk_size=1024):
     """
     Linear weight initialization base on the randomized PCA.
 
     Parameters
     ----------
-    data : 2d array-like
+    data : 2d array-like or function
+        Data that fits into memory should be specified as numpy array.
+        All other array-like objects, for instance ``np.memmap``
+        or HDF5 dataset, will be processed in chunks without loading
+        the whole dataset into memory. Data can be also specified as
+        a function that returns new iterator over the data chunks
+        every time it's been called.
 
     features_grid : tuple
         Tuple that defines shape of the feature grid.
 
+    chunk_size : int
+        Number of rows loaded into memory at once when data
+        is processed in chunks. Defaults to ``1024``.
+
     Returns
     -------
     2d array-like
@@ -134,11 +145,28 @@ def linear_initialization(data, features_grid):
     maximum = np.max(coord, axis=0)
     coord = 2 * (coord / maximum - 0.5)
 
-    data_mean = np.mean(data, axis=0)
-    data_std = np.std(data, axis=0)
-    data = (data - data_mean) / data_std
+    if not callable(data) and not hasattr(data, 'shape'):
+        # Lists and other array-like objects don't support slicing
+        # over rows, which is required for the chunked processing
+        data = np.asarray(data)
+
+    is_in_memory = (
+        isinstance(data, np.ndarray) and
+        not isinstance(data, np.memmap)
+    )
+
+    if is_in_memory:
+        data_mean = np.mean(data, axis=0)
+        data_std = np.std(data, axis=0)
+        data = (data - data_mean) / data_std
+
+        eigenvectors, eigenvalues = randomized_pca(data, n_pca_components)
 
-    eigenvectors, eigenvalues = randomized_pca(data, n_pca_components)
+    else:
+        data_mean, data_std = chunked_mean_std(data, chunk_size)
+        eigenvectors, eigenvalues = chunked_randomized_pca(
+            data, n_pca_components, chunk_size=chunk_size,
+            mean=data_mean, std=data_std)
 
     norms = np.sqrt(np.einsum('ij,ij->i', eigenvectors, eigenvectors))
     eigenvectors = ((eigenvectors.T / norms) * eigenvalues).T
@@ -298,7 +326,9 @@ class SOFM(Kohonen):
         - ``init_pca`` - Before training starts SOFM will applies PCA
           on a covariance matrix build from the training samples.
           Weights will be generated based on the two eigenvectors
-          associated with the largest eigenvalues.
+          associated with the largest eigenvalues. Data that is not
+          an in-memory numpy array, for instance ``np.memmap`` or
+          HDF5 dataset, will be processed in chunks.
 
         Defaults to :class:`Normal() <neupy.init.Normal>`.
 
@@ -317,7 +347,9 @@ class SOFM(Kohonen):
     init_weights(train_data)
         Initialized weights based on the input data. It works only
         for the `init_pca` and `sample_from_data` options. For other
-        cases it will throw an error.
+        cases it will throw an error. For the `init_pca` option data
+        can be also specified as a function that returns new
+        iterator over the data chunks every time it's been called.
 
     {BaseSkeleton.predict}
 
@@ -32,6 +32,16 @@ class Adadelta(GradientDescent):
 
     {GradientDescent.batch_size}
 
+    {GradientDescent.accumulate_steps}
+
+    {GradientDescent.loss_scale}
+
+    {GradientDescent.n_replicas}
+
+    {GradientDescent.n_threads}
+
+    {GradientDescent.bucket_by}
+
     {BaseOptimizer.regularizer}
 
     {BaseOptimizer.network}
@@ -81,5 +91,4 @@ class Adadelta(GradientDescent):
             epsilon=self.epsilon,
             learning_rate=self.step,
         )
-        self.functions.optimizer = optimizer
-        return [optimizer.minimize(self.variables.loss)]
+        return self.init_optimizer_updates(optimizer)
@@ -46,5 +46,4 @@ class Adagrad(GradientDescent):
         optimizer = tf.train.AdagradOptimizer(
             learning_rate=self.step,
         )
-        self.functions.optimizer = optimizer
-        return [optimizer.minimize(self.variables.loss)]
+        return self.init_optimizer_updates(optimizer)
@@ -3,7 +3,7 @@ import tensorflow as tf
 from neupy.core.properties import (
     ProperFractionProperty,
     ScalarVariableProperty,
-    NumberProperty,
+    NumberProperty, Property,
 )
 from .base import GradientDescent
 
@@ -11,6 +11,49 @@ from .base import GradientDescent
 __all__ = ('Adam',)
 
 
+class LazyAdamOptimizer(tf.train.AdamOptimizer):
+    """
+    Adam optimizer that updates moving averages and parameters only
+    for the rows that have non-zero gradients. Regular Adam optimizer
+    updates both moving averages for all of the rows, even when
+    gradient is sparse, for example, for the embedding layer.
+    """
+    def _apply_sparse(self, grad, var):
+        dtype = var.dtype.base_dtype
+        beta1_power, beta2_power = self._get_beta_accumulators()
+        beta1_power = tf.cast(beta1_power, dtype)
+        beta2_power = tf.cast(beta2_power, dtype)
+
+        beta1 = tf.cast(self._beta1_t, dtype)
+        beta2 = tf.cast(self._beta2_t, dtype)
+        epsilon = tf.cast(self._epsilon_t, dtype)
+        step = tf.cast(self._lr_t, dtype)
+        step = step * tf.sqrt(1 - beta2_power) / (1 - beta1_power)
+
+        m = self.get_slot(var, 'm')
+        v = self.get_slot(var, 'v')
+
+        m_rows = (
+            beta1 * tf.gather(m, grad.indices) +
+            (1 - beta1) * grad.values
+        )
+        v_rows = (
+            beta2 * tf.gather(v, grad.indices) +
+            (1 - beta2) * tf.square(grad.values)
+        )
+
+        m_update = tf.scatter_update(
+            m, grad.indices, m_rows, use_locking=self._use_locking)
+        v_update = tf.scatter_update(
+            v, grad.indices, v_rows, use_locking=self._use_locking)
+        var_update = tf.scatter_sub(
+            var, grad.indices,
+            step * m_rows / (tf.sqrt(v_rows) + epsilon),
+            use_locking=self._use_locking)
+
+        return tf.group(var_update, m_update, v_update)
+
+
 class Adam(GradientDescent):
     """
     Adam algorithm.
@@ -31,8 +74,26 @@ class Adam(GradientDescent):
     step : float
         Learning rate, defaults to ``0.001``.
 
+    lazy : bool
+        If ``True``, sparse gradients (for example, gradients for the
+        :layer:`Embedding` layer) will update moving averages and
+        parameters only for the rows that were used during the training
+        step. It makes each update much cheaper for the large embeddings,
+        but moving averages for the rest of the rows won't decay.
+        Defaults to ``False``.
+
     {GradientDescent.batch_size}
 
+    {GradientDescent.accumulate_steps}
+
+    {GradientDescent.loss_scale}
+
+    {GradientDescent.n_replicas}
+
+    {GradientDescent.n_threads}
+
+    {GradientDescent.bucket_by}
+
     {BaseOptimizer.regularizer}
 
     {BaseOptimizer.network}
@@ -78,13 +139,18 @@ class Adam(GradientDescent):
     beta1 = ProperFractionProperty(default=0.9)
     beta2 = ProperFractionProperty(default=0.999)
     epsilon = NumberProperty(default=1e-7, minval=0)
+    lazy = Property(default=False, expected_type=bool)
 
     def init_train_updates(self):
-        optimizer = tf.train.AdamOptimizer(
+        if self.lazy:
+            optimizer_class = LazyAdamOptimizer
+        else:
+            optimizer_class = tf.train.AdamOptimizer
+
+        optimizer = optimizer_class(
             beta1=self.beta1,
             beta2=self.beta2,
             epsilon=self.epsilon,
             learning_rate=self.step,
         )
-        self.functions.optimizer = optimizer
-        return [optimizer.minimize(self.variables.loss)]
+        return self.init_optimizer_updates(optimizer)
@@ -1,10 +1,10 @@
 import tensorflow as tf
 
-from neupy.utils import asfloat
+from neupy.utils import asfloat, get_float_type
 from neupy.core.properties import (
     ProperFractionProperty,
     ScalarVariableProperty,
-    NumberProperty,
+    NumberProperty, Property,
 )
 from .base import GradientDescent
 
@@ -12,6 +12,27 @@ from .base import GradientDescent
 __all__ = ('Adamax',)
 
 
+def deduplicate_indexed_slices(gradient):
+    """
+    Sums sparse gradient values that associated with
+    the same index.
+
+    Parameters
+    ----------
+    gradient : tf.IndexedSlices
+
+    Returns
+    -------
+    tuple
+        Summed values and unique indices.
+    """
+    unique_indices, positions = tf.unique(gradient.indices)
+    summed_values = tf.unsorted_segment_sum(
+        gradient.values, positions, tf.shape(unique_indices)[0])
+
+    return summed_values, unique_indices
+
+
 class Adamax(GradientDescent):
     """
     AdaMax algorithm.
@@ -32,8 +53,24 @@ class Adamax(GradientDescent):
     step : float
         Learning rate, defaults to ``0.002``.
 
+    lazy : bool
+        If ``True``, sparse gradients (for example, gradients for the
+        :layer:`Embedding` layer) will update moving averages and
+        parameters only for the rows that were used during the training
+        step. Defaults to ``False``.
+
     {GradientDescent.batch_size}
 
+    {GradientDescent.accumulate_steps}
+
+    {GradientDescent.loss_scale}
+
+    {GradientDescent.n_replicas}
+
+    {GradientDescent.n_threads}
+
+    {GradientDescent.bucket_by}
+
     {BaseOptimizer.regularizer}
 
     {BaseOptimizer.network}
@@ -79,12 +116,13 @@ class Adamax(GradientDescent):
     beta1 = ProperFractionProperty(default=0.9)
     beta2 = ProperFractionProperty(default=0.999)
     epsilon = NumberProperty(default=1e-7, minval=0)
+    lazy = Property(default=False, expected_type=bool)
 
     def init_functions(self):
         self.variables.iteration = tf.Variable(
             asfloat(1),
             name='iteration',
-            dtype=tf.float32,
+            dtype=get_float_type(),
         )
         super(Adamax, self).init_functions()
 
@@ -100,21 +138,28 @@ class Adamax(GradientDescent):
             if variable.trainable:
                 variables.append(variable)
 
-        gradients = tf.gradients(self.variables.loss, variables)
+        gradients = self.compute_gradients(variables)
+        gradients = self.accumulated_gradients(gradients, variables)
         scale = self.step / (1. - beta1 ** iteration)
 
         for parameter, gradient in zip(variables, gradients):
             prev_first_moment = tf.Variable(
-                tf.zeros(parameter.shape),
+                tf.zeros(parameter.shape, dtype=get_float_type()),
                 name="{}/prev-first-moment".format(parameter.op.name),
-                dtype=tf.float32,
+                dtype=get_float_type(),
             )
             prev_weighted_inf_norm = tf.Variable(
-                tf.zeros(parameter.shape),
+                tf.zeros(parameter.shape, dtype=get_float_type()),
                 name="{}/prev-weighted-inf-norm".format(parameter.op.name),
-                dtype=tf.float32,
+                dtype=get_float_type(),
             )
 
+            if self.lazy and isinstance(gradient, tf.IndexedSlices):
+                updates.extend(self.init_sparse_updates(
+                    parameter, gradient, scale,
+                    prev_first_moment, prev_weighted_inf_norm))
+                continue
+
             first_moment = beta1 * prev_first_moment + (1. - beta1) * gradient
             weighted_inf_norm = tf.maximum(
                 beta2 * prev_weighted_inf_norm,
@@ -130,5 +175,35 @@ class Adamax(GradientDescent):
                 (parameter, parameter - parameter_delta),
             ])
 
-        updates.append((iteration, iteration + 1))
+        # Sparse updates are not synchronized with other updates, so
+        # we need to make sure that they read iteration before update
+        with tf.control_dependencies([scale]):
+            updates.append((iteration, iteration + 1))
+
+        updates.extend(self.reset_gradient_buffers())
         return updates
+
+    def init_sparse_updates(self, parameter, gradient, scale,
+                            prev_first_moment, prev_weighted_inf_norm):
+        """
+        Updates only rows that have been used during the training step.
+        """
+        values, indices = deduplicate_indexed_slices(gradient)
+
+        first_moment = (
+            self.beta1 * tf.gather(prev_first_moment, indices) +
+            (1. - self.beta1) * values
+        )
+        weighted_inf_norm = tf.maximum(
+            self.beta2 * tf.gather(prev_weighted_inf_norm, indices),
+            tf.abs(values),
+        )
+        parameter_delta = (
+            scale * (first_moment / (weighted_inf_norm + self.epsilon)))
+
+        return [
+            tf.scatter_update(prev_first_moment, indices, first_moment),
+            tf.scatter_update(
+                prev_weighted_inf_norm, indices, weighted_inf_norm),
+            tf.scatter_sub(parameter, indices, parameter_delta),
+        ]
@@ -1,20 +1,23 @@
 from __future__ import division
 
 import time
+import threading
 
 import numpy as np
 import tensorflow as tf
+from six.moves import queue
 
 from neupy import layers
 from neupy.core.properties import (
     FunctionWithOptionsProperty,
     ScalarVariableProperty,
-    IntProperty, Property,
+    IntProperty, NumberProperty, Property,
 )
 from neupy.utils import (
-    AttributeKeyDict, format_data,
-    as_tuple, iters, tf_utils,
+    AttributeKeyDict, format_data, float_type,
+    as_tuple, asfloat, iters, tf_utils,
 )
+from neupy.utils.processing import float_type_scope
 from neupy.algorithms.gd import objectives
 from neupy.exceptions import InvalidConnection
 from neupy.algorithms.base import BaseNetwork
@@ -23,6 +26,62 @@ from neupy.algorithms.base import BaseNetwork
 __all__ = ('BaseOptimizer', 'GradientDescent')
 
 
+def scale_gradient(gradient, factor):
+    """
+    Multiplies gradient by the factor. Function works for the
+    dense and sparse (``tf.IndexedSlices``) gradients.
+    """
+    if isinstance(gradient, tf.IndexedSlices):
+        return tf.IndexedSlices(
+            gradient.values * factor,
+            gradient.indices,
+            gradient.dense_shape,
+        )
+
+    if gradient is not None:
+        return gradient * factor
+
+
+def cast_gradient(gradient, dtype):
+    """
+    Converts gradient to the specified type. Function works for the
+    dense and sparse (``tf.IndexedSlices``) gradients.
+    """
+    if isinstance(gradient, tf.IndexedSlices):
+        return tf.IndexedSlices(
+            tf.cast(gradient.values, dtype),
+            gradient.indices,
+            gradient.dense_shape,
+        )
+
+    if gradient is not None:
+        return tf.cast(gradient, dtype)
+
+
+def sum_gradients(gradients):
+    """
+    Sums gradients computed for the same parameter. Sparse gradients
+    remain sparse in case if all of the gradients are sparse.
+    Function returns ``None`` when all gradients are equal to ``None``.
+    """
+    gradients = [gradient for gradient in gradients if gradient is not None]
+
+    if not gradients:
+        return None
+
+    if len(gradients) == 1:
+        return gradients[0]
+
+    if all(isinstance(grad, tf.IndexedSlices) for grad in gradients):
+        return tf.IndexedSlices(
+            tf.concat([grad.values for grad in gradients], axis=0),
+            tf.concat([grad.indices for grad in gradients], axis=0),
+            gradients[0].dense_shape,
+        )
+
+    return tf.add_n([tf.convert_to_tensor(grad) for grad in gradients])
+
+
 class BaseOptimizer(BaseNetwork):
     """
     Gradient descent algorithm.
@@ -123,6 +182,9 @@ class BaseOptimizer(BaseNetwork):
             network = layers.join(*network)
 
         self.network = network
+        # Optimizer uses float type of the network for its variables
+        # and operations, even if active float type is different
+        self.float_type = network.float_type
 
         if len(self.network.output_layers) != 1:
             n_outputs = len(network.output_layers)
@@ -131,27 +193,29 @@ class BaseOptimizer(BaseNetwork):
                 "Connection should have one output "
                 "layer, got {}".format(n_outputs))
 
-        target = options.get('target')
-        if target is not None and isinstance(target, (list, tuple)):
-            options['target'] = tf.placeholder(tf.float32, shape=target)
+        with float_type(self.float_type):
+            target = options.get('target')
+            if target is not None and isinstance(target, (list, tuple)):
+                options['target'] = tf.placeholder(
+                    self.float_type, shape=target)
 
-        self.target = self.network.targets
-        super(BaseOptimizer, self).__init__(**options)
+            self.target = self.network.targets
+            super(BaseOptimizer, self).__init__(**options)
 
-        start_init_time = time.time()
-        self.logs.message(
-            "TENSORFLOW",
-            "Initializing Tensorflow variables and functions.")
+            start_init_time = time.time()
+            self.logs.message(
+                "TENSORFLOW",
+                "Initializing Tensorflow variables and functions.")
 
-        self.variables = AttributeKeyDict()
-        self.functions = AttributeKeyDict()
-        self.network.outputs
-        self.init_functions()
+            self.variables = AttributeKeyDict()
+            self.functions = AttributeKeyDict()
+            self.network.outputs
+            self.init_functions()
 
-        self.logs.message(
-            "TENSORFLOW",
-            "Initialization finished successfully. It took {:.2f} seconds"
-            "".format(time.time() - start_init_time))
+            self.logs.message(
+                "TENSORFLOW",
+                "Initialization finished successfully. It took {:.2f} "
+                "seconds".format(time.time() - start_init_time))
 
     def init_train_updates(self):
         raise NotImplementedError()
@@ -187,7 +251,9 @@ class BaseOptimizer(BaseNetwork):
                 ),
                 one_training_update=tf_utils.function(
                     inputs=as_tuple(self.network.inputs, self.target),
-                    outputs=loss,
+                    # Loss might be redefined during the
+                    # initialization of the training updates
+                    outputs=self.variables.loss,
                     updates=training_updates,
                     name='one-update-step'
                 ),
@@ -198,6 +264,7 @@ class BaseOptimizer(BaseNetwork):
                 ),
             )
 
+    @float_type_scope
     def format_input(self, X):
         X = as_tuple(X)
         X_formatted = []
@@ -221,6 +288,7 @@ class BaseOptimizer(BaseNetwork):
 
         return X_formatted
 
+    @float_type_scope
     def format_target(self, y):
         output_shape = tf.TensorShape(self.network.output_shape)
         is_feature1d = (output_shape.ndims == 2 and output_shape[1] == 1)
@@ -339,6 +407,54 @@ class GradientDescent(BaseOptimizer):
         samples will be propagated through the network at once.
         Defaults to ``128``.
 
+    accumulate_steps : int
+        Number of mini-batches per one update. Gradients will be summed
+        over ``accumulate_steps`` mini-batches and parameters will be
+        updated only once using average gradient. It's possible to use
+        it in order to train network with larger effective batch size
+        that doesn't fit into memory. Defaults to ``1``.
+
+    loss_scale : float
+        Loss will be multiplied by this value before computing gradients
+        and gradients will be divided by the same value before the
+        update. It prevents underflow of the small gradient values when
+        network uses ``float16`` type (see :func:`neupy.utils.float_type`).
+        Value has to be positive. Defaults to ``1``.
+
+        Optimizers that are based on the Tensorflow's optimizers
+        (:network:`GradientDescent`, :network:`Momentum`,
+        :network:`Adam`, :network:`RMSProp`, :network:`Adagrad` and
+        :network:`Adadelta`) keep ``float32`` master copy of the
+        ``float16`` parameters. Gradients get unscaled and applied to
+        the master copy and network uses master copy rounded to
+        the ``float16`` values.
+
+    n_replicas : int
+        Number of data-parallel replicas. Each mini-batch will be split
+        into ``n_replicas`` shards and gradients will be computed per
+        each shard in parallel. After that, gradients will be summed
+        and the same update will be applied to the parameters. Replicas
+        share parameters and run in the same session, which allows
+        to use more CPU cores when operations for one mini-batch are
+        too small to do it. Defaults to ``1``.
+
+    n_threads : int
+        Number of threads that apply training updates in parallel. Each
+        thread takes next available mini-batch and updates shared
+        parameters without locking (Hogwild). It's efficient when each
+        update changes only small fraction of the parameters, for
+        example, in networks with large embedding layers. Value
+        greater than ``1`` makes training non-deterministic and it
+        cannot be used with ``accumulate_steps``. Defaults to ``1``.
+
+    bucket_by : int or None
+        Index of the network's input that contains length of each
+        sequence. When specified, training samples will be sorted by
+        length and each mini-batch will contain sequences of similar
+        length, which reduces computations on the padding (see
+        :layer:`LSTM` and :layer:`GRU`). The ``None`` value disables
+        bucketing. Defaults to ``None``.
+
     {BaseOptimizer.Parameters}
 
     Attributes
@@ -363,17 +479,292 @@ class GradientDescent(BaseOptimizer):
     >>> optimizer.train(x_train, y_train)
     """
     batch_size = IntProperty(default=128, minval=0, allow_none=True)
+    accumulate_steps = IntProperty(default=1, minval=1)
+    loss_scale = NumberProperty(default=1, minval=0, exclude_minval=True)
+    n_replicas = IntProperty(default=1, minval=1)
+    n_threads = IntProperty(default=1, minval=1)
+    bucket_by = IntProperty(default=None, minval=0, allow_none=True)
+
+    def __init__(self, network, options=None, **kwargs):
+        super(GradientDescent, self).__init__(network, options, **kwargs)
+
+        if self.n_threads > 1 and self.accumulate_steps > 1:
+            raise ValueError(
+                "Gradient accumulation cannot be used in case if "
+                "training updates applied by multiple threads")
+
+    def init_functions(self):
+        self.variables.gradient_buffers = []
+        super(GradientDescent, self).init_functions()
+
+        if self.accumulate_steps > 1:
+            update_ops = tf.get_collection(tf.GraphKeys.UPDATE_OPS)
+            accumulation_updates = [
+                (buffer, buffer + gradient)
+                for buffer, gradient in self.variables.gradient_buffers
+            ]
+
+            with tf.name_scope('optimizer'):
+                self.functions.accumulate_gradients = tf_utils.function(
+                    inputs=as_tuple(self.network.inputs, self.target),
+                    outputs=self.variables.loss,
+                    updates=accumulation_updates + update_ops,
+                    name='accumulate-gradients'
+                )
+
+    def replicated_loss(self):
+        """
+        Splits input mini-batch into ``n_replicas`` shards and builds
+        separate copy of the loss per each shard. Copies don't depend
+        on each other, which means that tensorflow can run them in
+        parallel.
+
+        Returns
+        -------
+        list of Tensor
+            Loss per each shard. Each loss weighted by the fraction of
+            the samples in the shard, so that their sum is equal
+            to the loss for the whole mini-batch.
+        """
+        network_inputs = as_tuple(self.network.inputs)
+        n_samples = tf.shape(network_inputs[0])[0]
+        losses = []
+
+        for index in range(self.n_replicas):
+            with tf.name_scope('replica-{}'.format(index)):
+                start = (n_samples * index) // self.n_replicas
+                end = (n_samples * (index + 1)) // self.n_replicas
+
+                outputs = self.network.output(
+                    *[network_input[start:end] for network_input
+                      in network_inputs])
+
+                loss = self.loss(self.target[start:end], outputs)
+
+                if self.regularizer is not None:
+                    loss += self.regularizer(self.network)
+
+                weight = asfloat(end - start) / asfloat(n_samples)
+                # Shard can be empty when mini-batch has
+                # less samples than number of replicas
+                losses.append(
+                    tf.where(end > start, weight * loss, tf.zeros_like(loss)))
+
+        return losses
+
+    def compute_gradients(self, parameters, dtype=None):
+        """
+        Computes gradients of the loss with respect to the specified
+        parameters. Loss will be scaled by the ``loss_scale`` factor
+        and gradients will be unscaled. In case if ``n_replicas`` is
+        greater than ``1``, gradients computed per each replica
+        and summed.
+
+        Parameters
+        ----------
+        parameters : list of Tensorfow variable
+
+        dtype : tf.DType or None
+            Gradients will be converted to the specified type before
+            they get unscaled. The ``None`` value means that gradients
+            have the same type as parameters. Defaults to ``None``.
+
+        Returns
+        -------
+        list of Tensor
+            Gradients. Value will be equal to ``None`` in case if
+            parameter doesn't affect the loss.
+        """
+        loss_scale = asfloat(self.loss_scale)
+
+        if self.n_replicas == 1:
+            losses = [self.variables.loss]
+        else:
+            losses = self.replicated_loss()
+            # There is no need to propagate the whole mini-batch
+            # once again in order to compute training loss
+            self.variables.loss = tf.add_n(losses)
+
+        replica_gradients = []
+        for loss in losses:
+            if self.loss_scale != 1:
+                loss = loss * loss_scale
+            replica_gradients.append(tf.gradients(loss, parameters))
+
+        gradients = []
+        for parameter_gradients in zip(*replica_gradients):
+            gradient = sum_gradients(parameter_gradients)
+
+            if dtype is not None:
+                gradient = cast_gradient(gradient, dtype)
+
+            if self.loss_scale != 1:
+                gradient = scale_gradient(gradient, 1. / self.loss_scale)
+
+            gradients.append(gradient)
+
+        return gradients
+
+    def accumulated_gradients(self, gradients, parameters):
+        """
+        Adds gradients, accumulated over previous mini-batches, to the
+        gradients from the last mini-batch and returns their average.
+        Gradients will be returned without changes in case if
+        ``accumulate_steps`` is equal to ``1``.
+
+        Parameters
+        ----------
+        gradients : list of Tensor
+
+        parameters : list of Tensorfow variable
+
+        Returns
+        -------
+        list of Tensor
+        """
+        if self.accumulate_steps == 1:
+            return gradients
+
+        accumulated_gradients = []
+
+        with tf.name_scope('gradient-accumulation'):
+            for gradient, parameter in zip(gradients, parameters):
+                gradient = tf.convert_to_tensor(gradient)
+                buffer = tf.Variable(
+                    tf.zeros(parameter.shape, dtype=gradient.dtype),
+                    name="{}/accumulated-gradient".format(parameter.op.name),
+                    dtype=gradient.dtype,
+                    trainable=False,
+                )
+
+                self.variables.gradient_buffers.append((buffer, gradient))
+                accumulated_gradients.append(
+                    (buffer + gradient) / self.accumulate_steps)
+
+        return accumulated_gradients
+
+    def reset_gradient_buffers(self):
+        """
+        Returns updates that set all accumulated gradients to zero.
+        """
+        return [
+            (buffer, tf.zeros_like(buffer))
+            for buffer, _ in self.variables.gradient_buffers
+        ]
+
+    @property
+    def uses_master_weights(self):
+        return self.float_type == 'float16'
+
+    def master_weights_update(self, optimizer, gradients, parameters):
+        """
+        Applies gradients to the ``float32`` copies of the ``float16``
+        parameters and copies updated values back to the parameters.
+        Small updates accumulate in the copies, even when they are too
+        small to change ``float16`` value of the parameter.
+
+        Parameters
+        ----------
+        optimizer : tf.train.Optimizer
+
+        gradients : list of Tensor
+            Gradients with ``float32`` type.
+
+        parameters : list of Tensorfow variable
+
+        Returns
+        -------
+        Operation
+        """
+        master_parameters = []
+
+        with tf.name_scope('master-weights'):
+            for parameter in parameters:
+                master_parameters.append(tf.Variable(
+                    tf.cast(parameter.initialized_value(), tf.float32),
+                    name="{}/master".format(parameter.op.name),
+                    trainable=False,
+                ))
+
+        update = optimizer.apply_gradients(
+            zip(gradients, master_parameters))
+
+        with tf.control_dependencies([update]):
+            copies = [
+                parameter.assign(tf.cast(master_parameter, parameter.dtype))
+                for parameter, master_parameter
+                in zip(parameters, master_parameters)]
+
+        return tf.group(update, *copies)
+
+    def init_optimizer_updates(self, optimizer):
+        """
+        Returns updates for the tensorflow's optimizer. Gradients
+        will be accumulated over multiple mini-batches in case if
+        ``accumulate_steps`` is greater than ``1`` and scaled
+        according to the ``loss_scale`` parameter. Networks with
+        ``float16`` parameters get updated through the ``float32``
+        master copies of the parameters.
+
+        Parameters
+        ----------
+        optimizer : tf.train.Optimizer
+
+        Returns
+        -------
+        list
+        """
+        self.functions.optimizer = optimizer
+
+        is_default_update = (
+            self.accumulate_steps == 1 and
+            self.loss_scale == 1 and
+            self.n_replicas == 1 and
+            not self.uses_master_weights
+        )
+        if is_default_update:
+            return [optimizer.minimize(self.variables.loss)]
+
+        parameters = [
+            var for var in self.network.variables.values() if var.trainable]
+
+        # Gradients of the float16 parameters get unscaled and
+        # accumulated in float32, since they can underflow
+        gradient_type = tf.float32 if self.uses_master_weights else None
+        gradients = self.compute_gradients(parameters, gradient_type)
+
+        gradients, parameters = zip(*[
+            (gradient, parameter) for gradient, parameter
+            in zip(gradients, parameters)
+            if gradient is not None
+        ])
+        gradients = self.accumulated_gradients(gradients, parameters)
+
+        if self.uses_master_weights:
+            update = self.master_weights_update(
+                optimizer, gradients, parameters)
+        else:
+            update = optimizer.apply_gradients(zip(gradients, parameters))
+
+        # Buffers can be cleaned only after optimizer applied update
+        with tf.control_dependencies([update]):
+            resets = [
+                buffer.assign(value)
+                for buffer, value in self.reset_gradient_buffers()]
+
+        return [update] + resets
 
     def init_train_updates(self):
         optimizer = tf.train.GradientDescentOptimizer(
             learning_rate=self.step,
         )
-        self.functions.optimizer = optimizer
-        return [optimizer.minimize(self.variables.loss)]
+        return self.init_optimizer_updates(optimizer)
 
     def one_training_update(self, X_train, y_train):
         """
-        Train one epoch.
+        Train one epoch. In case if ``accumulate_steps`` is greater than
+        ``1``, parameters will be updated only after every
+        ``accumulate_steps`` mini-batches.
 
         Parameters
         ----------
@@ -388,9 +779,104 @@ class GradientDescent(BaseOptimizer):
         float
             Training error.
         """
+        if (self.n_updates_made + 1) % self.accumulate_steps != 0:
+            return self.functions.accumulate_gradients(
+                *as_tuple(X_train, y_train))
+
         return self.functions.one_training_update(
             *as_tuple(X_train, y_train))
 
+    def training_batches(self, X_train, y_train, batch_size):
+        if self.bucket_by is None:
+            return super(GradientDescent, self).training_batches(
+                X_train, y_train, batch_size)
+
+        return iters.bucket_minibatches(
+            (X_train, y_train),
+            lengths=as_tuple(X_train)[self.bucket_by],
+            batch_size=batch_size,
+            shuffle=self.shuffle_data,
+        )
+
+    def train_epoch(self, iterator, epoch):
+        if self.n_threads == 1:
+            return super(GradientDescent, self).train_epoch(iterator, epoch)
+
+        iterator_lock = threading.Lock()
+        stop_training = threading.Event()
+        results = queue.Queue()
+
+        def apply_updates():
+            try:
+                while not stop_training.is_set():
+                    with iterator_lock:
+                        batch = next(iterator, None)
+
+                    if batch is None:
+                        break
+
+                    X_batch, y_batch = batch
+                    update_start_time = time.time()
+                    # Session releases GIL, which means that updates
+                    # from different threads run in parallel
+                    train_error = self.functions.one_training_update(
+                        *as_tuple(X_batch, y_batch))
+
+                    results.put((
+                        train_error,
+                        time.time() - update_start_time,
+                        iters.count_samples(X_batch),
+                    ))
+
+            except Exception as exception:
+                results.put(exception)
+
+            finally:
+                results.put(None)
+
+        threads = [
+            threading.Thread(target=apply_updates)
+            for _ in range(self.n_threads)]
+
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        try:
+            n_finished_threads = 0
+
+            # Events are triggered only from the main thread
+            while n_finished_threads < self.n_threads:
+                result = results.get()
+
+                if result is None:
+                    n_finished_threads += 1
+                    continue
+
+                if isinstance(result, Exception):
+                    raise result
+
+                train_error, eta, n_samples = result
+                self.n_updates_made += 1
+
+                self.events.trigger('update_start')
+                self.events.trigger(
+                    name='train_error',
+                    value=train_error,
+                    eta=eta,
+                    epoch=epoch,
+                    n_updates=self.n_updates_made,
+                    n_samples=n_samples,
+                    store_data=True,
+                )
+                self.events.trigger('update_end')
+
+        finally:
+            stop_training.set()
+
+            for thread in threads:
+                thread.join()
+
     def score(self, X, y):
         """
         Check the prediction error for the specified input samples
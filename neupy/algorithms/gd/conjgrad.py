@@ -1,6 +1,9 @@
 import tensorflow as tf
 
-from neupy.utils import dot, function_name_scope, asfloat, make_single_vector
+from neupy.utils import (
+    dot, function_name_scope, asfloat,
+    make_single_vector, get_float_type,
+)
 from neupy.core.properties import (ChoiceProperty, NumberProperty,
                                    WithdrawProperty)
 from neupy.utils.tf_utils import setup_parameter_updates
@@ -153,19 +156,19 @@ class ConjugateGradient(WolfeLineSearchForStep, BaseOptimizer):
         n_parameters = self.network.n_parameters
         self.variables.update(
             prev_delta=tf.Variable(
-                tf.zeros([n_parameters]),
+                tf.zeros([n_parameters], dtype=get_float_type()),
                 name="conj-grad/prev-delta",
-                dtype=tf.float32,
+                dtype=get_float_type(),
             ),
             prev_gradient=tf.Variable(
-                tf.zeros([n_parameters]),
+                tf.zeros([n_parameters], dtype=get_float_type()),
                 name="conj-grad/prev-gradient",
-                dtype=tf.float32,
+                dtype=get_float_type(),
             ),
             iteration=tf.Variable(
                 asfloat(self.last_epoch),
                 name='conj-grad/current-iteration',
-                dtype=tf.float32
+                dtype=get_float_type()
             ),
         )
         super(ConjugateGradient, self).init_functions()
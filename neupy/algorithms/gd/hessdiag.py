@@ -2,20 +2,37 @@ from __future__ import division
 
 import tensorflow as tf
 
-from neupy.core.properties import ProperFractionProperty
-from neupy.utils import flatten, make_single_vector
+from neupy.core.properties import ProperFractionProperty, IntProperty
+from neupy.utils import (
+    asfloat, function_name_scope,
+    make_single_vector, get_float_type,
+)
 from neupy.utils.tf_utils import setup_parameter_updates
 
 from .base import BaseOptimizer
+from .hessian_free import hessian_vector_product
 
 
 __all__ = ('HessianDiagonal',)
 
 
+@function_name_scope
+def rademacher(shape):
+    """
+    Samples random values that equal to ``-1`` or ``1``
+    with the same probability.
+    """
+    samples = tf.random_uniform(shape, dtype=get_float_type())
+    return 2 * tf.floor(2 * samples) - 1
+
+
 class HessianDiagonal(BaseOptimizer):
     """
     Algorithm that uses calculates only diagonal values from the Hessian matrix
-    and uses it instead of the Hessian matrix.
+    and uses it instead of the Hessian matrix. Diagonal is estimated with
+    Hutchinson's method from the Hessian-vector products with random
+    Rademacher vectors, which costs about one additional backward pass
+    per probe vector, regardless of the number of layers.
 
     Parameters
     ----------
@@ -25,6 +42,19 @@ class HessianDiagonal(BaseOptimizer):
         produce huge number in hessian diagonal elements. This
         parameter control diagonal elements size. Defaults to ``1e-2``.
 
+    n_probes : int
+        Number of random vectors used per update in order to estimate
+        Hessian diagonal. Larger values reduce variance of the estimation.
+        Defaults to ``1``.
+
+    decay : float
+        Decay rate for the exponential moving average of the Hessian
+        diagonal estimations made during the previous updates.
+        The ``0`` value means that only the last estimation will be used.
+        Value need to be between ``0`` and ``1``, excluding ``1``, since
+        the ``1`` value makes bias correction impossible.
+        Defaults to ``0.9``.
+
     {BaseOptimizer.Parameters}
 
     Attributes
@@ -53,16 +83,50 @@ class HessianDiagonal(BaseOptimizer):
     - Method requires all training data during propagation, which means
       it cannot be trained with mini-batches.
 
+    References
+    ----------
+    [1] M.F. Hutchinson, A stochastic estimator of the trace of the
+        influence matrix for Laplacian smoothing splines, 1989.
+
+    [2] C. Bekas, E. Kokiopoulou, Y. Saad, An estimator for the diagonal
+        of a matrix, 2007.
+
     See Also
     --------
     :network:`BaseOptimizer` : BaseOptimizer algorithm.
     :network:`Hessian` : Newton's method.
     """
     min_eigval = ProperFractionProperty(default=1e-2)
+    n_probes = IntProperty(default=1, minval=1)
+    decay = ProperFractionProperty(default=0.9, exclude_maxval=True)
+
+    def init_functions(self):
+        n_parameters = self.network.n_parameters
+
+        with tf.name_scope('hessian-diagonal'):
+            self.variables.update(
+                hessian_diag=tf.Variable(
+                    tf.zeros([n_parameters], dtype=get_float_type()),
+                    name='hessian-diag',
+                    dtype=get_float_type(),
+                ),
+                iteration=tf.Variable(
+                    asfloat(0),
+                    name='iteration',
+                    dtype=get_float_type(),
+                ),
+            )
+
+        super(HessianDiagonal, self).init_functions()
 
     def init_train_updates(self):
         step = self.step
+        decay = asfloat(self.decay)
         inv_min_eigval = 1 / self.min_eigval
+
+        hessian_diag = self.variables.hessian_diag
+        iteration = self.variables.iteration + 1
+
         variables = self.network.variables
         parameters = [var for var in variables.values() if var.trainable]
         param_vector = make_single_vector(parameters)
@@ -70,23 +134,39 @@ class HessianDiagonal(BaseOptimizer):
         gradients = tf.gradients(self.variables.loss, parameters)
         full_gradient = make_single_vector(gradients)
 
-        second_derivatives = []
-        for parameter, gradient in zip(parameters, gradients):
-            second_derivative, = tf.gradients(gradient, parameter)
-            second_derivatives.append(flatten(second_derivative))
-
-        hessian_diag = tf.concat(second_derivatives, axis=0)
+        estimations = []
+        for _ in range(self.n_probes):
+            # Expected value of the v * (H * v) is equal to the
+            # diagonal of H, when v has Rademacher distribution
+            probe = rademacher(tf.shape(full_gradient))
+            hessian_probe = hessian_vector_product(
+                full_gradient, parameters, probe)
+            estimations.append(probe * hessian_probe)
+
+        new_hessian_diag = (
+            decay * hessian_diag +
+            (1 - decay) * tf.add_n(estimations) / self.n_probes
+        )
+        # Moving average starts from zeros and we need to correct
+        # for the bias during the first few iterations.
+        corrected_hessian_diag = new_hessian_diag / (1 - decay ** iteration)
 
         # it's easier to clip inverse hessian rather than the hessian,.
         inv_hessian_diag = tf.clip_by_value(
             # inverse for diagonal matrix easy to compute with
-            # elementwise inverse operation.
-            1 / hessian_diag,
-            -inv_min_eigval,
+            # elementwise inverse operation. Absolute value ensures
+            # that stochastic estimation won't change direction
+            # of the update.
+            1 / tf.abs(corrected_hessian_diag),
+            0,
             inv_min_eigval,
         )
         updates = setup_parameter_updates(
             parameters,
             param_vector - step * full_gradient * inv_hessian_diag
         )
+        updates.extend([
+            (hessian_diag, new_hessian_diag),
+            (self.variables.iteration, iteration),
+        ])
         return updates
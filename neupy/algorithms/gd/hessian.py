@@ -3,7 +3,7 @@ import tensorflow as tf
 from neupy.core.properties import BoundedProperty, WithdrawProperty
 from neupy.utils import (
     asfloat, flatten, function_name_scope,
-    make_single_vector,
+    make_single_vector, get_float_type,
 )
 from neupy.utils.tf_utils import setup_parameter_updates
 from .base import BaseOptimizer
@@ -44,7 +44,7 @@ def find_hessian_and_gradient(error_function, parameters):
         compute_gradient_per_value,
         [
             tf.constant(0, tf.int32),
-            tf.TensorArray(tf.float32, size=n_samples),
+            tf.TensorArray(get_float_type(), size=n_samples),
         ]
     )
 
@@ -127,8 +127,9 @@ class Hessian(BaseOptimizer):
         hessian_matrix, full_gradient = find_hessian_and_gradient(
             self.variables.loss, parameters
         )
+        identity = tf.eye(n_parameters, dtype=get_float_type())
         parameter_update = tf.matrix_solve(
-            hessian_matrix + penalty_const * tf.eye(n_parameters),
+            hessian_matrix + penalty_const * identity,
             tf.reshape(full_gradient, [-1, 1])
         )
         updated_parameters = param_vector - flatten(parameter_update)
@@ -0,0 +1,331 @@
+import numpy as np
+import tensorflow as tf
+
+from neupy.core.properties import (
+    BoundedProperty, ChoiceProperty, IntProperty,
+    ProperFractionProperty, WithdrawProperty,
+)
+from neupy.utils import (
+    asfloat, dot, tensorflow_session,
+    function_name_scope, make_single_vector, get_float_type,
+)
+from neupy.utils.tf_utils import setup_parameter_updates
+from .base import BaseOptimizer
+
+
+__all__ = ('HessianFree',)
+
+
+def flat_gradients(values, parameters, grad_ys=None):
+    """
+    Computes gradients and combines them into single vector. Parameters
+    that don't affect values get zero gradients.
+    """
+    gradients = tf.gradients(values, parameters, grad_ys=grad_ys)
+    return make_single_vector([
+        tf.zeros_like(parameter) if gradient is None else gradient
+        for parameter, gradient in zip(parameters, gradients)
+    ])
+
+
+@function_name_scope
+def hessian_vector_product(full_gradient, parameters, vector):
+    """
+    Computes product between Hessian matrix and vector without
+    building Hessian matrix explicitly (Pearlmutter's trick).
+
+    Parameters
+    ----------
+    full_gradient : Tensor
+        Gradient vector of the loss function with respect
+        to the ``parameters``.
+
+    parameters : list of Tensorfow variable
+
+    vector : Tensor
+        Vector that has the same size as the ``full_gradient``.
+
+    Returns
+    -------
+    Tensor
+    """
+    gradient_dot_vector = dot(full_gradient, tf.stop_gradient(vector))
+    return flat_gradients(gradient_dot_vector, parameters)
+
+
+@function_name_scope
+def gauss_newton_vector_product(loss, outputs, parameters, vector):
+    """
+    Computes product between Gauss-Newton matrix ``J.T * H * J`` and
+    vector, where ``J`` is the Jacobian of the network's outputs
+    and ``H`` is the Hessian of the loss with respect to the outputs.
+    Matrix is positive semi-definite for the convex losses.
+
+    Parameters
+    ----------
+    loss : Tensor
+
+    outputs : Tensor
+        Network's outputs.
+
+    parameters : list of Tensorfow variable
+
+    vector : Tensor
+        Vector that has the same size as the number of parameters.
+
+    Returns
+    -------
+    Tensor
+    """
+    # Forward-mode product J * v can be obtained from the two
+    # reverse-mode passes, since J.T * u is linear in u
+    dummy = tf.zeros_like(outputs)
+    jacobian_t_dummy = flat_gradients(outputs, parameters, grad_ys=dummy)
+    jacobian_vector, = tf.gradients(
+        jacobian_t_dummy, dummy, grad_ys=tf.stop_gradient(vector))
+
+    output_gradient, = tf.gradients(loss, outputs)
+    hessian_jacobian_vector, = tf.gradients(
+        output_gradient, outputs,
+        grad_ys=tf.stop_gradient(jacobian_vector))
+
+    return flat_gradients(
+        outputs, parameters, grad_ys=hessian_jacobian_vector)
+
+
+@function_name_scope
+def conjugate_gradient(matvec, b, x0, n_iterations, tolerance):
+    """
+    Truncated Conjugate Gradient method that solves ``A * x = b``
+    system using only matrix-vector products. Iterations stop after
+    reaching maximum number of iterations, when residual becomes
+    small or when direction with non-positive curvature was found.
+
+    Parameters
+    ----------
+    matvec : function
+        Function that computes product between matrix ``A``
+        and the input vector.
+
+    b : Tensor
+
+    x0 : Tensor
+        Initial guess for the solution.
+
+    n_iterations : int
+        Maximum number of iterations.
+
+    tolerance : float
+        Iterations stop when norm of the residual becomes smaller
+        than norm of the ``b`` multiplied by this value.
+
+    Returns
+    -------
+    Tensor
+        Approximate solution.
+    """
+    r0 = b - matvec(x0)
+    threshold = asfloat(tolerance ** 2) * dot(b, b)
+
+    def condition(i, x, r, p, rs, is_finished):
+        return tf.logical_and(
+            tf.logical_and(i < n_iterations, tf.logical_not(is_finished)),
+            rs > threshold,
+        )
+
+    def body(i, x, r, p, rs, is_finished):
+        Ap = matvec(p)
+        curvature = dot(p, Ap)
+        has_positive_curvature = curvature > 0
+
+        alpha = tf.where(
+            has_positive_curvature,
+            rs / tf.where(has_positive_curvature, curvature, 1.),
+            0.,
+        )
+        x = x + alpha * p
+        r = r - alpha * Ap
+
+        new_rs = dot(r, r)
+        p = r + (new_rs / rs) * p
+
+        return i + 1, x, r, p, new_rs, tf.logical_not(has_positive_curvature)
+
+    _, x, _, _, _, _ = tf.while_loop(
+        condition, body,
+        [tf.constant(0), x0, r0, r0, dot(r0, r0), tf.constant(False)],
+    )
+    return x
+
+
+class HessianFree(BaseOptimizer):
+    """
+    Hessian-free (truncated Newton) optimization. Every update solves
+    damped Newton system with Conjugate Gradient method. Method
+    never builds Hessian matrix explicitly. Instead, it uses products
+    between curvature matrix and vectors that cost about as much as
+    a few gradient computations. Memory requirements are linear in
+    the number of parameters.
+
+    Parameters
+    ----------
+    curvature : {{``gauss-newton``, ``hessian``}}
+        Defines curvature matrix that will be used in the Newton system.
+        Defaults to ``gauss-newton``.
+
+        - ``gauss-newton`` - Gauss-Newton matrix ``J.T * H * J``. It's
+          positive semi-definite for the convex losses (for example,
+          ``mse``) and usually more reliable for non-convex problems.
+
+        - ``hessian`` - Exact Hessian matrix of the loss function.
+
+    damping : float
+        Initial value for the Tikhonov damping that will be added
+        to the diagonal of the curvature matrix. Defaults to ``1``.
+
+    damping_update_factor : float
+        Factor to decrease the damping if error was reduced after last
+        update, otherwise increase damping by the same factor.
+        Defaults to ``1.5``.
+
+    n_cg_iterations : int
+        Maximum number of Conjugate Gradient iterations per one
+        update. Defaults to ``50``.
+
+    cg_tolerance : float
+        Conjugate Gradient stops when relative norm of the residual
+        becomes smaller than specified value. Defaults to ``1e-4``.
+
+    cg_init_decay : float
+        Conjugate Gradient starts from the previous solution scaled
+        by this value. The ``0`` value means that each update starts
+        from the zero vector. Defaults to ``0.95``.
+
+    {BaseOptimizer.network}
+
+    {BaseOptimizer.loss}
+
+    {BaseOptimizer.regularizer}
+
+    {BaseOptimizer.show_epoch}
+
+    {BaseOptimizer.shuffle_data}
+
+    {BaseOptimizer.signals}
+
+    {BaseOptimizer.verbose}
+
+    Attributes
+    ----------
+    {BaseOptimizer.Attributes}
+
+    Methods
+    -------
+    {BaseOptimizer.Methods}
+
+    Notes
+    -----
+    - Method requires all training data during propagation, which means
+      it cannot be trained with mini-batches.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from neupy import algorithms
+    >>> from neupy.layers import *
+    >>>
+    >>> x_train = np.array([[1, 2], [3, 4]])
+    >>> y_train = np.array([[1], [0]])
+    >>>
+    >>> network = Input(2) >> Sigmoid(3) >> Sigmoid(1)
+    >>> optimizer = algorithms.HessianFree(network)
+    >>> optimizer.train(x_train, y_train)
+
+    References
+    ----------
+    [1] James Martens, Deep learning via Hessian-free optimization, 2010.
+
+    See Also
+    --------
+    :network:`Hessian` : Newton's method.
+    """
+    curvature = ChoiceProperty(
+        default='gauss-newton',
+        choices=['gauss-newton', 'hessian'],
+    )
+    damping = BoundedProperty(default=1, minval=0)
+    damping_update_factor = BoundedProperty(default=1.5, minval=1)
+    n_cg_iterations = IntProperty(default=50, minval=1)
+    cg_tolerance = BoundedProperty(default=1e-4, minval=0)
+    cg_init_decay = ProperFractionProperty(default=0.95)
+    step = WithdrawProperty()
+
+    def init_functions(self):
+        n_parameters = self.network.n_parameters
+
+        with tf.name_scope('hessian-free'):
+            self.variables.update(
+                damping=tf.Variable(
+                    asfloat(self.damping), name='damping'),
+                last_error=tf.Variable(
+                    asfloat(np.nan), name='last-error'),
+                prev_solution=tf.Variable(
+                    tf.zeros([n_parameters], dtype=get_float_type()),
+                    name='prev-solution'),
+            )
+
+        super(HessianFree, self).init_functions()
+
+    def init_train_updates(self):
+        loss = self.variables.loss
+        damping = self.variables.damping
+        last_error = self.variables.last_error
+        prev_solution = self.variables.prev_solution
+
+        variables = self.network.variables
+        parameters = [var for var in variables.values() if var.trainable]
+        param_vector = make_single_vector(parameters)
+        full_gradient = flat_gradients(loss, parameters)
+
+        new_damping = tf.where(
+            tf.less(last_error, loss),
+            damping * self.damping_update_factor,
+            damping / self.damping_update_factor,
+        )
+
+        def damped_curvature_product(vector):
+            if self.curvature == 'hessian':
+                product = hessian_vector_product(
+                    full_gradient, parameters, vector)
+            else:
+                product = gauss_newton_vector_product(
+                    loss, self.network.outputs, parameters, vector)
+
+            return product + new_damping * vector
+
+        parameter_update = conjugate_gradient(
+            damped_curvature_product,
+            b=full_gradient,
+            x0=asfloat(self.cg_init_decay) * prev_solution,
+            n_iterations=self.n_cg_iterations,
+            tolerance=self.cg_tolerance,
+        )
+
+        updates = setup_parameter_updates(
+            parameters, param_vector - parameter_update)
+
+        with tf.control_dependencies([parameter_update]):
+            updates.extend([
+                damping.assign(new_damping),
+                prev_solution.assign(parameter_update),
+            ])
+
+        return updates
+
+    def one_training_update(self, X_train, y_train):
+        if self.errors.train:
+            last_error = self.errors.train[-1]
+            self.variables.last_error.load(last_error, tensorflow_session())
+
+        return super(HessianFree, self).one_training_update(
+            X_train, y_train)
@@ -2,11 +2,11 @@ import numpy as np
 import tensorflow as tf
 
 from neupy.utils import (
-    tensorflow_session, flatten,
+    asfloat, tensorflow_session, flatten, get_float_type,
     function_name_scope, make_single_vector,
 )
 from neupy.core.properties import (BoundedProperty, ChoiceProperty,
-                                   WithdrawProperty)
+                                   WithdrawProperty, IntProperty)
 from neupy.algorithms import BaseOptimizer
 from neupy.algorithms.gd import objectives
 from neupy.utils.tf_utils import setup_parameter_updates
@@ -45,13 +45,67 @@ def compute_jacobian(values, parameters):
         compute_gradient_per_value,
         [
             tf.constant(0, tf.int32),
-            tf.TensorArray(tf.float32, size=n_samples),
+            tf.TensorArray(get_float_type(), size=n_samples),
         ]
     )
 
     return jacobian.stack()
 
 
+@function_name_scope
+def compute_jtj_and_jte(values, parameters, block_size):
+    """
+    Compute ``J.T * J`` matrix and ``J.T * e`` vector, where ``J`` is
+    the Jacobian of the ``values`` and ``e`` is a column vector made
+    from the ``values``. Jacobian computed and accumulated in blocks
+    of rows, which means that the full Jacobian never stored
+    in memory.
+
+    Parameters
+    ----------
+    values : Tensorfow variable
+        Computed MSE for each sample separately.
+
+    parameters : list of Tensorfow variable
+        Neural network parameters (e.g. weights, biases).
+
+    block_size : int
+        Maximum number of Jacobian rows computed at once.
+
+    Returns
+    -------
+    tuple
+        Matrix with shape ``(n_parameters, n_parameters)`` and
+        vector with shape ``(n_parameters, 1)``.
+    """
+    n_values = tf.shape(values)[0]
+    n_parameters = sum(int(p.shape.num_elements()) for p in parameters)
+
+    def accumulate_block(start, jtj, jte):
+        end = tf.minimum(start + block_size, n_values)
+        block_values = values[start:end]
+
+        J = compute_jacobian(block_values, parameters)
+        J = tf.reshape(J, [-1, n_parameters])
+
+        jtj += tf.matmul(J, J, transpose_a=True)
+        jte += tf.matmul(J, tf.expand_dims(block_values, 1), transpose_a=True)
+
+        return end, jtj, jte
+
+    _, jtj, jte = tf.while_loop(
+        lambda start, jtj, jte: start < n_values,
+        accumulate_block,
+        [
+            tf.constant(0, tf.int32),
+            tf.zeros([n_parameters, n_parameters], dtype=get_float_type()),
+            tf.zeros([n_parameters, 1], dtype=get_float_type()),
+        ]
+    )
+
+    return jtj, jte
+
+
 class LevenbergMarquardt(BaseOptimizer):
     """
     Levenberg-Marquardt algorithm is a variation of the Newton's method.
@@ -60,13 +114,13 @@ class LevenbergMarquardt(BaseOptimizer):
 
     Notes
     -----
-    - Method requires all training data during propagation, which means
-      it cannot be trained with mini-batches.
-
     - Network minimizes only Mean Squared Error (MSE) loss function.
 
     - Efficient for small training datasets, because it
-      computes gradient per each sample separately.
+      computes gradient per each sample separately. Jacobian is
+      accumulated in blocks, so memory usage doesn't grow with the
+      number of samples. For the larger datasets it's possible to
+      use mini-batches.
 
     - Efficient for small-sized networks.
 
@@ -85,6 +139,16 @@ class LevenbergMarquardt(BaseOptimizer):
         Levenberg-Marquardt works only for quadratic functions.
         Defaults to ``mse``.
 
+    batch_size : int or None
+        Set up min-batch size. The ``None`` value will ensure that all data
+        samples will be propagated through the network at once.
+        Defaults to ``None``.
+
+    jacobian_block_size : int
+        Maximum number of the Jacobian rows computed and stored in memory
+        at once. Each sample in the mini-batch produces one row per
+        network's output. Defaults to ``128``.
+
     {BaseOptimizer.show_epoch}
 
     {BaseOptimizer.shuffle_data}
@@ -122,13 +186,17 @@ class LevenbergMarquardt(BaseOptimizer):
     mu_update_factor = BoundedProperty(default=1.2, minval=1)
     loss = ChoiceProperty(default='mse', choices={'mse': objectives.mse})
 
+    batch_size = IntProperty(default=None, minval=1, allow_none=True)
+    jacobian_block_size = IntProperty(default=128, minval=1)
+
     step = WithdrawProperty()
     regularizer = WithdrawProperty()
 
     def init_functions(self):
         self.variables.update(
-            mu=tf.Variable(self.mu, name='lev-marq/mu'),
-            last_error=tf.Variable(np.nan, name='lev-marq/last-error'),
+            mu=tf.Variable(asfloat(self.mu), name='lev-marq/mu'),
+            last_error=tf.Variable(
+                asfloat(np.nan), name='lev-marq/last-error'),
         )
         super(LevenbergMarquardt, self).init_functions()
 
@@ -150,14 +218,15 @@ class LevenbergMarquardt(BaseOptimizer):
         params = [var for var in variables.values() if var.trainable]
         param_vector = make_single_vector(params)
 
-        J = compute_jacobian(err_for_each_sample, params)
-        J_T = tf.transpose(J)
-        n_params = J.shape[1]
+        JTJ, JTe = compute_jtj_and_jte(
+            err_for_each_sample, params, self.jacobian_block_size)
+        n_params = int(JTJ.shape[0])
 
-        parameter_update = tf.matrix_solve(
-            tf.matmul(J_T, J) + new_mu * tf.eye(n_params.value),
-            tf.matmul(J_T, tf.expand_dims(err_for_each_sample, 1))
-        )
+        # Damped J.T * J matrix is symmetric and positive definite,
+        # so we can use Cholesky decomposition instead of LU.
+        identity = tf.eye(n_params, dtype=get_float_type())
+        cholesky = tf.cholesky(JTJ + new_mu * identity)
+        parameter_update = tf.cholesky_solve(cholesky, JTe)
         updated_params = param_vector - flatten(parameter_update)
 
         updates = [(mu, new_mu)]
@@ -56,5 +56,4 @@ class Momentum(GradientDescent):
             momentum=self.momentum,
             learning_rate=self.step,
         )
-        self.functions.optimizer = optimizer
-        return [optimizer.minimize(self.variables.loss)]
+        return self.init_optimizer_updates(optimizer)
@@ -0,0 +1,184 @@
+from __future__ import division
+
+import numpy as np
+import tensorflow as tf
+
+from neupy.utils import tf_utils
+from neupy.layers import Linear
+from neupy.pruning import magnitude_mask
+
+
+__all__ = ('MagnitudePruning',)
+
+
+class MagnitudePruning(object):
+    """
+    Training signal that sets to zero weights with the smallest
+    absolute values in the :layer:`Linear` layers (including layers
+    with activation functions). Pruned weights are defined by masks
+    and masks get applied after each training update, which means
+    that pruned weights stay equal to zero during the training.
+
+    Sparsity increases gradually from zero to the target value
+    between ``start_epoch`` and ``end_epoch`` according to the
+    polynomial schedule.
+
+    .. code-block:: python
+
+        progress = (epoch - start_epoch) / (end_epoch - start_epoch)
+        sparsity = target_sparsity * (1 - (1 - progress) ^ 3)
+
+    Sparsity increases faster at the beginning, when there are
+    many redundant weights, and slower at the end. Schedule with
+    ``start_epoch == end_epoch`` prunes network only once. Pruning
+    happens before the training updates of the epoch, which means
+    that remaining weights get fine-tuned after each pruning step.
+
+    Pruned network can be converted to the sparse format with the
+    :func:`sparsify <neupy.pruning.sparsify>` function, which
+    reduces memory usage and inference time for the networks
+    with high sparsity.
+
+    Parameters
+    ----------
+    sparsity : float
+        Fraction of the weights that has to be set to zero in each
+        layer by the end of the schedule. Value has to be between
+        ``0`` and ``1``.
+
+    start_epoch : int
+        Epoch when the first pruning step happens. Defaults to ``1``.
+
+    end_epoch : int or None
+        Epoch when network reaches target sparsity. The ``None``
+        value means that network will be pruned only once during the
+        ``start_epoch``. Defaults to ``None``.
+
+    frequency : int
+        Number of epochs between pruning steps. Defaults to ``1``.
+
+    layers : list of layers or None
+        Layers that have to be pruned. The ``None`` value means that
+        all :layer:`Linear` layers in the network will be pruned.
+        Defaults to ``None``.
+
+    Attributes
+    ----------
+    current_sparsity : float
+        Sparsity after the last pruning step.
+
+    Examples
+    --------
+    >>> from neupy import algorithms, storage, pruning
+    >>> from neupy.layers import *
+    >>>
+    >>> optimizer = algorithms.Adam(
+    ...     Input(784) >> Relu(500) >> Relu(300) >> Softmax(10),
+    ...     signals=algorithms.MagnitudePruning(
+    ...         sparsity=0.9,
+    ...         start_epoch=2,
+    ...         end_epoch=10,
+    ...     ),
+    ... )
+    >>> optimizer.train(x_train, y_train, epochs=15)
+    >>>
+    >>> data = storage.save_dict(optimizer.network)
+    >>> sparse_data = pruning.sparsify(data)
+    """
+    def __init__(self, sparsity, start_epoch=1, end_epoch=None,
+                 frequency=1, layers=None):
+        if end_epoch is None:
+            end_epoch = start_epoch
+
+        if not 0 <= sparsity < 1:
+            raise ValueError(
+                "Sparsity has to be a number between 0 and 1, got {}"
+                "".format(sparsity))
+
+        if start_epoch < 1 or end_epoch < start_epoch:
+            raise ValueError(
+                "Pruning has to start from the positive epoch and it "
+                "cannot end before it starts, got start_epoch={} and "
+                "end_epoch={}".format(start_epoch, end_epoch))
+
+        if frequency < 1:
+            raise ValueError(
+                "Frequency has to be a positive number, got {}"
+                "".format(frequency))
+
+        self.sparsity = sparsity
+        self.start_epoch = start_epoch
+        self.end_epoch = end_epoch
+        self.frequency = frequency
+        self.layers = layers
+
+        self.current_sparsity = 0.
+        self.masks = None
+
+    def target_sparsity(self, epoch):
+        """
+        Returns sparsity that network has to have during the
+        specified epoch.
+        """
+        if epoch < self.start_epoch:
+            return 0.
+
+        if epoch >= self.end_epoch:
+            return self.sparsity
+
+        # Sparsity changes only in the epochs when pruning happens
+        n_steps = (epoch - self.start_epoch) // self.frequency
+        step_epoch = self.start_epoch + n_steps * self.frequency
+
+        progress = (step_epoch - self.start_epoch) / (
+            self.end_epoch - self.start_epoch)
+
+        return self.sparsity * (1 - (1 - progress) ** 3)
+
+    def create_masks(self, network):
+        self.masks = []
+
+        for (layer, name), variable in network.variables.items():
+            if name != 'weight' or not isinstance(layer, Linear):
+                continue
+
+            if self.layers is not None and layer not in self.layers:
+                continue
+
+            mask = tf.Variable(
+                np.ones(variable.shape, dtype=variable.dtype.as_numpy_dtype),
+                name='pruning-mask/' + layer.name,
+                trainable=False,
+            )
+            self.masks.append((variable, mask))
+
+        tf_utils.initialize_uninitialized_variables(
+            [mask for _, mask in self.masks])
+
+        self.apply_masks = tf.group(*[
+            tf.assign(variable, variable * mask)
+            for variable, mask in self.masks])
+
+    def train_start(self, optimizer, **kwargs):
+        if self.masks is None:
+            self.create_masks(optimizer.network)
+
+    def epoch_start(self, optimizer):
+        sparsity = self.target_sparsity(optimizer.last_epoch + 1)
+
+        if sparsity <= self.current_sparsity:
+            return
+
+        session = tf_utils.tensorflow_session()
+        weights = session.run([variable for variable, _ in self.masks])
+
+        for weight, (_, mask) in zip(weights, self.masks):
+            pruning_mask = magnitude_mask(weight, sparsity)
+            mask.load(pruning_mask.astype(weight.dtype), session)
+
+        session.run(self.apply_masks)
+        self.current_sparsity = sparsity
+
+    def update_end(self, optimizer):
+        if self.current_sparsity > 0:
+            tf_utils.tensorflow_session().run(self.apply_masks)
@@ -1,3 +1,4 @@
+import numpy as np
 import tensorflow as tf
 
 from neupy.core.config import Configurable
@@ -6,15 +7,15 @@ from neupy.core.properties import (
     WithdrawProperty, IntProperty,
 )
 from neupy.utils.tf_utils import setup_parameter_updates
-from neupy.algorithms.minsearch.wolfe import line_search
+from neupy.algorithms.minsearch.wolfe import line_search, batch_line_search
 from neupy.utils import (
     asfloat, dot, outer, as_tuple,
-    function_name_scope, make_single_vector,
+    function_name_scope, make_single_vector, get_float_type,
 )
 from .base import BaseOptimizer
 
 
-__all__ = ('QuasiNewton',)
+__all__ = ('QuasiNewton', 'LBFGS')
 
 
 class WolfeLineSearchForStep(Configurable):
@@ -38,14 +39,48 @@ class WolfeLineSearchForStep(Configurable):
         Parameter for curvature condition rule. It's used during the line
         search that identifies optimal step size during the weight update
         stage. Defaults ``0.9``.
+
+    line_search : {{``wolfe``, ``batch``}}
+        Line search method. Defaults to ``wolfe``.
+
+        - ``wolfe`` - Finds step that satisfies strong Wolfe conditions.
+          Each iteration of the search requires sequential
+          propagation through the network.
+
+        - ``batch`` - Propagates all candidate steps through the
+          network in parallel and selects step with the smallest error
+          among steps that satisfy Armijo condition. Candidate steps
+          are equal to ``2, 1, 0.5, ...``. Only ``wolfe_c1`` parameter
+          is used with this method.
+
+    n_line_search_steps : int
+        Number of candidate steps for the ``batch`` line search.
+        Defaults to ``10``.
     """
     wolfe_maxiter = IntProperty(default=20, minval=0)
     wolfe_c1 = NumberProperty(default=1e-4, minval=0)
     wolfe_c2 = NumberProperty(default=0.9, minval=0)
 
-    def find_optimal_step(self, parameter_vector, parameter_update):
+    line_search = ChoiceProperty(default='wolfe', choices=['wolfe', 'batch'])
+    n_line_search_steps = IntProperty(default=10, minval=1)
+
+    def line_search_functions(self, parameter_vector, parameter_update):
+        """
+        Builds loss along the parameter update direction and its
+        derivative with respect to the step. Loss is computed from the
+        training outputs without regularization.
+
+        Returns
+        -------
+        tuple
+            Functions ``phi`` and ``derphi`` that take step, loss for
+            the zero step and its derivative. Function ``phi`` takes
+            vector of steps in case of the ``batch`` line search.
+        """
         network_inputs = as_tuple(self.network.inputs)
         layers_and_parameters = list(self.network.variables.items())
+        parameters = [
+            var for var in self.network.variables.values() if var.trainable]
 
         def prediction(step):
             step = asfloat(step)
@@ -66,7 +101,9 @@ class WolfeLineSearchForStep(Configurable):
                     setattr(layer, varname, updated_param_value)
                     start_pos = end_pos
 
-                output = self.network.output(*network_inputs, training=True)
+                # Cached outputs depend on the original parameters
+                output = self.network.build_output(
+                    *network_inputs, training=True)
 
             finally:
                 # Restore previous parameters
@@ -83,9 +120,40 @@ class WolfeLineSearchForStep(Configurable):
             gradient, = tf.gradients(error_func, step)
             return gradient
 
+        # Error and its derivative for the zero step can be computed
+        # from the network's outputs that has been already built. Loss
+        # used for the parameter update cannot be reused, since it
+        # includes regularization and it's computed in inference mode.
+        phi0 = self.loss(self.target, self.network.training_outputs)
+        gradients = tf.gradients(phi0, parameters)
+        derphi0 = dot(make_single_vector(gradients), parameter_update)
+
+        if self.line_search == 'batch':
+            def batch_phi(steps):
+                return tf.map_fn(
+                    phi, steps,
+                    parallel_iterations=self.n_line_search_steps,
+                    back_prop=False,
+                )
+
+            return batch_phi, None, phi0, derphi0
+
+        return phi, derphi, phi0, derphi0
+
+    def find_optimal_step(self, parameter_vector, parameter_update):
+        phi, derphi, phi0, derphi0 = self.line_search_functions(
+            parameter_vector, parameter_update)
+
+        if self.line_search == 'batch':
+            return batch_line_search(
+                phi,
+                steps=2. ** (1 - np.arange(self.n_line_search_steps)),
+                f0=phi0, f_deriv0=derphi0, c1=self.wolfe_c1)
+
         return line_search(
             phi, derphi, self.wolfe_maxiter,
-            self.wolfe_c1, self.wolfe_c2)
+            self.wolfe_c1, self.wolfe_c2,
+            f0=phi0, f_deriv0=derphi0)
 
 
 @function_name_scope
@@ -121,7 +189,7 @@ def bfgs(inv_H, delta_w, delta_grad, epsilon=1e-7):
     """
     n_parameters = int(inv_H.shape[0])
 
-    I = tf.eye(n_parameters)
+    I = tf.eye(n_parameters, dtype=get_float_type())
     rho = safe_reciprocal(dot(delta_grad, delta_w), epsilon)
 
     X = I - outer(delta_w, delta_grad) * rho
@@ -177,6 +245,80 @@ def sr1(inv_H, delta_w, delta_grad, epsilon=1e-7):
     )
 
 
+@function_name_scope
+def lbfgs_two_loop(gradient, delta_ws, delta_grads, h0_scale, epsilon=1e-7):
+    """
+    L-BFGS two-loop recursion. Computes product between inverse Hessian
+    approximation and gradient using only last few parameter and
+    gradient differences. Pairs that don't satisfy curvature condition,
+    including empty (zero) slots in the memory, are ignored.
+
+    Parameters
+    ----------
+    gradient : Tensor
+        Gradient vector.
+
+    delta_ws, delta_grads : Tensor
+        Matrices with shape ``(n_memory, n_parameters)``. Each row
+        stores parameter and gradient differences from one of
+        the previous iterations. The last row is the most recent one.
+
+    h0_scale : float
+        Scale of the initial inverse Hessian approximation that
+        will be used until first valid pair will be available.
+
+    epsilon : float
+        Minimum curvature ``dot(delta_w, delta_grad)`` required
+        in order to use pair in the recursion.
+
+    Returns
+    -------
+    Tensor
+    """
+    delta_ws = tf.convert_to_tensor(delta_ws)
+    delta_grads = tf.convert_to_tensor(delta_grads)
+    n_memory = int(delta_ws.shape[0])
+
+    curvatures = tf.reduce_sum(delta_ws * delta_grads, axis=1)
+    is_valid = tf.greater(curvatures, epsilon)
+    safe_curvatures = tf.where(is_valid, curvatures, tf.ones_like(curvatures))
+    rhos = tf.where(
+        is_valid,
+        tf.reciprocal(safe_curvatures),
+        tf.zeros_like(curvatures),
+    )
+
+    q = gradient
+    alphas = [None] * n_memory
+
+    for i in reversed(range(n_memory)):
+        alphas[i] = rhos[i] * dot(delta_ws[i], q)
+        q = q - alphas[i] * delta_grads[i]
+
+    valid_indices = tf.cast(tf.where(is_valid), tf.int32)
+
+    def scale_from_last_valid_pair():
+        last_valid_index = valid_indices[-1, 0]
+        last_delta_grad = delta_grads[last_valid_index]
+        return curvatures[last_valid_index] / dot(
+            last_delta_grad, last_delta_grad)
+
+    # Initial inverse Hessian approximation scaled
+    # with the most recent valid pair
+    gamma = tf.cond(
+        tf.greater(tf.size(valid_indices), 0),
+        scale_from_last_valid_pair,
+        lambda: tf.constant(asfloat(h0_scale)),
+    )
+    r = gamma * q
+
+    for i in range(n_memory):
+        beta = rhos[i] * dot(delta_grads[i], r)
+        r = r + (alphas[i] - beta) * delta_ws[i]
+
+    return r
+
+
 class QuasiNewton(WolfeLineSearchForStep, BaseOptimizer):
     """
     Quasi-Newton algorithm. Every iteration quasi-Network method approximates
@@ -283,24 +425,25 @@ class QuasiNewton(WolfeLineSearchForStep, BaseOptimizer):
             n_parameters = self.network.n_parameters
             self.variables.update(
                 inv_hessian=tf.Variable(
-                    asfloat(self.h0_scale) * tf.eye(n_parameters),
+                    asfloat(self.h0_scale) * tf.eye(
+                        n_parameters, dtype=get_float_type()),
                     name="inv-hessian",
-                    dtype=tf.float32,
+                    dtype=get_float_type(),
                 ),
                 prev_params=tf.Variable(
-                    tf.zeros([n_parameters]),
+                    tf.zeros([n_parameters], dtype=get_float_type()),
                     name="prev-params",
-                    dtype=tf.float32,
+                    dtype=get_float_type(),
                 ),
                 prev_full_gradient=tf.Variable(
-                    tf.zeros([n_parameters]),
+                    tf.zeros([n_parameters], dtype=get_float_type()),
                     name="prev-full-gradient",
-                    dtype=tf.float32,
+                    dtype=get_float_type(),
                 ),
                 iteration=tf.Variable(
                     asfloat(self.last_epoch),
                     name='current-iteration',
-                    dtype=tf.float32
+                    dtype=get_float_type()
                 ),
             )
 
@@ -349,3 +492,168 @@ class QuasiNewton(WolfeLineSearchForStep, BaseOptimizer):
             ])
 
         return updates
+
+
+class LBFGS(QuasiNewton):
+    """
+    Limited-memory BFGS algorithm. Instead of storing full inverse
+    Hessian matrix algorithm keeps only last ``n_memory`` parameter
+    and gradient differences and computes update direction with
+    two-loop recursion. Memory requirements are ``O(n_memory * N)``,
+    where N = number of parameters in the network.
+
+    Parameters
+    ----------
+    n_memory : int
+        Number of last parameter and gradient differences used for
+        the inverse Hessian approximation. Defaults to ``10``.
+
+    h0_scale : float
+        Scale of the initial inverse Hessian approximation that will be
+        used during the first iteration. Later iterations scale initial
+        approximation based on the most recent update. Defaults to ``1``.
+
+    epsilon : float
+        Pairs with curvature ``dot(delta_w, delta_grad)`` smaller than
+        specified value will be ignored. Defaults to ``1e-7``.
+
+    {WolfeLineSearchForStep.Parameters}
+
+    {BaseOptimizer.network}
+
+    {BaseOptimizer.loss}
+
+    {BaseOptimizer.show_epoch}
+
+    {BaseOptimizer.shuffle_data}
+
+    {BaseOptimizer.signals}
+
+    {BaseOptimizer.verbose}
+
+    {BaseOptimizer.regularizer}
+
+    Notes
+    -----
+    - Method requires all training data during propagation, which means
+      it cannot be trained with mini-batches.
+
+    Attributes
+    ----------
+    {BaseOptimizer.Attributes}
+
+    Methods
+    -------
+    {BaseOptimizer.Methods}
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from neupy import algorithms
+    >>> from neupy.layers import *
+    >>>
+    >>> x_train = np.array([[1, 2], [3, 4]])
+    >>> y_train = np.array([[1], [0]])
+    >>>
+    >>> optimizer = algorithms.LBFGS(
+    ...     Input(2) >> Sigmoid(3) >> Sigmoid(1),
+    ...     n_memory=5,
+    ... )
+    >>> optimizer.train(x_train, y_train, epochs=10)
+
+    References
+    ----------
+    [1] Jorge Nocedal, Stephen J. Wright, Numerical Optimization.
+        Chapter 7, Large-Scale Unconstrained Optimization, p. 176-180
+
+    See Also
+    --------
+    :network:`QuasiNewton` : Quasi-Newton algorithm.
+    """
+    n_memory = IntProperty(default=10, minval=1)
+    update_function = WithdrawProperty()
+
+    def init_variables(self):
+        with tf.name_scope('lbfgs'):
+            n_parameters = self.network.n_parameters
+            memory_shape = [self.n_memory, n_parameters]
+
+            self.variables.update(
+                delta_ws=tf.Variable(
+                    tf.zeros(memory_shape, dtype=get_float_type()),
+                    name="delta-params",
+                    dtype=get_float_type(),
+                ),
+                delta_grads=tf.Variable(
+                    tf.zeros(memory_shape, dtype=get_float_type()),
+                    name="delta-gradients",
+                    dtype=get_float_type(),
+                ),
+                prev_params=tf.Variable(
+                    tf.zeros([n_parameters], dtype=get_float_type()),
+                    name="prev-params",
+                    dtype=get_float_type(),
+                ),
+                prev_full_gradient=tf.Variable(
+                    tf.zeros([n_parameters], dtype=get_float_type()),
+                    name="prev-full-gradient",
+                    dtype=get_float_type(),
+                ),
+                iteration=tf.Variable(
+                    asfloat(self.last_epoch),
+                    name='current-iteration',
+                    dtype=get_float_type()
+                ),
+            )
+
+    def init_train_updates(self):
+        self.init_variables()
+
+        iteration = self.variables.iteration
+        delta_ws = self.variables.delta_ws
+        delta_grads = self.variables.delta_grads
+        prev_params = self.variables.prev_params
+        prev_full_gradient = self.variables.prev_full_gradient
+
+        variables = self.network.variables
+        params = [var for var in variables.values() if var.trainable]
+        param_vector = make_single_vector(params)
+
+        gradients = tf.gradients(self.variables.loss, params)
+        full_gradient = make_single_vector(gradients)
+
+        def push_to_memory(memory, value):
+            # Memory works as a ring buffer where the oldest
+            # value gets removed and the new one is added to the end.
+            shifted_memory = tf.concat(
+                [memory[1:], tf.expand_dims(value, 0)], axis=0)
+            return tf.where(tf.equal(iteration, 0), memory, shifted_memory)
+
+        new_delta_ws = push_to_memory(delta_ws, param_vector - prev_params)
+        new_delta_grads = push_to_memory(
+            delta_grads, full_gradient - prev_full_gradient)
+
+        param_delta = -lbfgs_two_loop(
+            full_gradient,
+            new_delta_ws,
+            new_delta_grads,
+            h0_scale=self.h0_scale,
+            epsilon=self.epsilon,
+        )
+        step = self.find_optimal_step(param_vector, param_delta)
+        updated_params = param_vector + step * param_delta
+        updates = setup_parameter_updates(params, updated_params)
+
+        required_variables = [
+            new_delta_ws, new_delta_grads, param_vector, full_gradient]
+
+        with tf.control_dependencies(required_variables):
+            updates.extend([
+                delta_ws.assign(new_delta_ws),
+                delta_grads.assign(new_delta_grads),
+                prev_params.assign(param_vector),
+                prev_full_gradient.assign(full_gradient),
+                iteration.assign(iteration + 1),
+            ])
+
+        return updates
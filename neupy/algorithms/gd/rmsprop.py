@@ -69,5 +69,4 @@ class RMSProp(GradientDescent):
             epsilon=self.epsilon,
             learning_rate=self.step,
         )
-        self.functions.optimizer = optimizer
-        return [optimizer.minimize(self.variables.loss)]
+        return self.init_optimizer_updates(optimizer)
@@ -1,7 +1,7 @@
 import tensorflow as tf
 import numpy as np
 
-from neupy.utils import tensorflow_session
+from neupy.utils import asfloat, get_float_type, tensorflow_session
 from neupy.core.properties import BoundedProperty, ProperFractionProperty
 from .base import BaseOptimizer
 
@@ -108,19 +108,19 @@ class RPROP(BaseOptimizer):
                     # step value.
                     tf.ones_like(parameter) * self.step,
                     name="steps",
-                    dtype=tf.float32,
+                    dtype=get_float_type(),
                 )
                 prev_delta = tf.Variable(
-                    tf.zeros(parameter.shape),
+                    tf.zeros(parameter.shape, dtype=get_float_type()),
                     name="prev-delta",
-                    dtype=tf.float32,
+                    dtype=get_float_type(),
                 )
                 # We collect only signs since it ensures numerical stability
                 # after multiplication when we deal with small numbers.
                 prev_gradient_sign = tf.Variable(
-                    tf.zeros(parameter.shape),
+                    tf.zeros(parameter.shape, dtype=get_float_type()),
                     name="prev-grad-sign",
-                    dtype=tf.float32,
+                    dtype=get_float_type(),
                 )
 
             updated_prev_delta = self.update_prev_delta(prev_delta)
@@ -236,9 +236,10 @@ class IRPROPPlus(RPROP):
     """
     def init_functions(self):
         self.variables.update(
-            last_error=tf.Variable(np.nan, name='irprop-plus/last-error'),
+            last_error=tf.Variable(
+                asfloat(np.nan), name='irprop-plus/last-error'),
             previous_error=tf.Variable(
-                np.nan, name='irprop-plus/previous-error'),
+                asfloat(np.nan), name='irprop-plus/previous-error'),
         )
         super(IRPROPPlus, self).init_functions()
 
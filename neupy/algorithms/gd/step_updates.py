@@ -1,6 +1,6 @@
 import tensorflow as tf
 
-from neupy.utils import asfloat, function_name_scope
+from neupy.utils import asfloat, function_name_scope, get_float_type
 
 
 __all__ = ('step_decay', 'exponential_decay', 'polynomial_decay')
@@ -9,12 +9,12 @@ __all__ = ('step_decay', 'exponential_decay', 'polynomial_decay')
 def init_variables(initial_value, iteration=0, name='step'):
     iteration = tf.Variable(
         asfloat(iteration),
-        dtype=tf.float32,
+        dtype=get_float_type(),
         name='iteration',
     )
     step = tf.Variable(
         asfloat(initial_value),
-        dtype=tf.float32,
+        dtype=get_float_type(),
         name=name,
     )
     return step, iteration
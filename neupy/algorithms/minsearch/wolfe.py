@@ -3,6 +3,7 @@ Main source code from Pylearn2 library:
 https://github.com/lisa-lab/pylearn2/blob/master/pylearn2/\
 optimization/linesearch.py
 """
+import numpy as np
 import tensorflow as tf
 
 from neupy.utils import asfloat
@@ -42,7 +43,8 @@ def sequential_and(*conditions):
     return tf.logical_and(first_condition, sequential_and(*other_conditions))
 
 
-def line_search(f, f_deriv, maxiter=20, c1=1e-4, c2=0.9):
+def line_search(f, f_deriv, maxiter=20, c1=1e-4, c2=0.9,
+                f0=None, f_deriv0=None):
     """
     Find ``x`` that satisfies strong Wolfe conditions.
     ``x > 0`` is assumed to be a descent direction.
@@ -64,6 +66,14 @@ def line_search(f, f_deriv, maxiter=20, c1=1e-4, c2=0.9):
     c2 : float
         Parameter for curvature condition rule. Defaults ``0.9``.
 
+    f0 : Tensor or None
+        Value of the ``f(0)``. It's possible to specify value that
+        was already computed in order to avoid extra evaluation.
+        Defaults to ``None``.
+
+    f_deriv0 : Tensor or None
+        Value of the ``f'(0)``. Defaults to ``None``.
+
     Returns
     -------
     Variable
@@ -158,8 +168,9 @@ def line_search(f, f_deriv, maxiter=20, c1=1e-4, c2=0.9):
     zero = tf.constant(asfloat(0))
 
     x0, x1 = zero, one
-    y0, y1 = f(x0), f(x1)
-    y_deriv_0 = f_deriv(x0)
+    y0 = f(x0) if f0 is None else f0
+    y1 = f(x1)
+    y_deriv_0 = f_deriv(x0) if f_deriv0 is None else f_deriv0
 
     outs = tf.while_loop(
         cond=lambda condition, *args: condition,
@@ -171,6 +182,56 @@ def line_search(f, f_deriv, maxiter=20, c1=1e-4, c2=0.9):
     return outs[-1]
 
 
+def batch_line_search(f_batch, steps, f0, f_deriv0, c1=1e-4):
+    """
+    Selects step that satisfies Armijo condition and has the smallest
+    function value. Function values for all candidate steps are
+    computed at once, which means that search doesn't require
+    sequential function evaluations.
+
+    Parameters
+    ----------
+    f_batch : callable f(steps)
+        Function that takes vector of steps and returns vector
+        with objective function value per each step.
+
+    steps : list or array-like
+        Candidate steps.
+
+    f0 : Tensor
+        Value of the ``f(0)``.
+
+    f_deriv0 : Tensor
+        Value of the ``f'(0)``.
+
+    c1 : float
+        Parameter for Armijo condition rule. Defaults ``1e-4``.
+
+    Returns
+    -------
+    Tensor
+        Selected step. In case if non of the steps satisfies Armijo
+        condition, the smallest step will be returned.
+    """
+    if not 0 < c1 < 1:
+        raise ValueError("c1 should be a float between 0 and 1")
+
+    steps = tf.constant(asfloat(steps))
+    y = f_batch(steps)
+
+    is_valid_step = sequential_and(
+        tf.logical_not(tf.is_nan(y)),
+        y <= f0 + asfloat(c1) * steps * f_deriv0,
+    )
+    valid_y = tf.where(is_valid_step, y, tf.fill(tf.shape(y), asfloat(np.inf)))
+
+    return tf.where(
+        tf.reduce_any(is_valid_step),
+        tf.gather(steps, tf.argmin(valid_y)),
+        tf.reduce_min(steps),
+    )
+
+
 def quadratic_minimizer(x_a, y_a, y_prime_a, x_b, y_b, bound_size_ratio=0.1):
     """
     Finds the minimizer for a quadratic polynomial that
@@ -2,9 +2,12 @@ import numpy as np
 import tensorflow as tf
 
 from neupy.core.config import DumpableObject
-from neupy.core.properties import IntProperty, ParameterProperty
+from neupy.core.properties import IntProperty, ParameterProperty, Property
 from neupy.algorithms.base import BaseNetwork
-from neupy.utils import asfloat, format_data, dot, iters, tf_utils
+from neupy.utils import (
+    asfloat, format_data, dot, iters,
+    tf_utils, get_float_type,
+)
 from neupy import init
 
 
@@ -13,8 +16,8 @@ __all__ = ('RBM',)
 
 def random_binomial(p):
     with tf.name_scope('random-binomial'):
-        samples = tf.random_uniform(tf.shape(p), dtype=tf.float32) <= p
-        return tf.cast(samples, tf.float32)
+        samples = tf.random_uniform(tf.shape(p), dtype=get_float_type()) <= p
+        return tf.cast(samples, get_float_type())
 
 
 def random_sample(data, n_samples):
@@ -63,6 +66,26 @@ class RBM(BaseNetwork, DumpableObject):
         you can find :ref:`here <init-methods>`.
         Defaults to :class:`Constant(value=0) <neupy.init.Constant>`.
 
+    n_gibbs_steps : int
+        Number of Gibbs sampling steps made during the negative phase
+        of the training. Value ``k`` makes training equivalent to the
+        CD-k or PCD-k algorithms. All steps are computed inside of the
+        Tensorflow graph. Defaults to ``1``.
+
+    persistent : bool
+        When value equal to ``True`` negative phase continues Markov
+        chain from the hidden samples stored after the previous
+        update (Persistent Contrastive Divergence, PCD). Otherwise,
+        chain starts from the hidden samples generated from the
+        training mini-batch (Contrastive Divergence, CD).
+        Defaults to ``True``.
+
+    n_corrupted_features : int
+        Number of randomly selected features flipped per each sample
+        during the pseudo-likelihood estimation in the ``score``
+        method. Larger values reduce variance of the estimation.
+        Value can't be larger than ``n_visible``. Defaults to ``1``.
+
     {BaseNetwork.Parameters}
 
     Methods
@@ -83,6 +106,14 @@ class RBM(BaseNetwork, DumpableObject):
 
     gibbs_sampling(visible_input, n_iter=1)
         Makes Gibbs sampling ``n`` times using visible input.
+        All iterations are computed with one Tensorflow call.
+
+    score(X)
+        Computes stochastic pseudo-likelihood of the input samples.
+
+    log_likelihood(X, n_chains=100, n_betas=1000)
+        Estimates average log-likelihood of the input samples using
+        Annealed Importance Sampling (AIS).
 
     {BaseSkeleton.fit}
 
@@ -126,6 +157,9 @@ class RBM(BaseNetwork, DumpableObject):
     [1] G. Hinton, A Practical Guide to Training Restricted
         Boltzmann Machines, 2010.
         http://www.cs.toronto.edu/~hinton/absps/guideTR.pdf
+
+    [2] R. Salakhutdinov, I. Murray, On the Quantitative Analysis
+        of Deep Belief Networks, 2008.
     """
     n_visible = IntProperty(minval=1)
     n_hidden = IntProperty(minval=1)
@@ -135,10 +169,21 @@ class RBM(BaseNetwork, DumpableObject):
     hidden_bias = ParameterProperty(default=init.Constant(value=0))
     visible_bias = ParameterProperty(default=init.Constant(value=0))
 
+    n_gibbs_steps = IntProperty(minval=1, default=1)
+    persistent = Property(default=True, expected_type=bool)
+    n_corrupted_features = IntProperty(minval=1, default=1)
+
     def __init__(self, n_visible, n_hidden, **options):
         options.update({'n_visible': n_visible, 'n_hidden': n_hidden})
         super(RBM, self).__init__(**options)
 
+        if self.n_corrupted_features > self.n_visible:
+            raise ValueError(
+                "Number of corrupted features can't be larger than "
+                "number of visible units. Got {}, expected value less "
+                "than or equal to {}".format(
+                    self.n_corrupted_features, self.n_visible))
+
         self.init_functions()
         self.init_methods()
 
@@ -163,47 +208,46 @@ class RBM(BaseNetwork, DumpableObject):
                 trainable=False,
             )
             self.h_samples = tf.Variable(
-                tf.zeros([self.batch_size, self.n_hidden]),
+                tf.zeros(
+                    [self.batch_size, self.n_hidden],
+                    dtype=get_float_type()),
                 name="hidden-samples",
-                dtype=tf.float32,
+                dtype=get_float_type(),
                 trainable=False,
             )
 
             self.network_input = tf.placeholder(
-                tf.float32,
+                get_float_type(),
                 (None, self.n_visible),
                 name="network-input",
             )
             self.network_hidden_input = tf.placeholder(
-                tf.float32,
+                get_float_type(),
                 (None, self.n_hidden),
                 name="network-hidden-input",
             )
+            self.n_gibbs_iter = tf.placeholder(
+                tf.int32,
+                shape=(),
+                name="n-gibbs-iterations",
+            )
 
     def init_methods(self):
-        def free_energy(visible_sample):
-            with tf.name_scope('free-energy'):
-                wx = tf.matmul(visible_sample, self.weight)
-                wx_b = wx + self.hidden_bias
-
-                visible_bias_term = dot(visible_sample, self.visible_bias)
-
-                # We can get infinity when wx_b is a relatively large number
-                # (maybe 100). Taking exponent makes it even larger and
-                # for with float32 it can convert it to infinity. But because
-                # number is so large we don't care about +1 value before taking
-                # logarithms and therefore we can just pick value as it is
-                # since our operation won't change anything.
-                hidden_terms = tf.where(
-                    # exp(30) is such a big number that +1 won't
-                    # make any difference in the outcome.
-                    tf.greater(wx_b, 30),
-                    wx_b,
-                    tf.log1p(tf.exp(wx_b)),
-                )
-
-                hidden_term = tf.reduce_sum(hidden_terms, axis=1)
-                return -(visible_bias_term + hidden_term)
+        def hidden_term(wx_b):
+            # We can get infinity when wx_b is a relatively large number
+            # (maybe 100). Taking exponent makes it even larger and
+            # for with float32 it can convert it to infinity. But because
+            # number is so large we don't care about +1 value before taking
+            # logarithms and therefore we can just pick value as it is
+            # since our operation won't change anything.
+            hidden_terms = tf.where(
+                # exp(30) is such a big number that +1 won't
+                # make any difference in the outcome.
+                tf.greater(wx_b, 30),
+                wx_b,
+                tf.log1p(tf.exp(wx_b)),
+            )
+            return tf.reduce_sum(hidden_terms, axis=-1)
 
         def visible_to_hidden(visible_sample):
             with tf.name_scope('visible-to-hidden'):
@@ -229,6 +273,22 @@ class RBM(BaseNetwork, DumpableObject):
                 visible_sample = random_binomial(visible_prob)
                 return visible_sample
 
+        def gibbs_chain(visible_sample, n_iter):
+            def gibbs_step(i, visible_sample):
+                hidden_sample = sample_hidden_from_visible(visible_sample)
+                return i + 1, sample_visible_from_hidden(hidden_sample)
+
+            with tf.name_scope('gibbs-chain'):
+                # Loop is defined inside of the graph in order to
+                # avoid data transfer between iterations
+                _, visible_sample = tf.while_loop(
+                    cond=lambda i, visible_sample: i < n_iter,
+                    body=gibbs_step,
+                    loop_vars=[tf.constant(0), visible_sample],
+                    back_prop=False,
+                )
+                return visible_sample
+
         network_input = self.network_input
         network_hidden_input = self.network_hidden_input
         input_shape = tf.shape(network_input)
@@ -252,7 +312,14 @@ class RBM(BaseNetwork, DumpableObject):
             h_pos = visible_to_hidden(v_pos)
 
         with tf.name_scope('negative-values'):
-            v_neg = sample_visible_from_hidden(h_samples)
+            if self.persistent:
+                h_start = h_samples
+            else:
+                h_start = random_binomial(p=h_pos)
+
+            v_neg = gibbs_chain(
+                sample_visible_from_hidden(h_start),
+                n_iter=self.n_gibbs_steps - 1)
             h_neg = visible_to_hidden(v_neg)
 
         with tf.name_scope('weight-update'):
@@ -268,50 +335,72 @@ class RBM(BaseNetwork, DumpableObject):
             v_bias_update = tf.reduce_mean(v_pos - v_neg, axis=0)
 
         with tf.name_scope('flipped-input-features'):
-            # Each row will have random feature marked with number 1
-            # Other values will be equal to 0
-            possible_feature_corruptions = tf.eye(self.n_visible)
-            corrupted_features = random_sample(
-                possible_feature_corruptions, n_samples)
-
             rounded_input = tf.round(network_input)
-            # If we scale input values from [0, 1] range to [-1, 1]
-            # than it will be easier to flip feature values with simple
-            # multiplication.
-            scaled_rounded_input = 2 * rounded_input - 1
-            scaled_flipped_rounded_input = (
-                # for corrupted_features we convert 0 to 1 and 1 to -1
-                # in this way after multiplication we will flip all
-                # signs where -1 in the transformed corrupted_features
-                (-2 * corrupted_features + 1) * scaled_rounded_input
+
+            # Each sample gets its own subset of randomly selected
+            # features (without replacement) that will be flipped.
+            # Selection doesn't require (n_visible x n_visible) matrix.
+            _, corrupted_indices = tf.nn.top_k(
+                tf.random_uniform(tf.shape(rounded_input)),
+                k=self.n_corrupted_features,
             )
-            # Scale it back to the [0, 1] range
-            flipped_rounded_input = (scaled_flipped_rounded_input + 1) / 2
+            sample_indices = tf.tile(
+                tf.expand_dims(tf.range(n_samples), axis=1),
+                [1, self.n_corrupted_features],
+            )
+            corrupted_values = tf.gather_nd(
+                rounded_input,
+                tf.stack([sample_indices, corrupted_indices], axis=-1),
+            )
+            # Flip from 0 to 1 adds row from the weight matrix
+            # and flip from 1 to 0 subtracts it.
+            flip_sign = 1 - 2 * corrupted_values
 
         with tf.name_scope('pseudo-likelihood-loss'):
+            wx_b = tf.matmul(rounded_input, weight) + h_bias
+            free_energy_input = -(
+                dot(rounded_input, v_bias) + hidden_term(wx_b))
+
+            # Free energy for the flipped inputs computed from the
+            # gathered rows of the weight matrix, instead of the
+            # separate forward pass for each of the flipped inputs.
+            flipped_wx_b = tf.expand_dims(wx_b, axis=1) + (
+                tf.expand_dims(flip_sign, axis=-1) *
+                tf.gather(weight, corrupted_indices))
+
+            flipped_visible_bias_term = (
+                tf.expand_dims(dot(rounded_input, v_bias), axis=1) +
+                flip_sign * tf.gather(v_bias, corrupted_indices))
+
+            free_energy_flipped = -(
+                flipped_visible_bias_term + hidden_term(flipped_wx_b))
+
             # Stochastic pseudo-likelihood
             error = tf.reduce_mean(
                 self.n_visible * tf.log_sigmoid(
-                    free_energy(flipped_rounded_input) -
-                    free_energy(rounded_input)
+                    free_energy_flipped -
+                    tf.expand_dims(free_energy_input, axis=1)
                 )
             )
 
         with tf.name_scope('gibbs-sampling'):
-            gibbs_sampling = sample_visible_from_hidden(
-                sample_hidden_from_visible(network_input))
+            gibbs_sampling = gibbs_chain(network_input, self.n_gibbs_iter)
+
+        updates = [
+            (weight, weight + step * weight_update),
+            (h_bias, h_bias + step * h_bias_update),
+            (v_bias, v_bias + step * v_bias_update),
+        ]
+
+        if self.persistent:
+            updates.append((h_samples, random_binomial(p=h_neg)))
 
         tf_utils.initialize_uninitialized_variables()
         self.weight_update_one_step = tf_utils.function(
             [network_input],
             error,
             name='rbm/train-epoch',
-            updates=[
-                (weight, weight + step * weight_update),
-                (h_bias, h_bias + step * h_bias_update),
-                (v_bias, v_bias + step * v_bias_update),
-                (h_samples, random_binomial(p=h_neg)),
-            ]
+            updates=updates,
         )
         self.score_func = tf_utils.function(
             [network_input],
@@ -328,8 +417,8 @@ class RBM(BaseNetwork, DumpableObject):
             hidden_to_visible(network_hidden_input),
             name='rbm/hidden-to-visible',
         )
-        self.gibbs_sampling_one_step = tf_utils.function(
-            [network_input],
+        self.gibbs_sampling_func = tf_utils.function(
+            [network_input, self.n_gibbs_iter],
             gibbs_sampling,
             name='rbm/gibbs-sampling',
         )
@@ -459,9 +548,87 @@ class RBM(BaseNetwork, DumpableObject):
         """
         is_input_feature1d = (self.n_visible == 1)
         visible_input = format_data(visible_input, is_input_feature1d)
+        return self.gibbs_sampling_func(visible_input, n_iter)
+
+    def log_likelihood(self, X, n_chains=100, n_betas=1000):
+        """
+        Estimates average log-likelihood of the input samples. The
+        partition function is approximated with Annealed Importance
+        Sampling (AIS). The base-rate model is an RBM without hidden
+        units, which visible biases were fitted to the input data.
+
+        Parameters
+        ----------
+        X : array-like
+            Values of the visible layer
+
+        n_chains : int
+            Number of independent AIS runs. Defaults to ``100``.
+
+        n_betas : int
+            Number of intermediate distributions between base-rate
+            model and RBM. The larger the value the more accurate
+            estimation is. Defaults to ``1000``.
+
+        Returns
+        -------
+        float
+            Estimated average log-likelihood.
+        """
+        X = format_data(X, is_feature1d=(self.n_visible == 1))
+        weight, h_bias, v_bias = tf_utils.tensorflow_eval(
+            [self.weight, self.hidden_bias, self.visible_bias])
+
+        weight, h_bias, v_bias = (
+            weight.astype(float), h_bias.astype(float), v_bias.astype(float))
+
+        def softplus(value):
+            return np.logaddexp(0, value)
+
+        def sigmoid(value):
+            return 1. / (1 + np.exp(-value))
+
+        def unnormalized_log_proba(visible, beta):
+            wx_b = np.dot(visible, weight) + h_bias
+            return (
+                (1 - beta) * np.dot(visible, base_v_bias) +
+                beta * np.dot(visible, v_bias) +
+                softplus(beta * wx_b).sum(axis=1)
+            )
+
+        data_mean = np.clip(X.mean(axis=0), 1e-3, 1 - 1e-3)
+        base_v_bias = np.log(data_mean / (1 - data_mean))
+
+        # Hidden units are disconnected in the base-rate model,
+        # and each of them doubles its partition function
+        base_log_partition = (
+            softplus(base_v_bias).sum() + self.n_hidden * np.log(2))
+
+        visible = np.random.random((n_chains, self.n_visible)) < data_mean
+        visible = visible.astype(float)
+        log_weights = np.zeros(n_chains)
+        betas = np.linspace(0, 1, n_betas + 1)
+
+        for beta_prev, beta in zip(betas[:-1], betas[1:]):
+            log_weights += (
+                unnormalized_log_proba(visible, beta) -
+                unnormalized_log_proba(visible, beta_prev))
+
+            hidden_proba = sigmoid(beta * (np.dot(visible, weight) + h_bias))
+            hidden = (np.random.random(hidden_proba.shape) < hidden_proba)
+
+            visible_proba = sigmoid(
+                (1 - beta) * base_v_bias +
+                beta * (np.dot(hidden, weight.T) + v_bias))
+            visible = np.random.random(visible_proba.shape) < visible_proba
+            visible = visible.astype(float)
+
+        max_log_weight = log_weights.max()
+        log_partition = base_log_partition + max_log_weight + np.log(
+            np.mean(np.exp(log_weights - max_log_weight)))
 
-        input_ = visible_input
-        for iteration in range(n_iter):
-            input_ = self.gibbs_sampling_one_step(input_)
+        negative_free_energy = (
+            np.dot(X, v_bias) +
+            softplus(np.dot(X, weight) + h_bias).sum(axis=1))
 
-        return input_
+        return np.mean(negative_free_energy) - log_partition
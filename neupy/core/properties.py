@@ -254,21 +254,51 @@ class BoundedProperty(BaseProperty):
     maxval : float
         Maximum possible value for the property.
 
+    exclude_minval : bool
+        When value is equal to ``True`` than ``minval`` is not a valid
+        value for the property. Defaults to ``False``.
+
+    exclude_maxval : bool
+        When value is equal to ``True`` than ``maxval`` is not a valid
+        value for the property. Defaults to ``False``.
+
     {BaseProperty.Parameters}
     """
 
     def __init__(self, minval=-np.inf, maxval=np.inf, *args, **kwargs):
         self.minval = minval
         self.maxval = maxval
+        self.exclude_minval = kwargs.pop('exclude_minval', False)
+        self.exclude_maxval = kwargs.pop('exclude_maxval', False)
         super(BoundedProperty, self).__init__(*args, **kwargs)
 
     def validate(self, value):
         super(BoundedProperty, self).validate(value)
 
-        if not (self.minval <= value <= self.maxval):
+        excluded_values = []
+
+        if self.exclude_minval:
+            excluded_values.append(self.minval)
+
+        if self.exclude_maxval:
+            excluded_values.append(self.maxval)
+
+        is_valid = (
+            self.minval <= value <= self.maxval and
+            value not in excluded_values
+        )
+
+        if not is_valid:
+            excluded_message = ""
+
+            if excluded_values:
+                excluded_message = ", excluding {}".format(
+                    " and ".join(str(v) for v in excluded_values))
+
             raise ValueError(
-                "Value `{}` should be between {} and {}"
-                "".format(self.name, self.minval, self.maxval))
+                "Value `{}` should be between {} and {}{}"
+                "".format(self.name, self.minval, self.maxval,
+                          excluded_message))
 
 
 class ProperFractionProperty(BoundedProperty):
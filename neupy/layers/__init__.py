@@ -9,6 +9,7 @@ from .merge import *
 from .reshape import *
 from .embedding import *
 from .recurrent import *
+from .inference import *
 
 
 # Extra aliases for the layers
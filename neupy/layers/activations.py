@@ -2,7 +2,7 @@ import numpy as np
 import tensorflow as tf
 
 from neupy import init
-from neupy.utils import asfloat, as_tuple, tf_utils
+from neupy.utils import asfloat, as_tuple, tf_utils, get_float_type
 from neupy.exceptions import LayerConnectionError, WeightInitializationError
 from neupy.core.properties import (
     NumberProperty, TypedListProperty,
@@ -117,7 +117,7 @@ class Linear(BaseLayer):
                 shape=as_tuple(self.n_units))
 
     def output(self, input, **kwargs):
-        input = tf.convert_to_tensor(input, dtype=tf.float32)
+        input = tf.convert_to_tensor(input, dtype=get_float_type())
 
         if self.n_units is None:
             return self.activation_function(input)
@@ -568,7 +568,7 @@ class PRelu(Linear):
             shape=[output_shape[axis] for axis in self.alpha_axes])
 
     def activation_function(self, input):
-        input = tf.convert_to_tensor(input, dtype=tf.float32)
+        input = tf.convert_to_tensor(input, dtype=get_float_type())
         ndim = input.shape.ndims
 
         dimensions = np.arange(ndim)
@@ -13,6 +13,7 @@ import tensorflow as tf
 from neupy.exceptions import LayerConnectionError
 from neupy.core.properties import Property, TypedListProperty
 from neupy.utils import as_tuple, tf_utils
+from neupy.utils.processing import float_type_scope
 from neupy.layers.graph import BaseGraph, make_one_if_possible
 
 
@@ -113,8 +114,11 @@ class BaseLayer(BaseGraph):
 
         # This decorator ensures that result produced by the
         # `output` method will be marked under layer's name scope.
-        self.output = types.MethodType(
-            tf_utils.class_method_name_scope(self.output), self)
+        # Operations and variables use float type of the layer.
+        self.output = types.MethodType(float_type_scope(
+            tf_utils.class_method_name_scope(self.output)), self)
+        self.create_variables = types.MethodType(
+            float_type_scope(self.create_variables), self)
 
     @classmethod
     def define(cls, *args, **kwargs):
@@ -201,6 +205,7 @@ class BaseLayer(BaseGraph):
         # Input shape can change and it cannot be controlled from
         # the __init__ method
         copied_layer.input_shape = self.input_shape
+        copied_layer.float_type = self.float_type
 
         return copied_layer
 
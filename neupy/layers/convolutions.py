@@ -7,7 +7,7 @@ import six
 import tensorflow as tf
 
 from neupy import init
-from neupy.utils import as_tuple
+from neupy.utils import as_tuple, get_float_type
 from neupy.exceptions import LayerConnectionError
 from neupy.core.properties import (
     TypedListProperty, Property,
@@ -375,7 +375,7 @@ class Convolution(BaseLayer):
                 shape=as_tuple(n_filters))
 
     def output(self, input, **kwargs):
-        input = tf.convert_to_tensor(input, tf.float32)
+        input = tf.convert_to_tensor(input, get_float_type())
         self.fail_if_shape_invalid(input.shape)
         padding = self.padding
 
@@ -489,7 +489,7 @@ class Deconvolution(Convolution):
                 shape=as_tuple(n_filters))
 
     def output(self, input, **kwargs):
-        input = tf.convert_to_tensor(input, tf.float32)
+        input = tf.convert_to_tensor(input, get_float_type())
         # We need to get information about output shape from the input
         # tensor's shape, because for some inputs we might have
         # height and width specified as None and shape value won't be
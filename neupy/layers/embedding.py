@@ -1,7 +1,8 @@
+import numpy as np
 import tensorflow as tf
 
 from neupy import init
-from neupy.utils import as_tuple
+from neupy.utils import as_tuple, asfloat, get_float_type
 from neupy.core.properties import IntProperty, ParameterProperty
 from .base import BaseLayer
 
@@ -30,6 +31,19 @@ class Embedding(BaseLayer):
         you can find :ref:`here <init-methods>`.
         Defaults to :class:`HeNormal() <neupy.init.HeNormal>`.
 
+        In case if weight is a memory-mapped array (``numpy.memmap``),
+        table won't be loaded into memory and layer will read only
+        rows that are required for the output. Weights won't be
+        trainable in this case.
+
+    n_partitions : int
+        Number of variables that store rows of the weight matrix.
+        Each partition stores continuous block of rows. Partitioned
+        weights can be useful for the embeddings with very large
+        number of rows, since each partition can be initialized and
+        updated separately. Memory-mapped weight cannot be
+        partitioned. Defaults to ``1``.
+
     {BaseLayer.name}
 
     Methods
@@ -77,19 +91,42 @@ class Embedding(BaseLayer):
     ...     # To make output 2D we need to reshape dimensions
     ...     Reshape(),
     ... )
+
+    Embedding that reads rows from the table stored on disk
+
+    >>> table = np.load('embedding.npy', mmap_mode='r')
+    >>> embedding = Embedding(*table.shape, weight=table)
     """
     input_size = IntProperty(minval=1)
     output_size = IntProperty(minval=1)
     weight = ParameterProperty()
+    n_partitions = IntProperty(minval=1)
 
     def __init__(self, input_size, output_size,
-                 weight=init.HeNormal(), name=None):
+                 weight=init.HeNormal(), n_partitions=1, name=None):
 
         super(Embedding, self).__init__(name=name)
 
         self.input_size = input_size
         self.output_size = output_size
         self.weight = weight
+        self.n_partitions = n_partitions
+        self.weight_partitions = None
+
+        if self.n_partitions > self.input_size:
+            raise ValueError(
+                "Number of partitions cannot be greater than number "
+                "of rows in the embedding, got {} partitions and {} rows"
+                "".format(self.n_partitions, self.input_size))
+
+        if self.n_partitions != 1 and self.is_memmapped:
+            raise ValueError(
+                "Memory-mapped weight cannot be partitioned, got {} "
+                "partitions".format(self.n_partitions))
+
+    @property
+    def is_memmapped(self):
+        return isinstance(self.weight, np.memmap)
 
     def get_output_shape(self, input_shape):
         input_shape = tf.TensorShape(input_shape)
@@ -97,18 +134,88 @@ class Embedding(BaseLayer):
 
     def create_variables(self, input_shape):
         self.input_shape = input_shape
-        self.weight = self.variable(
-            value=self.weight, name='weight',
-            shape=as_tuple(self.input_size, self.output_size))
+        weight_shape = as_tuple(self.input_size, self.output_size)
+
+        if self.is_memmapped:
+            if self.weight.shape != weight_shape:
+                raise ValueError(
+                    "Memory-mapped weight has shape {}, expected shape {}"
+                    "".format(self.weight.shape, weight_shape))
+            return
+
+        if self.n_partitions == 1:
+            self.weight = self.variable(
+                value=self.weight, name='weight', shape=weight_shape)
+            return
+
+        weight = self.weight
+        if isinstance(weight, init.Initializer):
+            # Initializers depend on the shape of the whole matrix
+            weight = weight.sample(weight_shape)
+
+        # Rows split in the same way as ``div`` partition strategy
+        # expects, first partitions might get one extra row
+        partition_sizes = np.full(
+            self.n_partitions, self.input_size // self.n_partitions)
+        partition_sizes[:self.input_size % self.n_partitions] += 1
+        boundaries = np.concatenate([[0], np.cumsum(partition_sizes)])
+        self.weight_partitions = []
+
+        for index, (start, end) in enumerate(zip(boundaries, boundaries[1:])):
+            name = 'weight_part_{}'.format(index)
+            value = weight[start:end]
+
+            if isinstance(value, tf.Tensor):
+                # Slice of the sampled tensor has to be stored
+                # in the variable, otherwise it will be re-sampled
+                value = tf.Variable(asfloat(value), name='layer/{}/{}'.format(
+                    self.name, name.replace('_', '-')))
+
+            self.weight_partitions.append(self.variable(
+                value=value, name=name, shape=(end - start, self.output_size)))
+
+        self.weight = tf.concat(self.weight_partitions, axis=0)
+
+    def read_rows(self, indices):
+        """
+        Reads rows from the memory-mapped weight. Each
+        row will be read from the disk only once.
+        """
+        float_type = get_float_type()
+
+        def read_memmapped_rows(indices):
+            unique_indices, inverse = np.unique(indices, return_inverse=True)
+            rows = np.asarray(self.weight[unique_indices], dtype=float_type)
+            return rows[inverse].reshape(indices.shape + rows.shape[1:])
+
+        output = tf.py_func(
+            read_memmapped_rows, [indices], float_type, stateful=False)
+        output.set_shape(indices.shape.concatenate(self.output_size))
+        return output
 
     def output(self, input_value, **kwargs):
         input_value = tf.cast(input_value, tf.int32)
+
+        if self.is_memmapped:
+            return self.read_rows(input_value)
+
+        if self.weight_partitions is not None:
+            # Gradients will be sparse per each partition
+            return tf.nn.embedding_lookup(
+                self.weight_partitions, input_value,
+                partition_strategy='div')
+
         return tf.gather(self.weight, input_value)
 
     def __repr__(self):
+        kwargs = {}
+        if self.n_partitions != 1:
+            kwargs['n_partitions'] = self.n_partitions
+
         return self._repr_arguments(
             self.input_size,
             self.output_size,
             name=self.name,
             weight=self.weight,
+            **kwargs
         )
@@ -4,7 +4,7 @@ import tempfile
 from itertools import chain
 from functools import wraps
 from abc import abstractmethod
-from collections import OrderedDict
+from collections import OrderedDict, deque
 
 import six
 import graphviz
@@ -13,7 +13,7 @@ import tensorflow as tf
 
 from neupy.core.config import ConfigurableABC, DumpableObject
 from neupy.exceptions import LayerConnectionError
-from neupy.utils import as_tuple, tf_utils, iters
+from neupy.utils import as_tuple, tf_utils, iters, get_float_type
 
 
 __all__ = (
@@ -124,6 +124,10 @@ def topological_sort(graph):
     can be moved once all the nodes its edges point to, have been moved
     from the unsorted graph onto the sorted one.
 
+    Instead of doing actual passes over the graph, function finds pass
+    in which each node would be moved, which makes it linear in the
+    number of nodes and edges.
+
     Parameters
     ----------
     graph : dict
@@ -142,20 +146,97 @@ def topological_sort(graph):
     if not graph:
         return []
 
-    if is_cyclic(graph):
+    position = dict((node, index) for index, node in enumerate(graph))
+    dependent_nodes = dict((node, []) for node in graph)
+    n_unresolved_edges = {}
+
+    for node, edges in graph.items():
+        edges = [edge for edge in edges if edge in position]
+        n_unresolved_edges[node] = len(edges)
+
+        for edge in edges:
+            dependent_nodes[edge].append(node)
+
+    passes = dict((node, 0) for node in graph)
+    queue = deque(n for n in graph if n_unresolved_edges[n] == 0)
+    n_sorted_nodes = 0
+
+    while queue:
+        node = queue.popleft()
+        n_sorted_nodes += 1
+
+        for dependent_node in dependent_nodes[node]:
+            node_pass = passes[node]
+
+            # Dependent node that goes before the resolved node
+            # can be moved only during the next pass
+            if position[dependent_node] < position[node]:
+                node_pass += 1
+
+            passes[dependent_node] = max(passes[dependent_node], node_pass)
+            n_unresolved_edges[dependent_node] -= 1
+
+            if n_unresolved_edges[dependent_node] == 0:
+                queue.append(dependent_node)
+
+    if n_sorted_nodes != len(graph):
         raise RuntimeError(
             "Cannot apply topological sort to the graphs with cycles")
 
-    sorted_nodes = []
-    graph_unsorted = graph.copy()
+    return sorted(graph, key=lambda node: (passes[node], position[node]))
+
+
+def make_output_cache_key(inputs, kwargs):
+    """
+    Creates key that identifies symbolic output of the network
+    for the specified inputs and options.
+
+    Parameters
+    ----------
+    inputs : tuple
+        Inputs to the network.
+
+    kwargs : dict
+        Additional options that will be propagated to the layers.
+
+    Returns
+    -------
+    tuple or None
+        The ``None`` value means that output cannot be cached, for
+        example, when inputs are not tensorflow's tensors.
+    """
+    if not all(isinstance(v, (tf.Tensor, tf.Variable)) for v in inputs):
+        return None
 
-    while graph_unsorted:
-        for node, edges in list(graph_unsorted.items()):
-            if all(edge not in graph_unsorted for edge in edges):
-                del graph_unsorted[node]
-                sorted_nodes.append(node)
+    cache_key = (tuple(inputs), tuple(sorted(kwargs.items())))
 
-    return sorted_nodes
+    try:
+        hash(cache_key)
+    except TypeError:
+        return None
+
+    return cache_key
+
+
+def pass_through_the_layer(layer, method, *args, **kwargs):
+    layer_method = getattr(layer, method)
+
+    try:
+        return layer_method(*args, **kwargs)
+    except Exception as exception:
+        modified_exception = exception.__class__(
+            "{original_message}. Exception occurred while propagating "
+            "data through the method `{method}`. Layer: {layer!r}".format(
+                original_message=str(exception).strip('.'),
+                method=method, layer=layer
+            )
+        )
+
+        if hasattr(sys, 'last_traceback') and six.PY3:
+            modified_exception = modified_exception.with_traceback(
+                sys.last_traceback)
+
+        raise modified_exception
 
 
 def lazy_property(function):
@@ -176,6 +257,9 @@ class BaseGraph(ConfigurableABC, DumpableObject):
 
     def __init__(self, forward_graph=None):
         self.forward_graph = OrderedDict(forward_graph or [])
+        # Float type defined per network, which means that it
+        # doesn't change when active float type changes
+        self.float_type = get_float_type()
 
     @lazy_property
     def backward_graph(self):
@@ -203,7 +287,7 @@ class BaseGraph(ConfigurableABC, DumpableObject):
 
         for layer in self.input_layers:
             placeholder = tf.placeholder(
-                tf.float32,
+                self.float_type,
                 shape=tf_utils.shape_to_tuple(layer.input_shape),
                 name="placeholder/input/{}".format(layer.name),
             )
@@ -217,7 +301,7 @@ class BaseGraph(ConfigurableABC, DumpableObject):
 
         for layer in self.output_layers:
             placeholder = tf.placeholder(
-                tf.float32,
+                self.float_type,
                 shape=tf_utils.shape_to_tuple(layer.output_shape),
                 name="placeholder/target/{}".format(layer.name),
             )
@@ -295,6 +379,20 @@ class LayerGraph(BaseGraph):
     def __init__(self, forward_graph=None):
         super(LayerGraph, self).__init__(forward_graph)
 
+        float_types = set(layer.float_type for layer in self.forward_graph)
+
+        if len(float_types) > 1:
+            raise LayerConnectionError(
+                "Cannot connect layers that were created with different "
+                "float types: {}".format(', '.join(sorted(float_types))))
+
+        if float_types:
+            self.float_type = float_types.pop()
+
+        # Outputs are stored per inputs and options, which allows
+        # to reuse already built operations for the same inputs
+        self.output_cache = {}
+
         # This allows to run simple check that ensures that
         # created graph have defined layer shape
         self.output_shape
@@ -341,7 +439,7 @@ class LayerGraph(BaseGraph):
 
     @lazy_property
     def layers(self):
-        return list(self)
+        return topological_sort(self.backward_graph)
 
     def layer(self, layer_name):
         if not isinstance(layer_name, six.string_types):
@@ -377,19 +475,26 @@ class LayerGraph(BaseGraph):
 
     @lazy_property
     def output_shape(self):
-        return self.get_output_shape(*self.input_shapes)
+        output_shapes = self.output_shapes_per_layer
+        return make_one_if_possible(
+            [output_shapes[l] for l in self.output_layers])
 
     @lazy_property
     def output_shapes_per_layer(self):
+        # Shapes are never modified in-place, which means
+        # that there is no need to copy them
         return self.propagate_forward(
-            copy.deepcopy(self.input_shapes),
-            method='get_output_shape')
+            self.input_shapes, method='get_output_shape')
 
     def get_output_shape(self, *inputs):
-        outputs = self.propagate_forward(
-            copy.deepcopy(inputs),
-            method='get_output_shape',
-        )
+        input_shapes = tf_utils.shape_to_tuple(list(inputs))
+
+        if input_shapes == tf_utils.shape_to_tuple(self.input_shapes):
+            # Output shapes for the network's input shapes were
+            # computed before and they don't change for the graph
+            return self.output_shape
+
+        outputs = self.propagate_forward(inputs, method='get_output_shape')
         return make_one_if_possible(
             [outputs[l] for l in self.output_layers])
 
@@ -411,6 +516,24 @@ class LayerGraph(BaseGraph):
             layer.frozen = True
 
     def output(self, *inputs, **kwargs):
+        cache_key = make_output_cache_key(inputs, kwargs)
+
+        if cache_key is not None and cache_key in self.output_cache:
+            return self.output_cache[cache_key]
+
+        outputs = self.build_output(*inputs, **kwargs)
+
+        if cache_key is not None:
+            self.output_cache[cache_key] = outputs
+
+        return outputs
+
+    def build_output(self, *inputs, **kwargs):
+        """
+        Propagates inputs through the network. Unlike the ``output``
+        method, it always builds new operations, even if outputs for
+        the same inputs have been built before.
+        """
         self.create_variables()
         outputs = self.propagate_forward(inputs, method='output', **kwargs)
         return make_one_if_possible([outputs[l] for l in self.output_layers])
@@ -450,24 +573,7 @@ class LayerGraph(BaseGraph):
         return prepared_inputs
 
     def pass_through_the_layer(self, layer, method, *args, **kwargs):
-        layer_method = getattr(layer, method)
-
-        try:
-            return layer_method(*args, **kwargs)
-        except Exception as exception:
-            modified_exception = exception.__class__(
-                "{original_message}. Exception occurred while propagating "
-                "data through the method `{method}`. Layer: {layer!r}".format(
-                    original_message=str(exception).strip('.'),
-                    method=method, layer=layer
-                )
-            )
-
-            if hasattr(sys, 'last_traceback') and six.PY3:
-                modified_exception = modified_exception.with_traceback(
-                    sys.last_traceback)
-
-            raise modified_exception
+        return pass_through_the_layer(layer, method, *args, **kwargs)
 
     def propagate_forward(self, inputs, method, **kwargs):
         backward_graph = self.backward_graph
@@ -490,12 +596,12 @@ class LayerGraph(BaseGraph):
         self.create_variables()
 
         variables = OrderedDict()
-        observed_variables = []
+        observed_variables = set()
 
         for layer in self:
             for name, value in layer.variables.items():
                 if value not in observed_variables:
-                    observed_variables.append(value)
+                    observed_variables.add(value)
                     variables[(layer, name)] = value
 
         return variables
@@ -602,7 +708,7 @@ class LayerGraph(BaseGraph):
         return len(self.forward_graph)
 
     def __iter__(self):
-        for layer in topological_sort(self.backward_graph):
+        for layer in self.layers:
             yield layer
 
     def __repr__(self):
@@ -670,6 +776,118 @@ def validate_graphs_before_combining(left_graph, right_graph):
             )
 
 
+class GraphBuilder(object):
+    """
+    Combines layers and networks into single graph. Each network is
+    added in time that depends only on its own size, because output
+    shapes are propagated only through the new layers. Check for
+    cycles is required only when networks share layers, since
+    otherwise new connections can't create one.
+
+    Attributes
+    ----------
+    forward_graph : OrderedDict
+        Combined graph.
+
+    output_layers : list
+        Output layers of the combined graph.
+
+    output_shapes : dict
+        Output shape per each layer in the combined graph.
+    """
+    def __init__(self):
+        self.forward_graph = OrderedDict()
+        self.output_layers = []
+        self.output_shapes = {}
+
+    @property
+    def output_shape(self):
+        return make_one_if_possible(
+            [self.output_shapes[l] for l in self.output_layers])
+
+    def add(self, network, combine=False):
+        """
+        Adds network to the graph. When ``combine=True`` output layers
+        of the graph will be connected to the input layers of the
+        network.
+        """
+        forward_graph = self.forward_graph
+        left_output_layers = self.output_layers
+        right_input_layers = network.input_layers
+
+        if combine:
+            validate_graphs_before_combining(self, network)
+
+        has_shared_layers = any(
+            layer in forward_graph for layer in network.forward_graph)
+
+        if has_shared_layers:
+            # Used only for the error message
+            left_graph = self.build()
+
+        for key, values in network.forward_graph.items():
+            if key in forward_graph:
+                for value in values:
+                    if value not in forward_graph[key]:
+                        forward_graph[key].append(value)
+            else:
+                forward_graph[key] = copy.copy(values)
+
+        if combine:
+            for left_out_layer in left_output_layers:
+                for right_in_layer in right_input_layers:
+                    forward_graph[left_out_layer].append(right_in_layer)
+
+        if has_shared_layers:
+            if is_cyclic(forward_graph):
+                raise LayerConnectionError(
+                    "Cannot define connection between layers, because it "
+                    "creates cycle in the graph. Left graph: {}, Right "
+                    "graph: {}".format(left_graph, network))
+
+            # Shared layers can change shapes in the both networks
+            graph = self.build()
+            self.output_layers = graph.output_layers
+            self.output_shapes = graph.output_shapes_per_layer
+            return
+
+        is_connected = combine and left_output_layers and right_input_layers
+        backward_graph = network.backward_graph
+
+        for layer in topological_sort(backward_graph):
+            if layer not in right_input_layers:
+                input_shapes = [
+                    self.output_shapes[l] for l in backward_graph[layer]]
+
+            elif is_connected:
+                input_shapes = [
+                    self.output_shapes[l] for l in left_output_layers]
+
+            else:
+                input_shapes = [layer.input_shape]
+
+            self.output_shapes[layer] = pass_through_the_layer(
+                layer, 'get_output_shape', *input_shapes)
+
+        if not is_connected:
+            self.output_layers = left_output_layers + network.output_layers
+        else:
+            self.output_layers = list(network.output_layers)
+
+    def build(self):
+        forward_graph = OrderedDict()
+
+        for key, value in self.forward_graph.items():
+            # To make sure that we copied lists inside of the
+            # dictionary, but didn't copied values inside of the list
+            forward_graph[key] = copy.copy(value)
+
+        return LayerGraph(forward_graph)
+
+    def __repr__(self):
+        return repr(self.build())
+
+
 def merge(left_graph, right_graph, combine=False):
     """
     Merges two graphs into single one. When ``combine=False`` new
@@ -685,36 +903,10 @@ def merge(left_graph, right_graph, combine=False):
     combine : bool
         Defaults to ``False``.
     """
-    if combine:
-        validate_graphs_before_combining(left_graph, right_graph)
-
-    forward_graph = OrderedDict()
-
-    for key, value in left_graph.forward_graph.items():
-        # To make sure that we copied lists inside of the
-        # dictionary, but didn't copied values inside of the list
-        forward_graph[key] = copy.copy(value)
-
-    for key, values in right_graph.forward_graph.items():
-        if key in forward_graph:
-            for value in values:
-                if value not in forward_graph[key]:
-                    forward_graph[key].append(value)
-        else:
-            forward_graph[key] = copy.copy(values)
-
-    if combine:
-        for left_out_layer in left_graph.output_layers:
-            for right_in_layer in right_graph.input_layers:
-                forward_graph[left_out_layer].append(right_in_layer)
-
-    if is_cyclic(forward_graph):
-        raise LayerConnectionError(
-            "Cannot define connection between layers, because it creates "
-            "cycle in the graph. Left graph: {}, Right graph: {}"
-            "".format(left_graph, right_graph))
-
-    return LayerGraph(forward_graph)
+    builder = GraphBuilder()
+    builder.add(left_graph)
+    builder.add(right_graph, combine=combine)
+    return builder.build()
 
 
 def parallel(*networks):
@@ -756,14 +948,14 @@ def parallel(*networks):
     [(?, 28, 28, 1), (?, 28, 28, 1)] -> [... 4 layers ...] -> \
     [(?, 26, 26, 16), (?, 26, 26, 12)]
     """
-    graph = LayerGraph()
+    builder = GraphBuilder()
 
     for network in networks:
         if isinstance(network, (list, tuple)):
             network = join(*network)
-        graph = merge(graph, network)
+        builder.add(network)
 
-    return graph
+    return builder.build()
 
 
 def join(*networks):
@@ -791,18 +983,48 @@ def join(*networks):
     >>> network
     (?, 28, 28, 1) -> [... 7 layers ...] -> (?, 10)
     """
-    graph = LayerGraph()
+    builder = GraphBuilder()
 
     for network in networks:
-        graph = merge(graph, network, combine=True)
+        builder.add(network, combine=True)
+
+    return builder.build()
+
+
+def copy_network(network_or_layer):
+    """
+    Copies layer or all layers in the network and connects them in the
+    same way as the original layers. Copied layers share parameter
+    values (initializers, arrays and so on) with the original layers.
+    Layer never modifies its parameters in-place, since it replaces
+    them with variables, which means that every layer gets its own
+    variables once they've been created.
+
+    Parameters
+    ----------
+    network_or_layer : network or layer
+
+    Returns
+    -------
+    network or layer
+    """
+    if not isinstance(network_or_layer, LayerGraph):
+        return copy.copy(network_or_layer)
+
+    forward_graph = network_or_layer.forward_graph
+    copied_layers = dict((layer, copy.copy(layer)) for layer in forward_graph)
 
-    return graph
+    return LayerGraph(OrderedDict([
+        (copied_layers[layer], [copied_layers[l] for l in next_layers])
+        for layer, next_layers in forward_graph.items()
+    ]))
 
 
 def repeat(network_or_layer, n):
     """
     Function copies input `n - 1` times and connects everything in sequential
-    order.
+    order. Copies share parameter values with the input until they create
+    their own variables.
 
     Parameters
     ----------
@@ -840,5 +1062,5 @@ def repeat(network_or_layer, n):
             "shape is incompatible with the output shape. Input shape: {}, "
             "Output shape: {}".format(input_shape, output_shape))
 
-    new_networks = [copy.deepcopy(network_or_layer) for _ in range(n - 1)]
+    new_networks = [copy_network(network_or_layer) for _ in range(n - 1)]
     return join(network_or_layer, *new_networks)
@@ -0,0 +1,261 @@
+import copy
+from collections import OrderedDict
+
+import numpy as np
+import tensorflow as tf
+
+from neupy.utils import tf_utils
+from .graph import LayerGraph
+from .activations import Linear
+from .convolutions import Convolution, Deconvolution
+from .normalization import BatchNorm
+from .stochastic import Dropout, GaussianNoise, DropBlock
+
+
+__all__ = ('optimize_for_inference',)
+
+
+def is_foldable_layer(layer):
+    """
+    Checks whether batch normalization can be folded into the layer's
+    parameters. It's possible only for the layers that apply pure
+    linear transformation without activation function.
+    """
+    if isinstance(layer, Deconvolution):
+        return False
+
+    if isinstance(layer, Convolution):
+        return True
+
+    return (
+        isinstance(layer, Linear) and
+        layer.n_units is not None and
+        # Activation function has to be an identity
+        type(layer).activation_function is Linear.activation_function
+    )
+
+
+def parameter_values(layer, *names):
+    """
+    Returns values of the layer's parameters as arrays. Tensorflow
+    variables get evaluated in a single session call.
+    """
+    values = [getattr(layer, name) for name in names]
+    tensors = [
+        (index, value) for index, value in enumerate(values)
+        if isinstance(value, (tf.Variable, tf.Tensor))]
+
+    if tensors:
+        indices, tensors = zip(*tensors)
+        evaluated = tf_utils.tensorflow_eval(list(tensors))
+
+        for index, value in zip(indices, evaluated):
+            values[index] = value
+
+    return [None if value is None else np.asarray(value) for value in values]
+
+
+def copy_layer(layer):
+    """
+    Copies layer and replaces all of its parameters with arrays, which
+    means that copied layer doesn't share variables with the original.
+    """
+    copied_layer = copy.copy(layer)
+    names = [
+        name for name in copied_layer.options
+        if isinstance(getattr(copied_layer, name), (tf.Variable, tf.Tensor))]
+
+    for name, value in zip(names, parameter_values(copied_layer, *names)):
+        setattr(copied_layer, name, value)
+
+    return copied_layer
+
+
+def batch_norm_scale_and_shift(layer):
+    """
+    Finds per-channel scale and shift that batch normalization applies
+    during the inference. Returns ``None`` in case if normalization
+    has been applied not only per channel.
+    """
+    mean, inv_std, gamma, beta = parameter_values(
+        layer, 'running_mean', 'running_inv_std', 'gamma', 'beta')
+
+    if any(dim != 1 for dim in mean.shape[:-1]):
+        return None
+
+    scale = (gamma * inv_std).reshape(-1)
+    shift = (beta - mean * gamma * inv_std).reshape(-1)
+
+    return scale, shift
+
+
+def fold_batch_norm(layer, batch_norm):
+    """
+    Updates parameters of the linear layer in a way that it produces
+    the same output as the linear layer followed by the batch
+    normalization in the inference mode. Returns ``False`` in case
+    if folding is not possible.
+    """
+    scale_and_shift = batch_norm_scale_and_shift(batch_norm)
+
+    if scale_and_shift is None:
+        return False
+
+    scale, shift = scale_and_shift
+    weight, bias = parameter_values(layer, 'weight', 'bias')
+
+    if weight.shape[-1] != scale.size:
+        return False
+
+    if bias is None:
+        bias = shift
+    else:
+        bias = bias * scale + shift
+
+    layer.weight = (weight * scale).astype(weight.dtype)
+    layer.bias = bias.astype(weight.dtype)
+
+    return True
+
+
+def can_remove_layer(graph, layer, n_outputs):
+    """
+    Checks whether layer can be removed from the graph in a way that its
+    only input layer gets connected directly to all of its output layers.
+    Layer cannot be removed in case if it changes order of the inputs
+    for the other layers or number of the outputs in the graph.
+    """
+    forward_graph, backward_graph, position = graph
+    input_layers = backward_graph[layer]
+    output_layers = forward_graph[layer]
+
+    if len(input_layers) != 1:
+        return False
+
+    input_layer = input_layers[0]
+
+    if not output_layers:
+        return n_outputs == 1 and forward_graph[input_layer] == [layer]
+
+    for output_layer in output_layers:
+        if input_layer in backward_graph[output_layer]:
+            return False
+
+        new_input_layers = [
+            input_layer if l is layer else l
+            for l in backward_graph[output_layer]]
+
+        # Order of the inputs defined by the order of the layers in
+        # the graph and removed layer might be on a different position
+        if sorted(new_input_layers, key=position.get) != new_input_layers:
+            return False
+
+    return True
+
+
+def remove_layer(graph, layer):
+    forward_graph, backward_graph, _ = graph
+    input_layer, = backward_graph.pop(layer)
+    output_layers = forward_graph.pop(layer)
+
+    next_layers = []
+    for next_layer in forward_graph[input_layer]:
+        if next_layer is layer:
+            next_layers.extend(output_layers)
+        else:
+            next_layers.append(next_layer)
+
+    forward_graph[input_layer] = next_layers
+
+    for output_layer in output_layers:
+        backward_graph[output_layer] = [
+            input_layer if l is layer else l
+            for l in backward_graph[output_layer]]
+
+
+def optimize_for_inference(network):
+    """
+    Creates copy of the network that produces the same outputs in the
+    inference mode, but has fewer layers and operations. Function
+    applies the following optimizations.
+
+    - Batch normalization that follows linear transformation gets
+      folded into the weight and bias of the :layer:`Linear` or
+      :layer:`Convolution` layer. Normalization has to be applied
+      per channel (default ``axes``) and layer should have no other
+      outputs.
+
+    - Stochastic layers, like :layer:`Dropout`, :layer:`GaussianNoise`
+      and :layer:`DropBlock`, get removed from the network, since they
+      pass input through without changes during the inference.
+
+    Optimized network has its own copy of the parameters and it
+    doesn't share them with the original network.
+
+    Parameters
+    ----------
+    network : network or layer
+
+    Returns
+    -------
+    network
+
+    Examples
+    --------
+    >>> from neupy.layers import *
+    >>> network = join(
+    ...     Input(10),
+    ...     Linear(20, bias=None) >> BatchNorm() >> Relu(),
+    ...     Dropout(0.5),
+    ...     Softmax(4),
+    ... )
+    >>> network
+    (?, 10) -> [... 6 layers ...] -> (?, 4)
+    >>> optimize_for_inference(network)
+    (?, 10) -> [... 4 layers ...] -> (?, 4)
+    """
+    if not isinstance(network, LayerGraph):
+        network = LayerGraph(network.forward_graph)
+
+    network.create_variables()
+    tf_utils.initialize_uninitialized_variables()
+
+    copied_layers = OrderedDict(
+        (layer, copy_layer(layer)) for layer in network.forward_graph)
+
+    forward_graph = OrderedDict([
+        (copied_layers[layer], [copied_layers[l] for l in next_layers])
+        for layer, next_layers in network.forward_graph.items()
+    ])
+    backward_graph = OrderedDict([
+        (copied_layers[layer], [copied_layers[l] for l in prev_layers])
+        for layer, prev_layers in network.backward_graph.items()
+    ])
+    position = dict(
+        (layer, index) for index, layer in enumerate(forward_graph))
+
+    graph = (forward_graph, backward_graph, position)
+    n_outputs = len(network.output_layers)
+
+    for layer in [copied_layers[l] for l in network.layers]:
+        if isinstance(layer, (Dropout, GaussianNoise, DropBlock)):
+            if can_remove_layer(graph, layer, n_outputs):
+                remove_layer(graph, layer)
+
+        elif isinstance(layer, BatchNorm):
+            prev_layers = backward_graph[layer]
+
+            if len(prev_layers) != 1:
+                continue
+
+            prev_layer = prev_layers[0]
+            can_fold = (
+                is_foldable_layer(prev_layer) and
+                forward_graph[prev_layer] == [layer] and
+                can_remove_layer(graph, layer, n_outputs)
+            )
+
+            if can_fold and fold_batch_norm(prev_layer, layer):
+                remove_layer(graph, layer)
+
+    return LayerGraph(forward_graph)
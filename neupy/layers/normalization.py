@@ -7,7 +7,7 @@ from neupy.core.properties import (
     NumberProperty,
     IntProperty,
 )
-from neupy.utils import asfloat
+from neupy.utils import asfloat, get_float_type
 from neupy.exceptions import (
     WeightInitializationError,
     LayerConnectionError,
@@ -191,8 +191,8 @@ class BatchNorm(Identity):
             value=self.beta, name='beta',
             shape=parameter_shape)
 
-    def output(self, input, training=False):
-        input = tf.convert_to_tensor(input, dtype=tf.float32)
+    def output(self, input, training=False, **kwargs):
+        input = tf.convert_to_tensor(input, dtype=get_float_type())
 
         if not training:
             mean = self.running_mean
@@ -411,8 +411,8 @@ class GroupNorm(Identity):
 
         return super(GroupNorm, self).get_output_shape(input_shape)
 
-    def output(self, input):
-        input = tf.convert_to_tensor(input, dtype=tf.float32)
+    def output(self, input, **kwargs):
+        input = tf.convert_to_tensor(input, dtype=get_float_type())
         input_shape = tf.shape(input)
         n_groups = self.n_groups
 
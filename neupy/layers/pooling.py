@@ -4,7 +4,7 @@ import math
 
 import tensorflow as tf
 
-from neupy.utils import as_tuple, tf_utils
+from neupy.utils import as_tuple, tf_utils, get_float_type
 from neupy.core.properties import (TypedListProperty, ChoiceProperty,
                                    FunctionWithOptionsProperty)
 from neupy.exceptions import LayerConnectionError
@@ -299,7 +299,7 @@ class Upscale(BaseLayer):
         ])
 
     def output(self, input_value, **kwargs):
-        input_value = tf.convert_to_tensor(input_value, dtype=tf.float32)
+        input_value = tf.convert_to_tensor(input_value, dtype=get_float_type())
         self.fail_if_shape_invalid(input_value.shape)
         return tf_utils.repeat(input_value, as_tuple(1, self.scale, 1))
 
@@ -367,7 +367,7 @@ class GlobalPooling(BaseLayer):
         return tf.TensorShape([input_shape[0], input_shape[-1]])
 
     def output(self, input_value, **kwargs):
-        input_value = tf.convert_to_tensor(input_value, dtype=tf.float32)
+        input_value = tf.convert_to_tensor(input_value, dtype=get_float_type())
         ndims = len(input_value.shape)
 
         if ndims == 2:
@@ -1,9 +1,10 @@
 import types
 
+import numpy as np
 import tensorflow as tf
 
 from neupy import init
-from neupy.utils import tensorflow_session
+from neupy.utils import as_tuple, tf_utils, tensorflow_session
 from neupy.exceptions import LayerConnectionError
 from neupy.core.properties import (
     IntProperty, Property,
@@ -12,7 +13,7 @@ from neupy.core.properties import (
 from .base import BaseLayer
 
 
-__all__ = ('LSTM', 'GRU')
+__all__ = ('LSTM', 'GRU', 'StatefulPredictor')
 
 
 def clip_gradient(value, clip_value):
@@ -63,17 +64,109 @@ def unroll_scan(fn, sequence, outputs_info):
         outputs = []
         prev_vals = outputs_info
 
-        for entity in tf.unstack(sequence):
+        if isinstance(sequence, (list, tuple)):
+            entities = zip(*[tf.unstack(seq) for seq in sequence])
+        else:
+            entities = tf.unstack(sequence)
+
+        for entity in entities:
             output = fn(prev_vals, entity)
-            outputs.append(output[-1])
+            outputs.append(output)
             prev_vals = output
 
-        return tf.stack(outputs)
+        return [tf.stack(values) for values in zip(*outputs)]
+
+
+def project_sequence(sequence, weights, biases):
+    """
+    Computes input-to-hidden projection for all time steps at once.
+    Matrix multiplication doesn't depend on the recurrent state, which
+    means that it can be done with one large product before the loop
+    instead of the many small products inside of it.
+
+    Parameters
+    ----------
+    sequence : Tensor
+        Time-major input with shape ``(n_time_steps, n_samples,
+        n_features)``.
+
+    weights : Tensor
+        Matrix with shape ``(n_features, n_outputs)``.
+
+    biases : Tensor
+        Vector with shape ``(n_outputs,)``.
+
+    Returns
+    -------
+    Tensor
+        Time-major tensor with shape ``(n_time_steps, n_samples,
+        n_outputs)``.
+    """
+    with tf.name_scope('project-sequence'):
+        shape = tf.shape(sequence)
+        n_features = tf.shape(weights)[0]
+
+        projection = tf.matmul(
+            tf.reshape(sequence, [-1, n_features]), weights) + biases
+        projection = tf.reshape(
+            projection, [shape[0], shape[1], tf.shape(weights)[1]])
+
+        # Reshape operation loses static shape, but unrolled scan
+        # requires number of time steps to be known
+        projection.set_shape(
+            sequence.shape[:-1].concatenate(weights.shape[-1:]))
+
+        return projection
+
+
+def mask_step(step):
+    """
+    Wraps recurrent step function in order to ignore time steps
+    that go after the end of the sequence. For such steps, states
+    from the previous time step will be passed without changes.
+
+    Parameters
+    ----------
+    step : function
+        Function that accepts list of previous states and input for
+        the current time step and returns list of the new states.
+
+    Returns
+    -------
+    function
+        Function that accepts list of previous states and pair of input
+        and boolean mask for the current time step.
+    """
+    def masked_step(states, elems):
+        input_n, mask_n = elems
+        new_states = step(states, input_n)
+
+        return [
+            tf.where(mask_n, new_state, state)
+            for new_state, state in zip(new_states, states)
+        ]
+
+    return masked_step
 
 
 class BaseRNNLayer(BaseLayer):
     """
-    Base class for the recurrent layers
+    Base class for the recurrent layers. Layer expects single input
+    with shape ``(n_samples, n_time_steps, n_features)``. Optionally,
+    it's possible to connect second input that contains length of each
+    sequence. In this case, states won't be updated after the end
+    of each sequence, outputs for the padded time steps will be equal
+    to zero and with ``only_return_final=True`` layer returns state
+    from the last time step of each sequence. Sequences have to be
+    padded at the end.
+
+    Layer's output method accepts ``initial_states`` and ``final_states``
+    dictionaries. Initial states, specified for the layer, will be used
+    instead of the ``cell_init`` and ``hidden_init`` parameters and final
+    states, computed from the input, will be saved in the ``final_states``
+    dictionary. For both dictionaries, layer is a key and value is a list
+    of states ordered in the same way as names in the ``state_names``
+    attribute.
 
     Parameters
     ----------
@@ -91,24 +184,42 @@ class BaseRNNLayer(BaseLayer):
     n_units = IntProperty(minval=1)
     only_return_final = Property(expected_type=bool)
 
+    # Names of the layer's attributes that store initial states
+    state_names = ()
+
     def __init__(self, n_units, only_return_final=True, name=None):
         super(BaseRNNLayer, self).__init__(name=name)
         self.only_return_final = only_return_final
         self.n_units = n_units
 
-    def fail_if_shape_invalid(self, input_shape):
+    def fail_if_shape_invalid(self, input_shape, lengths_shape=None):
+        clsname = self.__class__.__name__
+
         if input_shape and input_shape.ndims != 3:
-            clsname = self.__class__.__name__
             raise LayerConnectionError(
                 "{} layer was expected input with three dimensions, "
                 "but got input with {} dimensions instead. Layer: {}"
                 "".format(clsname, input_shape.ndims, self))
 
-    def get_output_shape(self, input_shape):
+        if lengths_shape is None or lengths_shape.ndims is None:
+            return
+
+        is_column = (lengths_shape.ndims == 2 and lengths_shape[1] == 1)
+
+        if lengths_shape.ndims != 1 and not is_column:
+            raise LayerConnectionError(
+                "{} layer expects sequence lengths as a vector or as a "
+                "matrix with one column, got input with shape {} instead. "
+                "Layer: {}".format(clsname, lengths_shape, self))
+
+    def get_output_shape(self, input_shape, lengths_shape=None):
         input_shape = tf.TensorShape(input_shape)
         n_samples = input_shape[0]
 
-        self.fail_if_shape_invalid(input_shape)
+        if lengths_shape is not None:
+            lengths_shape = tf.TensorShape(lengths_shape)
+
+        self.fail_if_shape_invalid(input_shape, lengths_shape)
 
         if self.only_return_final:
             return tf.TensorShape((n_samples, self.n_units))
@@ -116,6 +227,144 @@ class BaseRNNLayer(BaseLayer):
         n_time_steps = input_shape[1]
         return tf.TensorShape((n_samples, n_time_steps, self.n_units))
 
+    def get_initial_states(self, n_samples, initial_states=None):
+        """
+        Returns list of the initial states for the batch.
+
+        Parameters
+        ----------
+        n_samples : int or Tensor
+            Number of samples in the batch.
+
+        initial_states : dict or None
+            States specified per recurrent layer. In case if states
+            for the layer weren't specified, they will be taken from
+            the layer's parameters. Defaults to ``None``.
+
+        Returns
+        -------
+        list of Tensor
+        """
+        if initial_states is not None and self in initial_states:
+            return list(initial_states[self])
+
+        return [
+            tf.tile(getattr(self, name), (n_samples, 1))
+            for name in self.state_names
+        ]
+
+    def apply_recurrence(self, step, sequence, states, lengths=None,
+                         final_states=None):
+        """
+        Propagates sequence through the recurrent step function and
+        formats output according to the layer's configurations.
+
+        Parameters
+        ----------
+        step : function
+            Function that accepts list of previous states and input
+            for the current time step and returns list of the new
+            states. Last state has to be the hidden state.
+
+        sequence : Tensor
+            Time-major sequence with shape ``(n_time_steps, n_samples,
+            n_features)``.
+
+        states : list of Tensor
+            Initial states.
+
+        lengths : Tensor or None
+            Length of each sequence in the batch. The ``None`` value
+            means that all sequences have the same length.
+            Defaults to ``None``.
+
+        final_states : dict or None
+            States after the last time step will be saved in the
+            dictionary using layer as a key. Defaults to ``None``.
+
+        Returns
+        -------
+        Tensor
+        """
+        static_shape = sequence.shape
+        n_time_steps = tf.shape(sequence)[0]
+        elems = sequence
+
+        if lengths is not None:
+            lengths = tf.cast(tf.reshape(lengths, [-1]), tf.int32)
+            max_length = static_shape[0].value
+
+            if not self.unroll_scan:
+                # There is no need to do any computations for
+                # the time steps that go after the longest sequence
+                max_length = tf.reduce_max(lengths)
+                sequence = sequence[:max_length]
+
+            elif max_length is None:
+                max_length = n_time_steps
+
+            mask = tf.sequence_mask(lengths, max_length)
+            mask = tf.transpose(mask, [1, 0])
+
+            if self.backwards:
+                sequence = tf.reverse_sequence(
+                    sequence, lengths, seq_axis=0, batch_axis=1)
+
+            step = mask_step(step)
+            elems = [sequence, mask]
+
+        elif self.backwards:
+            sequence = tf.reverse(sequence, axis=[0])
+            elems = sequence
+
+        if self.unroll_scan:
+            # Explicitly unroll the recurrence instead of using scan
+            outputs = unroll_scan(
+                fn=step,
+                sequence=elems,
+                outputs_info=states,
+            )
+        else:
+            outputs = tf.scan(
+                fn=step,
+                elems=elems,
+                initializer=states,
+                name='{}-scan'.format(self.__class__.__name__.lower()),
+            )
+
+        if final_states is not None:
+            # Masked states stop changing after the end of the
+            # sequence, which means that the last states are final
+            final_states[self] = [output[-1] for output in outputs]
+
+        hid_out = outputs[-1]
+
+        # When it is requested that we only return the final sequence step,
+        # we need to slice it out immediately after scan is applied
+        if self.only_return_final:
+            return hid_out[-1]
+
+        if lengths is not None:
+            if self.backwards:
+                hid_out = tf.reverse_sequence(
+                    hid_out, lengths, seq_axis=0, batch_axis=1)
+
+            # Outputs for the padded time steps are equal to zero
+            mask = tf.cast(tf.expand_dims(mask, -1), hid_out.dtype)
+            hid_out = tf.pad(
+                hid_out * mask,
+                [[0, n_time_steps - tf.shape(hid_out)[0]], [0, 0], [0, 0]])
+
+        # if scan is backward reverse the output
+        elif self.backwards:
+            hid_out = tf.reverse(hid_out, axis=[0])
+
+        # dimshuffle back to (n_samples, n_time_steps, n_features))
+        hid_out = tf.transpose(hid_out, [1, 0, 2])
+        hid_out.set_shape([static_shape[1], static_shape[0], self.n_units])
+
+        return hid_out
+
 
 class LSTM(BaseRNNLayer):
     """
@@ -202,6 +451,15 @@ class LSTM(BaseRNNLayer):
     Code was adapted from the
     `Lasagne <https://github.com/Lasagne/Lasagne>`_ library.
 
+    Layer accepts optional second input with length of each sequence.
+    States won't be updated after the end of the sequence, which means
+    that padding doesn't affect final output. Sequences have to be
+    padded at the end.
+
+    >>> sequences = Input((40, 10))
+    >>> lengths = Input(1)
+    >>> network = (sequences | lengths) >> LSTM(20)
+
     Examples
     --------
     Sequence classification
@@ -226,6 +484,8 @@ class LSTM(BaseRNNLayer):
     cell_weights = ParameterProperty()
     biases = ParameterProperty()
 
+    state_names = ('cell_init', 'hidden_init')
+
     ingate = Property(expected_type=types.FunctionType)
     forgetgate = Property(expected_type=types.FunctionType)
     outgate = Property(expected_type=types.FunctionType)
@@ -279,7 +539,7 @@ class LSTM(BaseRNNLayer):
         self.peepholes = peepholes
         self.gradient_clipping = gradient_clipping
 
-    def create_variables(self, input_shape):
+    def create_variables(self, input_shape, lengths_shape=None):
         self.input_shape = input_shape
         self.input_weights = self.variable(
             value=self.input_weights,
@@ -324,15 +584,16 @@ class LSTM(BaseRNNLayer):
                 name='weight_cell_to_outgate',
                 shape=(self.n_units,))
 
-    def output(self, input, **kwargs):
+    def output(self, input, lengths=None, initial_states=None,
+               final_states=None, **kwargs):
         # Because scan iterates over the first dimension we
         # dimshuffle to (n_time_steps, n_samples, n_features)
         input = tf.transpose(input, [1, 0, 2])
 
+        # Input is expected to be already projected to the gates
         def one_lstm_step(states, input_n):
             with tf.name_scope('lstm-cell'):
                 cell_previous, hid_previous = states
-                input_n = tf.matmul(input_n, self.input_weights) + self.biases
 
                 # Calculate gates pre-activations and slice
                 gates = input_n + tf.matmul(hid_previous, self.hidden_weights)
@@ -370,41 +631,19 @@ class LSTM(BaseRNNLayer):
 
         input_shape = tf.shape(input)
         n_samples = input_shape[1]  # batch dim has been moved
-        cell_init = tf.tile(self.cell_init, (n_samples, 1))
-        hidden_init = tf.tile(self.hidden_init, (n_samples, 1))
-        sequence = input
-
-        if self.backwards:
-            sequence = tf.reverse(sequence, axis=[0])
-
-        if self.unroll_scan:
-            # Explicitly unroll the recurrence instead of using scan
-            hid_out = unroll_scan(
-                fn=one_lstm_step,
-                sequence=sequence,
-                outputs_info=[cell_init, hidden_init],
-            )
-        else:
-            _, hid_out = tf.scan(
-                fn=one_lstm_step,
-                elems=sequence,
-                initializer=[cell_init, hidden_init],
-                name='lstm-scan',
-            )
-
-        # When it is requested that we only return the final sequence step,
-        # we need to slice it out immediately after scan is applied
-        if self.only_return_final:
-            return hid_out[-1]
-
-        # if scan is backward reverse the output
-        if self.backwards:
-            hid_out = tf.reverse(hid_out, axis=[0])
-
-        # dimshuffle back to (n_samples, n_time_steps, n_features))
-        hid_out = tf.transpose(hid_out, [1, 0, 2])
-
-        return hid_out
+        states = self.get_initial_states(n_samples, initial_states)
+
+        # Input projection doesn't depend on the previous states, so
+        # it can be computed for all time steps before the recurrence
+        sequence = project_sequence(input, self.input_weights, self.biases)
+
+        return self.apply_recurrence(
+            step=one_lstm_step,
+            sequence=sequence,
+            states=states,
+            lengths=lengths,
+            final_states=final_states,
+        )
 
 
 class GRU(BaseRNNLayer):
@@ -470,6 +709,15 @@ class GRU(BaseRNNLayer):
     Code was adapted from the
     `Lasagne <https://github.com/Lasagne/Lasagne>`_ library.
 
+    Layer accepts optional second input with length of each sequence.
+    States won't be updated after the end of the sequence, which means
+    that padding doesn't affect final output. Sequences have to be
+    padded at the end.
+
+    >>> sequences = Input((40, 10))
+    >>> lengths = Input(1)
+    >>> network = (sequences | lengths) >> GRU(20)
+
     Examples
     --------
     Sequence classification
@@ -493,6 +741,8 @@ class GRU(BaseRNNLayer):
     hidden_weights = ParameterProperty()
     biases = ParameterProperty()
 
+    state_names = ('hidden_init',)
+
     resetgate = Property(expected_type=types.FunctionType)
     updategate = Property(expected_type=types.FunctionType)
     hidden_update = Property(expected_type=types.FunctionType)
@@ -540,7 +790,7 @@ class GRU(BaseRNNLayer):
         self.backwards = backwards
         self.gradient_clipping = gradient_clipping
 
-    def create_variables(self, input_shape):
+    def create_variables(self, input_shape, lengths_shape=None):
         self.input_weights = self.variable(
             value=self.input_weights,
             name='input_weights',
@@ -562,17 +812,17 @@ class GRU(BaseRNNLayer):
             trainable=self.learn_init
         )
 
-    def output(self, input, **kwargs):
+    def output(self, input, lengths=None, initial_states=None,
+               final_states=None, **kwargs):
         # Because scan iterates over the first dimension we
         # dimshuffle to (n_time_steps, n_samples, n_features)
         input = tf.transpose(input, [1, 0, 2])
 
         # Create single recurrent computation step function
-        # input_n is the n'th vector of the input
+        # input_n is the n'th vector of the projected input
         def one_gru_step(states, input_n):
             with tf.name_scope('gru-cell'):
                 hid_previous, = states
-                input_n = tf.matmul(input_n, self.input_weights) + self.biases
 
                 # Compute W_{hr} h_{t - 1}, W_{hu} h_{t - 1},
                 # and W_{hc} h_{t - 1}
@@ -609,36 +859,165 @@ class GRU(BaseRNNLayer):
 
         input_shape = tf.shape(input)
         n_samples = input_shape[1]  # batch dim has been moved
-        hidden_init = tf.tile(self.hidden_init, (n_samples, 1))
-        sequence = input
+        states = self.get_initial_states(n_samples, initial_states)
+
+        # Input projection doesn't depend on the previous states, so
+        # it can be computed for all time steps before the recurrence
+        sequence = project_sequence(input, self.input_weights, self.biases)
+
+        return self.apply_recurrence(
+            step=one_gru_step,
+            sequence=sequence,
+            states=states,
+            lengths=lengths,
+            final_states=final_states,
+        )
 
-        if self.backwards:
-            sequence = tf.reverse(sequence, axis=[0])
 
-        if self.unroll_scan:
-            # Explicitly unroll the recurrence instead of using scan
-            hid_out = unroll_scan(
-                fn=one_gru_step,
-                sequence=sequence,
-                outputs_info=[hidden_init]
-            )
-        else:
-            hid_out, = tf.scan(
-                fn=one_gru_step,
-                elems=sequence,
-                initializer=[hidden_init],
-                name='gru-scan',
-            )
+class StatefulPredictor(object):
+    """
+    Makes predictions for multiple independent streams of sequential
+    data. Each new input continues sequence that was observed for the
+    stream before. States of the recurrent layers are stored per stream
+    after each prediction and used as initial states for the next one,
+    which means that only new time steps have to be propagated through
+    the network.
 
-        # When it is requested that we only return the final sequence step,
-        # we need to slice it out immediately after scan is applied
-        if self.only_return_final:
-            return hid_out[-1]
+    Parameters
+    ----------
+    network : network
+        Network with recurrent layers. Number of time steps in the
+        network's inputs should be unknown in order to be able to
+        propagate only new time steps, for example, ``Input((None, 10))``.
 
-        # if scan is backward reverse the output
-        if self.backwards:
-            hid_out = tf.reverse(hid_out, axis=[0])
+    Attributes
+    ----------
+    layers : list
+        Recurrent layers from the network.
 
-        # dimshuffle back to (n_samples, n_time_steps, n_features))
-        hid_out = tf.transpose(hid_out, [1, 0, 2])
-        return hid_out
+    states : dict
+        States stored per stream. Each key is a stream identifier and
+        each value is a dictionary that maps recurrent layer to the list
+        of its states (see ``state_names`` attribute of the layer).
+        For instance, :layer:`LSTM` has cell and hidden states.
+
+    Methods
+    -------
+    predict(stream_ids, \*inputs)
+        Propagates one sample per each stream through the network and
+        updates states of the streams. Returns network's output.
+
+    get_states(stream_id)
+        Returns states of the stream. Unknown streams get initial
+        states from the recurrent layers.
+
+    reset(stream_id=None)
+        Removes states of the stream. The ``None`` value removes
+        states of all streams.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from neupy.layers import *
+    >>>
+    >>> network = Input((None, 10)) >> LSTM(20) >> Sigmoid(1)
+    >>> predictor = StatefulPredictor(network)
+    >>>
+    >>> # One new time step for each of the two streams
+    >>> x = np.random.random((2, 1, 10))
+    >>> y = predictor.predict(['stream-1', 'stream-2'], x)
+    """
+    def __init__(self, network):
+        self.network = network
+        self.layers = [l for l in network if isinstance(l, BaseRNNLayer)]
+        self.states = {}
+
+        if not self.layers:
+            raise ValueError("Network doesn't have recurrent layers")
+
+        initial_states, final_states = {}, {}
+        state_placeholders = []
+
+        for layer in self.layers:
+            initial_states[layer] = [
+                tf.placeholder(
+                    network.float_type,
+                    shape=(None, layer.n_units),
+                    name="placeholder/state/{}/{}".format(layer.name, name),
+                )
+                for name in layer.state_names
+            ]
+            state_placeholders.extend(initial_states[layer])
+
+        inputs = as_tuple(network.inputs)
+        outputs = as_tuple(network.output(
+            *inputs,
+            initial_states=initial_states,
+            final_states=final_states
+        ))
+
+        self.n_outputs = len(outputs)
+        self.predict_function = tf_utils.function(
+            inputs=inputs + as_tuple(state_placeholders),
+            outputs=list(outputs) + [
+                state for layer in self.layers
+                for state in final_states[layer]
+            ],
+            name='stateful-predict',
+        )
+
+        tf_utils.initialize_uninitialized_variables()
+        session = tensorflow_session()
+        self.default_states = {}
+
+        for layer in self.layers:
+            values = session.run([
+                getattr(layer, name) for name in layer.state_names])
+            self.default_states[layer] = [value[0] for value in values]
+
+    def get_states(self, stream_id):
+        if stream_id in self.states:
+            return self.states[stream_id]
+
+        return dict(
+            (layer, [np.copy(state) for state in states])
+            for layer, states in self.default_states.items()
+        )
+
+    def reset(self, stream_id=None):
+        if stream_id is None:
+            self.states.clear()
+        else:
+            self.states.pop(stream_id, None)
+
+    def predict(self, stream_ids, *inputs):
+        stream_ids = list(stream_ids)
+        stream_states = [self.get_states(id_) for id_ in stream_ids]
+        states = []
+
+        for layer in self.layers:
+            for i in range(len(layer.state_names)):
+                states.append(np.stack([
+                    stream_state[layer][i] for stream_state in stream_states
+                ]))
+
+        results = self.predict_function(*(inputs + tuple(states)))
+        outputs = results[:self.n_outputs]
+        final_states = results[self.n_outputs:]
+
+        for index, stream_id in enumerate(stream_ids):
+            self.states[stream_id] = updated_states = {}
+            state_index = 0
+
+            for layer in self.layers:
+                n_states = len(layer.state_names)
+                updated_states[layer] = [
+                    state[index] for state in
+                    final_states[state_index:state_index + n_states]
+                ]
+                state_index += n_states
+
+        if self.n_outputs == 1:
+            return outputs[0]
+
+        return outputs
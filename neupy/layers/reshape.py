@@ -1,7 +1,7 @@
 import numpy as np
 import tensorflow as tf
 
-from neupy.utils import as_tuple
+from neupy.utils import as_tuple, get_float_type
 from neupy.exceptions import LayerConnectionError
 from neupy.core.properties import TypedListProperty
 from .base import BaseLayer
@@ -87,7 +87,7 @@ class Reshape(BaseLayer):
         ----------
         input : array-like or Tensorfow variable
         """
-        input = tf.convert_to_tensor(input, dtype=tf.float32)
+        input = tf.convert_to_tensor(input, dtype=get_float_type())
         input_shape = tf.shape(input)
 
         n_samples = input_shape[0]
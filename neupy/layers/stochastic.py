@@ -1,6 +1,6 @@
 import tensorflow as tf
 
-from neupy.utils import asfloat
+from neupy.utils import asfloat, get_float_type
 from neupy.exceptions import LayerConnectionError
 from neupy.core.properties import (
     ProperFractionProperty,
@@ -14,7 +14,8 @@ __all__ = ('Dropout', 'GaussianNoise', 'DropBlock')
 
 
 def bernoulli_sample(mean, shape):
-    samples = tf.random_uniform(shape, minval=0, maxval=1, dtype=tf.float32)
+    samples = tf.random_uniform(
+        shape, minval=0, maxval=1, dtype=get_float_type())
     sign_samples = tf.sign(mean - samples)
     return (sign_samples + 1) / 2
 
@@ -76,7 +77,7 @@ class Dropout(Identity):
         super(Dropout, self).__init__(name=name)
         self.proba = proba
 
-    def output(self, input_value, training=False):
+    def output(self, input_value, training=False, **kwargs):
         if not training:
             return input_value
         return tf.nn.dropout(input_value, keep_prob=(1.0 - self.proba))
@@ -131,14 +132,15 @@ class GaussianNoise(Identity):
         self.mean = mean
         self.std = std
 
-    def output(self, input_value, training=False):
+    def output(self, input_value, training=False, **kwargs):
         if not training:
             return input_value
 
         noise = tf.random_normal(
             shape=tf.shape(input_value),
             mean=self.mean,
-            stddev=self.std)
+            stddev=self.std,
+            dtype=input_value.dtype)
 
         return input_value + noise
 
@@ -213,11 +215,11 @@ class DropBlock(Identity):
 
         return input_shape
 
-    def output(self, input, training=False):
+    def output(self, input, training=False, **kwargs):
         if not training:
             return input
 
-        input = tf.convert_to_tensor(input, tf.float32)
+        input = tf.convert_to_tensor(input, get_float_type())
         input_shape = tf.shape(input)
 
         block_height, block_width = self.block_size
@@ -255,7 +257,7 @@ class DropBlock(Identity):
             strides=[1, 1, 1, 1],
             padding='SAME',
         )
-        mask = tf.cast(1 - mask, tf.float32)
+        mask = tf.cast(1 - mask, get_float_type())
 
         feature_normalizer = asfloat(tf.size(mask)) / tf.reduce_sum(mask)
         return tf.multiply(input, mask) * feature_normalizer
@@ -0,0 +1,193 @@
+import copy
+
+import numpy as np
+from scipy import sparse
+
+from neupy.runtime import operations, LinearOperation
+
+
+__all__ = ('prune', 'sparsify')
+
+
+def magnitude_mask(weight, sparsity):
+    """
+    Finds mask that removes specified fraction of the weights that
+    have the smallest absolute values. Values that have been pruned
+    before, have zero magnitude, which means that they always stay
+    pruned when sparsity increases.
+
+    Returns
+    -------
+    array-like
+        Boolean mask that has ``False`` values for the pruned weights.
+    """
+    weight = np.asarray(weight)
+    n_pruned = int(round(sparsity * weight.size))
+    mask = np.ones(weight.shape, dtype=bool)
+
+    if n_pruned > 0:
+        magnitude = np.abs(weight).ravel()
+        pruned = np.argpartition(magnitude, n_pruned - 1)[:n_pruned]
+        mask.flat[pruned] = False
+
+    return mask
+
+
+def prunable_layers(data):
+    """
+    Returns names of the layers that have dense weight, which can be
+    pruned and stored in the sparse format.
+    """
+    layers = []
+
+    for layer in data['layers']:
+        operation_class = operations.get(layer['class_name'])
+        weight = layer['parameters'].get('weight')
+
+        if operation_class is None or weight is None:
+            continue
+
+        weight_type = np.asarray(weight['value']).dtype
+        is_float = np.issubdtype(weight_type, np.floating)
+
+        if issubclass(operation_class, LinearOperation) and is_float:
+            layers.append(layer['name'])
+
+    return layers
+
+
+def prune(data, sparsity):
+    """
+    One-shot magnitude pruning of the :layer:`Linear` layers (including
+    layers with activation functions). Function sets to zero specified
+    fraction of the weights that have the smallest absolute values.
+    Fraction is the same for each layer. Bias and parameters of the
+    other layers are not pruned.
+
+    Pruning without fine-tuning might reduce network's accuracy. Network
+    can be pruned gradually during the training with the
+    :class:`MagnitudePruning <neupy.algorithms.MagnitudePruning>`
+    signal.
+
+    Parameters
+    ----------
+    data : dict
+        Network stored in the dictionary. Learn more about the format
+        from the :func:`save_dict <neupy.storage.save_dict>` function.
+
+    sparsity : float
+        Fraction of the weights that will be set to zero. Value has to
+        be between ``0`` and ``1``.
+
+    Returns
+    -------
+    dict
+        Pruned network.
+    """
+    if not 0 <= sparsity < 1:
+        raise ValueError(
+            "Sparsity has to be a number between 0 and 1, got {}"
+            "".format(sparsity))
+
+    layer_names = prunable_layers(data)
+
+    pruned_data = copy.copy(data)
+    pruned_data['layers'] = []
+
+    for layer in data['layers']:
+        if layer['name'] not in layer_names:
+            pruned_data['layers'].append(layer)
+            continue
+
+        parameters = dict(layer['parameters'])
+        weight = np.asarray(parameters['weight']['value'])
+        mask = magnitude_mask(weight, sparsity)
+
+        parameters['weight'] = dict(
+            parameters['weight'], value=np.where(mask, weight, 0))
+        pruned_data['layers'].append(dict(layer, parameters=parameters))
+
+    return pruned_data
+
+
+def sparsify(data, min_sparsity=0.5):
+    """
+    Converts weights of the :layer:`Linear` layers (including layers
+    with activation functions) to the Compressed Sparse Row (CSR)
+    format. Weight is stored transposed, which means that each row
+    has non-zero weights of a single output unit. Sparse weight is
+    stored in the ``weight_data``, ``weight_indices``, ``weight_indptr``
+    and ``weight_shape`` parameters instead of the ``weight``.
+
+    Sparse format makes sense only for the pruned networks, since each
+    non-zero weight requires additional integer index. Network can be
+    saved in any format supported by the :mod:`neupy.runtime` module
+    and it can be used only for the inference with the
+    :class:`ExecutionPlan <neupy.runtime.ExecutionPlan>`.
+
+    Parameters
+    ----------
+    data : dict
+        Network stored in the dictionary. Learn more about the format
+        from the :func:`save_dict <neupy.storage.save_dict>` function.
+
+    min_sparsity : float
+        Weight will be converted only in case if fraction of its zero
+        values is greater or equal to the specified number.
+        Defaults to ``0.5``.
+
+    Returns
+    -------
+    dict
+        Network with sparse weights.
+
+    Examples
+    --------
+    >>> from neupy import storage, runtime, pruning
+    >>>
+    >>> data = storage.save_dict(network)
+    >>> sparse_data = pruning.sparsify(data)
+    >>>
+    >>> runtime.write_hdf5(sparse_data, '/path/to/network.hdf5')
+    >>> plan = runtime.load_hdf5('/path/to/network.hdf5')
+    """
+    layer_names = prunable_layers(data)
+
+    sparse_data = copy.copy(data)
+    sparse_data['metadata'] = dict(
+        data.get('metadata', {}), sparse_format='csr')
+    sparse_data['layers'] = []
+
+    for layer in data['layers']:
+        if layer['name'] not in layer_names:
+            sparse_data['layers'].append(layer)
+            continue
+
+        parameters = dict(layer['parameters'])
+        weight = np.asarray(parameters['weight']['value'])
+
+        if np.mean(weight == 0) < min_sparsity:
+            sparse_data['layers'].append(layer)
+            continue
+
+        sparse_weight = sparse.csr_matrix(weight.T)
+        del parameters['weight']
+
+        parameters.update(
+            weight_data={'value': sparse_weight.data, 'trainable': False},
+            weight_indices={
+                'value': sparse_weight.indices.astype(np.int32),
+                'trainable': False,
+            },
+            weight_indptr={
+                'value': sparse_weight.indptr.astype(np.int32),
+                'trainable': False,
+            },
+            weight_shape={
+                'value': np.array(sparse_weight.shape, dtype=np.int32),
+                'trainable': False,
+            },
+        )
+        sparse_data['layers'].append(dict(layer, parameters=parameters))
+
+    return sparse_data
@@ -0,0 +1,294 @@
+import copy
+
+import numpy as np
+
+from neupy.runtime import (
+    ExecutionPlan, LinearOperation, ConvolutionOperation,
+)
+
+
+__all__ = ('quantize', 'quantization_report')
+
+
+def symmetric_scale(max_value):
+    """
+    Finds scale that maps values from the ``[-max_value, max_value]``
+    range to the 8-bit integers. Zero values get unit scale.
+    """
+    max_value = np.asarray(max_value, dtype=np.float64)
+    return np.where(max_value > 0, max_value / 127., 1.)
+
+
+def quantize_weight(weight):
+    """
+    Quantizes weight to the 8-bit integers with separate scale per
+    each output unit or filter (last dimension of the weight).
+
+    Returns
+    -------
+    tuple
+        Quantized weight and scales.
+    """
+    weight = np.asarray(weight)
+    reduced_axes = tuple(range(weight.ndim - 1))
+
+    scale = symmetric_scale(np.abs(weight).max(axis=reduced_axes))
+    quantized_weight = np.clip(np.rint(weight / scale), -127, 127)
+
+    return quantized_weight.astype(np.int8), scale
+
+
+def quantizable_layers(plan):
+    """
+    Returns names of the layers and names of their inputs for the
+    layers that can be quantized.
+    """
+    layers = []
+
+    for layer_name, operation, input_layers in plan.operations:
+        has_weight = 'weight' in operation.parameters
+        is_quantizable = isinstance(
+            operation, (LinearOperation, ConvolutionOperation))
+
+        if has_weight and is_quantizable and not operation.is_quantized:
+            layers.append((layer_name, input_layers))
+
+    return layers
+
+
+def calibrate(plan, inputs, batch_size=None):
+    """
+    Finds maximum absolute value of the input per each layer that can
+    be quantized.
+
+    Returns
+    -------
+    dict
+        Maximum absolute value per layer name.
+    """
+    layers = quantizable_layers(plan)
+    max_values = dict((layer_name, 0.) for layer_name, _ in layers)
+
+    inputs = [np.asarray(input, dtype=plan.dtype) for input in inputs]
+    n_samples = inputs[0].shape[0]
+    batch_size = batch_size or n_samples
+
+    for start in range(0, n_samples, batch_size):
+        batch = [input[start:start + batch_size] for input in inputs]
+        outputs = plan.propagate_forward(batch)
+
+        for layer_name, input_layers in layers:
+            if layer_name in plan.input_layers:
+                layer_input = batch[plan.input_layers.index(layer_name)]
+            else:
+                layer_input = outputs[input_layers[0]]
+
+            max_values[layer_name] = max(
+                max_values[layer_name], np.abs(layer_input).max())
+
+    return max_values
+
+
+def quantize(data, *calibration_inputs, **kwargs):
+    """
+    Post-training quantization of the :layer:`Linear` layers (including
+    layers with activation functions) and :layer:`Convolution` layers.
+    Weights get quantized to the 8-bit integers with separate scale per
+    output unit or filter. Inputs of each layer get quantized to the
+    8-bit integers with the single scale found from the calibration
+    data. Bias and parameters of the other layers are not quantized.
+
+    Quantized network stores weights as 8-bit integers together with
+    scales in the ``weight_scale`` and ``input_scale`` parameters.
+    Network can be saved in any format supported by the
+    :mod:`neupy.runtime` module and it can be used only for the
+    inference with the :class:`ExecutionPlan
+    <neupy.runtime.ExecutionPlan>`.
+
+    Quantization reduces memory required for the weights roughly four
+    times compared to the ``float32`` weights, but it doesn't make
+    inference faster. NumPy uses BLAS only for the floats, which means
+    that weights get converted back to floats during each propagation.
+    Weights are converted in blocks of columns, so that additional
+    memory required for the conversion doesn't depend on the size of
+    the weight. Conversion and quantization of the inputs make
+    quantized layers slightly slower than layers with float weights.
+
+    Parameters
+    ----------
+    data : dict
+        Network stored in the dictionary. Learn more about the format
+        from the :func:`save_dict <neupy.storage.save_dict>` function.
+
+    *calibration_inputs : array-like
+        Samples that will be used in order to find range of the values
+        per each layer's input. Samples should be representative for
+        the data that network will get during the inference.
+
+    batch_size : int or None
+        Calibration data will be propagated through the network in
+        mini-batches of the specified size. The ``None`` value means
+        that all samples will be propagated at once.
+        Defaults to ``None``.
+
+    Returns
+    -------
+    dict
+        Quantized network.
+
+    Examples
+    --------
+    >>> from neupy import storage, runtime, quantization
+    >>>
+    >>> data = storage.save_dict(network)
+    >>> quantized_data = quantization.quantize(data, x_train[:1000])
+    >>> quantization.quantization_report(data, quantized_data, x_test)
+    {'max_absolute_error': 0.012, 'mean_absolute_error': 0.0007, ...}
+    >>>
+    >>> runtime.write_hdf5(quantized_data, '/path/to/network.hdf5')
+    >>> plan = runtime.load_hdf5('/path/to/network.hdf5')
+    """
+    batch_size = kwargs.pop('batch_size', None)
+
+    # We require do to this check for python 2 compatibility
+    if kwargs:
+        raise TypeError("Unknown arguments: {}".format(kwargs))
+
+    plan = ExecutionPlan(data)
+
+    if len(calibration_inputs) != len(plan.input_layers):
+        raise ValueError(
+            "Network has {} inputs, but {} inputs was provided for the "
+            "calibration".format(
+                len(plan.input_layers), len(calibration_inputs)))
+
+    max_values = calibrate(plan, calibration_inputs, batch_size)
+    float_type = plan.dtype
+
+    quantized_data = copy.copy(data)
+    quantized_data['metadata'] = dict(
+        data.get('metadata', {}), quantization='int8')
+    quantized_data['layers'] = []
+
+    for layer in data['layers']:
+        if layer['name'] not in max_values:
+            quantized_data['layers'].append(layer)
+            continue
+
+        parameters = dict(layer['parameters'])
+        weight, weight_scale = quantize_weight(parameters['weight']['value'])
+        input_scale = symmetric_scale(max_values[layer['name']])
+
+        parameters.update(
+            weight={'value': weight, 'trainable': False},
+            weight_scale={
+                'value': weight_scale.astype(float_type),
+                'trainable': False,
+            },
+            input_scale={
+                'value': input_scale.astype(float_type),
+                'trainable': False,
+            },
+        )
+        quantized_data['layers'].append(dict(layer, parameters=parameters))
+
+    return quantized_data
+
+
+def parameters_size(plan):
+    return sum(
+        parameter.nbytes
+        for _, operation, _ in plan.operations
+        for parameter in operation.parameters.values())
+
+
+def quantization_report(data, quantized_data, *inputs, **kwargs):
+    """
+    Compares predictions from the original and quantized networks.
+    Network should have single output.
+
+    Parameters
+    ----------
+    data : dict
+        Original network stored in the dictionary.
+
+    quantized_data : dict
+        Quantized network stored in the dictionary.
+
+    *inputs : array-like
+        Input samples.
+
+    target : array-like or None
+        Expected classes or one-hot encoded classes per each input
+        sample. Accuracy for both networks will be reported when
+        target specified. Defaults to ``None``.
+
+    batch_size : int or None
+        Size of the mini-batch for the predictions. The ``None`` value
+        means that all samples will be propagated at once.
+        Defaults to ``None``.
+
+    Returns
+    -------
+    dict
+        Report has the following keys.
+
+        - ``max_absolute_error`` and ``mean_absolute_error`` - Errors
+          between outputs from the original and quantized networks.
+
+        - ``agreement`` - Fraction of samples for which both networks
+          predict the same class. Reported only for the networks
+          that have 2-dimensional output with multiple classes.
+
+        - ``accuracy`` and ``quantized_accuracy`` - Accuracy of the
+          original and quantized networks. Reported only when
+          ``target`` specified.
+
+        - ``parameters_size`` and ``quantized_parameters_size`` -
+          Number of bytes that parameters take in the memory.
+    """
+    target = kwargs.pop('target', None)
+    batch_size = kwargs.pop('batch_size', None)
+
+    # We require do to this check for python 2 compatibility
+    if kwargs:
+        raise TypeError("Unknown arguments: {}".format(kwargs))
+
+    plan = ExecutionPlan(data)
+    quantized_plan = ExecutionPlan(quantized_data)
+
+    if len(plan.output_layers) != 1:
+        raise ValueError(
+            "Report can be generated only for the network with single "
+            "output, got network with {} outputs"
+            "".format(len(plan.output_layers)))
+
+    output = plan.predict(*inputs, batch_size=batch_size)
+    quantized_output = quantized_plan.predict(*inputs, batch_size=batch_size)
+    absolute_error = np.abs(output - quantized_output)
+
+    report = {
+        'max_absolute_error': float(absolute_error.max()),
+        'mean_absolute_error': float(absolute_error.mean()),
+        'parameters_size': parameters_size(plan),
+        'quantized_parameters_size': parameters_size(quantized_plan),
+    }
+
+    if output.ndim == 2 and output.shape[1] > 1:
+        predicted_classes = output.argmax(axis=1)
+        quantized_predicted_classes = quantized_output.argmax(axis=1)
+
+        report['agreement'] = float(np.mean(
+            predicted_classes == quantized_predicted_classes))
+
+        if target is not None:
+            target = np.asarray(target)
+
+            if target.ndim == 2:
+                target = target.argmax(axis=1)
+
+            report['accuracy'] = float(np.mean(predicted_classes == target))
+            report['quantized_accuracy'] = float(np.mean(
+                quantized_predicted_classes == target))
+
+    return report
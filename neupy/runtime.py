@@ -0,0 +1,1044 @@
+import copy
+import json
+from collections import OrderedDict
+
+import six
+import h5py
+import numpy as np
+from scipy import sparse
+from numpy.lib.stride_tricks import as_strided
+from six.moves import cPickle as pickle
+
+
+__all__ = (
+    'ExecutionPlan', 'compile_network',
+    'load_dict', 'load_pickle', 'load_json', 'load_hdf5',
+    'read_pickle', 'read_json', 'read_hdf5',
+    'write_pickle', 'write_json', 'write_hdf5',
+)
+
+
+# Maximum number of the quantized weight values that can be converted
+# to floats at once. Block of this size fits into the CPU cache.
+DEQUANTIZED_BLOCK_SIZE = 2 ** 16
+
+
+def read_pickle(filepath):
+    """
+    Reads network's data stored in the pickle file.
+    """
+    with open(filepath, 'rb') as f:
+        # Specify encoding for python 3 in order to be able to
+        # read files that has been created in python 2
+        options = {'encoding': 'latin1'} if six.PY3 else {}
+        return pickle.load(f, **options)
+
+
+def read_json(filepath):
+    """
+    Reads network's data stored in the JSON file.
+    """
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
+def read_hdf5(filepath):
+    """
+    Reads network's data stored in the HDF5 file.
+    """
+    data = {}
+
+    with h5py.File(filepath, mode='r') as f:
+        data['metadata'] = json.loads(f.attrs['metadata'])
+        data['graph'] = json.loads(f.attrs['graph'])
+        data['layers'] = []
+
+        layer_names = json.loads(f.attrs['layer_names'])
+
+        for layer_name in layer_names:
+            layer_group = f[layer_name]
+            layer = {'name': layer_name}
+
+            for attrname, attrvalue in layer_group.attrs.items():
+                try:
+                    layer[attrname] = json.loads(attrvalue)
+                except ValueError:
+                    layer[attrname] = attrvalue
+
+            layer['parameters'] = {}
+            for param_name, parameter in layer_group.items():
+                layer['parameters'][param_name] = {
+                    'value': parameter[()],
+                    'trainable': parameter.attrs['trainable'],
+                }
+
+            data['layers'].append(layer)
+
+    return data
+
+
+def write_pickle(data, filepath, python_compatible=False):
+    """
+    Writes network's data into the pickle file.
+
+    Parameters
+    ----------
+    data : dict
+        Network stored in the dictionary.
+
+    filepath : str
+        Path to the pickle file.
+
+    python_compatible : bool
+        If `True` pickled object would be compatible with
+        Python 2 and 3 (pickle protocol equal to `2`).
+        If `False` then value would be pickled as highest
+        protocol (`pickle.HIGHEST_PROTOCOL`).
+        Defaults to `False`.
+    """
+    with open(filepath, 'wb+') as f:
+        # Protocol 2 is compatible for both python versions
+        protocol = pickle.HIGHEST_PROTOCOL if not python_compatible else 2
+        pickle.dump(data, f, protocol)
+
+
+def convert_numpy_array_to_list_recursively(data):
+    for key, value in data.items():
+        if isinstance(value, dict):
+            convert_numpy_array_to_list_recursively(value)
+
+        elif isinstance(value, np.ndarray):
+            data[key] = value.tolist()
+
+        elif isinstance(value, list):
+            for entity in value:
+                if isinstance(entity, dict):
+                    convert_numpy_array_to_list_recursively(entity)
+
+
+def write_json(data, filepath, indent=None):
+    """
+    Writes network's data into the JSON file.
+
+    Parameters
+    ----------
+    data : dict
+        Network stored in the dictionary.
+
+    filepath : str
+        Path to the JSON file.
+
+    indent : int or None
+        Indentation that would be specified for the output JSON.
+        Intentation equal to `2` or `4` makes it easy to read raw
+        text files. The `None` value disables indentation which means
+        that everything will be stored compactly. Defaults to `None`.
+    """
+    # Arrays will be replaced with lists and we
+    # don't want to modify data in-place
+    data = copy.deepcopy(data)
+
+    with open(filepath, 'w') as f:
+        # Without extra data processor we won't be able to dump
+        # numpy array into json without raising an error.
+        # `json` will have issues with numpy array encoding
+        convert_numpy_array_to_list_recursively(data)
+        return json.dump(data, f, indent=indent, default=repr)
+
+
+def write_hdf5(data, filepath):
+    """
+    Writes network's data into the HDF5 file.
+
+    Parameters
+    ----------
+    data : dict
+        Network stored in the dictionary.
+
+    filepath : str
+        Path to the HDF5 file.
+    """
+    with h5py.File(filepath, mode='w') as f:
+        layer_names = []
+
+        for layer in data['layers']:
+            layer_name = layer['name']
+            layer_group = f.create_group(layer_name)
+
+            for attrname, attrvalue in layer.items():
+                if attrname != 'parameters':
+                    layer_group.attrs[attrname] = json.dumps(
+                        attrvalue, default=repr)
+
+            for param_name, param in layer['parameters'].items():
+                dataset = layer_group.create_dataset(
+                    param_name, data=param['value'])
+
+                dataset.attrs['trainable'] = param['trainable']
+
+            layer_names.append(layer_name)
+
+        f.attrs['metadata'] = json.dumps(data['metadata'])
+        f.attrs['graph'] = json.dumps(data['graph'])
+        f.attrs['layer_names'] = json.dumps(layer_names)
+
+
+def output_size_and_padding(size, filter_size, padding, stride, dilation=1):
+    """
+    Computes size of the output and padding that has to be added
+    before and after spatial dimension of the input.
+
+    Returns
+    -------
+    tuple
+        Output size, padding before and padding after the input.
+    """
+    filter_size = (filter_size - 1) * dilation + 1
+
+    if padding == 'SAME':
+        output_size = (size + stride - 1) // stride
+        n_padded = max((output_size - 1) * stride + filter_size - size, 0)
+        return output_size, n_padded // 2, n_padded - n_padded // 2
+
+    if padding == 'VALID':
+        padding = 0
+
+    output_size = (size + 2 * padding - filter_size) // stride + 1
+    return output_size, padding, padding
+
+
+def sliding_windows(padded_input, filter_size, stride, dilation, output_size):
+    """
+    Creates read-only view of the 4D input that has all windows of the
+    specified size. Output has shape ``(n_samples, output_rows,
+    output_cols, filter_rows, filter_cols, n_channels)``.
+    """
+    n_samples, _, _, n_channels = padded_input.shape
+    sample_stride, row_stride, col_stride, channel_stride = (
+        padded_input.strides)
+
+    return as_strided(
+        padded_input,
+        shape=(n_samples,) + output_size + filter_size + (n_channels,),
+        strides=(
+            sample_stride,
+            row_stride * stride[0],
+            col_stride * stride[1],
+            row_stride * dilation[0],
+            col_stride * dilation[1],
+            channel_stride,
+        ),
+        writeable=False,
+    )
+
+
+def as_parameter(name, value, dtype):
+    """
+    Converts stored parameter to the array. Integer parameters store
+    either indices of the sparse weight or quantized values and
+    quantized values are always converted to 8-bit integers.
+    """
+    value = np.asarray(value)
+
+    if np.issubdtype(value.dtype, np.integer):
+        if name in ('weight_indices', 'weight_indptr', 'weight_shape'):
+            return np.ascontiguousarray(value, dtype=np.int32)
+
+        return np.ascontiguousarray(value, dtype=np.int8)
+
+    return np.ascontiguousarray(value, dtype=dtype)
+
+
+class Operation(object):
+    """
+    Base class for the operations that apply layer's transformation
+    during the inference. Operations store all intermediate results in
+    the buffers that get allocated once per each shape of the input.
+
+    Parameters
+    ----------
+    configs : dict
+        Layer's configurations.
+
+    parameters : dict
+        Layer's parameters as arrays.
+
+    dtype : numpy dtype
+        Data type of the outputs and parameters.
+
+    Attributes
+    ----------
+    buffers : dict
+        Preallocated arrays.
+    """
+    def __init__(self, configs, parameters, dtype):
+        self.configs = configs
+        self.parameters = parameters
+        self.dtype = dtype
+        self.buffers = {}
+
+    @property
+    def is_quantized(self):
+        return 'input_scale' in self.parameters
+
+    def buffer(self, name, shape, fill_value=None):
+        """
+        Returns preallocated array with specified shape. Array gets
+        allocated during the first call and arrays filled with the
+        ``fill_value`` never change values that were filled in.
+        """
+        key = (name, tuple(shape))
+
+        if key not in self.buffers:
+            if fill_value is None:
+                self.buffers[key] = np.empty(shape, dtype=self.dtype)
+            else:
+                self.buffers[key] = np.full(
+                    shape, fill_value, dtype=self.dtype)
+
+        return self.buffers[key]
+
+    def pad(self, input, padding, fill_value=0):
+        """
+        Pads rows and columns of the 4D input. Padding has to be
+        specified as a pair of paddings per each spatial dimension.
+        """
+        if not any(pad for pads in padding for pad in pads):
+            return input
+
+        (top, bottom), (left, right) = padding
+        n_samples, n_rows, n_cols, n_channels = input.shape
+
+        padded_input = self.buffer('padded-input', (
+            n_samples,
+            n_rows + top + bottom,
+            n_cols + left + right,
+            n_channels,
+        ), fill_value=fill_value)
+
+        padded_input[:, top:top + n_rows, left:left + n_cols] = input
+        return padded_input
+
+    def quantize(self, input):
+        """
+        Quantizes input to the 8-bit integers using scale found during
+        the calibration. Integers are stored as floats, since NumPy
+        can use BLAS only for the floats.
+        """
+        quantized_input = self.buffer('quantized-input', input.shape)
+
+        np.divide(input, self.parameters['input_scale'], out=quantized_input)
+        np.rint(quantized_input, out=quantized_input)
+        np.clip(quantized_input, -127, 127, out=quantized_input)
+
+        return quantized_input
+
+    def dequantize(self, output):
+        """
+        Converts product between quantized input and quantized
+        weight to the original scale.
+        """
+        output *= self.parameters['input_scale']
+        output *= self.parameters['weight_scale']
+
+    def quantized_dot(self, input, weight, output):
+        """
+        Multiplies quantized 2D input by the 8-bit integer weight and
+        stores result in the 2D output. Weight gets converted to floats
+        in blocks of columns, which means that weight never gets fully
+        copied and memory required for the conversion doesn't depend
+        on the size of the weight.
+        """
+        n_inputs, n_outputs = weight.shape
+        n_samples = input.shape[0]
+        block_size = max(1, DEQUANTIZED_BLOCK_SIZE // n_inputs)
+
+        for start in range(0, n_outputs, block_size):
+            end = min(start + block_size, n_outputs)
+
+            weight_block = self.buffer('weight-block', (n_inputs, end - start))
+            np.copyto(weight_block, weight[:, start:end])
+
+            if end - start == n_outputs:
+                np.dot(input, weight_block, out=output)
+                continue
+
+            # Output for the block has to be stored in the separate
+            # array, since columns of the output are not contiguous
+            output_block = self.buffer(
+                'output-block', (n_samples, end - start))
+            np.dot(input, weight_block, out=output_block)
+            output[:, start:end] = output_block
+
+        return output
+
+    def output(self, *inputs):
+        raise NotImplementedError()
+
+
+class IdentityOperation(Operation):
+    def output(self, input):
+        return input
+
+
+class LinearOperation(Operation):
+    def __init__(self, *args, **kwargs):
+        super(LinearOperation, self).__init__(*args, **kwargs)
+        self.weight = self.parameters.get('weight')
+        self.bias = self.parameters.get('bias')
+
+        if self.is_sparse:
+            self.weight = sparse.csr_matrix(
+                (
+                    self.parameters['weight_data'],
+                    self.parameters['weight_indices'],
+                    self.parameters['weight_indptr'],
+                ),
+                shape=tuple(self.parameters['weight_shape']),
+            )
+
+    @property
+    def is_sparse(self):
+        return 'weight_indptr' in self.parameters
+
+    def activation_function(self, value):
+        # Activation function modifies value in-place
+        pass
+
+    def output(self, input):
+        if self.weight is None:
+            output = self.buffer('output', input.shape)
+            np.copyto(output, input)
+
+        else:
+            n_samples = input.shape[0]
+            n_units = self.weight.shape[0 if self.is_sparse else 1]
+
+            output = self.buffer('output', (n_samples, n_units))
+
+            if self.is_sparse:
+                # Weight stored transposed, which means that each row
+                # has non-zero weights of a single output unit
+                np.copyto(output, self.weight.dot(input.T).T)
+
+            elif not self.is_quantized:
+                np.dot(input, self.weight, out=output)
+
+            else:
+                # Weights stay in memory as 8-bit integers and
+                # they're converted only for the multiplication
+                self.quantized_dot(self.quantize(input), self.weight, output)
+                self.dequantize(output)
+
+            if self.bias is not None:
+                output += self.bias
+
+        self.activation_function(output)
+        return output
+
+
+class SigmoidOperation(LinearOperation):
+    def activation_function(self, value):
+        with np.errstate(over='ignore'):
+            np.negative(value, out=value)
+            np.exp(value, out=value)
+
+        value += 1
+        np.reciprocal(value, out=value)
+
+
+class HardSigmoidOperation(LinearOperation):
+    def activation_function(self, value):
+        value *= 0.2
+        value += 0.5
+        np.clip(value, 0, 1, out=value)
+
+
+class TanhOperation(LinearOperation):
+    def activation_function(self, value):
+        np.tanh(value, out=value)
+
+
+class ReluOperation(LinearOperation):
+    def activation_function(self, value):
+        alpha = self.configs.get('alpha', 0)
+
+        if alpha == 0:
+            np.maximum(value, 0, out=value)
+        else:
+            value[value < 0] *= alpha
+
+
+class LeakyReluOperation(LinearOperation):
+    def activation_function(self, value):
+        value[value < 0] *= 0.01
+
+
+class SoftplusOperation(LinearOperation):
+    def activation_function(self, value):
+        np.logaddexp(0, value, out=value)
+
+
+class SoftmaxOperation(LinearOperation):
+    def activation_function(self, value):
+        value -= value.max(axis=-1, keepdims=True)
+        np.exp(value, out=value)
+        value /= value.sum(axis=-1, keepdims=True)
+
+
+class EluOperation(LinearOperation):
+    def activation_function(self, value):
+        negative = value < 0
+        value[negative] = np.expm1(value[negative])
+
+
+class PReluOperation(LinearOperation):
+    def activation_function(self, value):
+        alpha = self.parameters['alpha']
+        alpha_shape = [1] * value.ndim
+
+        for axis, dimension in zip(self.configs['alpha_axes'], alpha.shape):
+            alpha_shape[axis % value.ndim] = dimension
+
+        negative_part = self.buffer('negative-part', value.shape)
+        np.minimum(value, 0, out=negative_part)
+        negative_part *= alpha.reshape(alpha_shape)
+
+        np.maximum(value, 0, out=value)
+        value += negative_part
+
+
+class ConvolutionOperation(Operation):
+    def __init__(self, *args, **kwargs):
+        super(ConvolutionOperation, self).__init__(*args, **kwargs)
+
+        weight = self.parameters['weight']
+        self.filter_size = weight.shape[:2]
+        self.n_filters = weight.shape[-1]
+        self.weight_matrix = weight.reshape((-1, self.n_filters))
+        self.bias = self.parameters.get('bias')
+
+    def output(self, input):
+        padding = self.configs['padding']
+        stride = tuple(self.configs['stride'])
+        dilation = tuple(self.configs['dilation'])
+
+        if isinstance(padding, six.string_types):
+            padding = (padding, padding)
+
+        if self.is_quantized:
+            input = self.quantize(input)
+
+        n_samples, n_rows, n_cols, n_channels = input.shape
+        rows, top, bottom = output_size_and_padding(
+            n_rows, self.filter_size[0], padding[0], stride[0], dilation[0])
+        cols, left, right = output_size_and_padding(
+            n_cols, self.filter_size[1], padding[1], stride[1], dilation[1])
+
+        padded_input = self.pad(input, ((top, bottom), (left, right)))
+        windows = sliding_windows(
+            padded_input, self.filter_size, stride, dilation, (rows, cols))
+
+        # Windows get copied into the matrix, so that convolution
+        # can be computed using single matrix multiplication
+        columns = self.buffer('columns', windows.shape)
+        np.copyto(columns, windows)
+
+        output = self.buffer('output', (n_samples, rows, cols, self.n_filters))
+        columns = columns.reshape((-1, self.weight_matrix.shape[0]))
+        output_matrix = output.reshape((-1, self.n_filters))
+
+        if self.is_quantized:
+            # Quantized weights stay in memory as 8-bit integers
+            self.quantized_dot(columns, self.weight_matrix, output_matrix)
+            self.dequantize(output)
+        else:
+            np.dot(columns, self.weight_matrix, out=output_matrix)
+
+        if self.bias is not None:
+            output += self.bias
+
+        return output
+
+
+class PoolingOperation(Operation):
+    pooling_type = None
+
+    def output(self, input):
+        size = tuple(self.configs['size'])
+        stride = tuple(self.configs['stride'] or size)
+        padding = self.configs['padding'].upper()
+
+        n_samples, n_rows, n_cols, n_channels = input.shape
+        rows, top, bottom = output_size_and_padding(
+            n_rows, size[0], padding, stride[0])
+        cols, left, right = output_size_and_padding(
+            n_cols, size[1], padding, stride[1])
+
+        fill_value = -np.inf if self.pooling_type == 'MAX' else 0
+        padded_input = self.pad(
+            input, ((top, bottom), (left, right)), fill_value)
+        windows = sliding_windows(
+            padded_input, size, stride, (1, 1), (rows, cols))
+
+        output = self.buffer('output', (n_samples, rows, cols, n_channels))
+
+        if self.pooling_type == 'MAX':
+            return np.max(windows, axis=(3, 4), out=output)
+
+        np.sum(windows, axis=(3, 4), out=output)
+
+        # Average doesn't include padded values
+        row_starts = np.arange(rows) * stride[0] - top
+        col_starts = np.arange(cols) * stride[1] - left
+        row_counts = (
+            np.minimum(row_starts + size[0], n_rows) -
+            np.maximum(row_starts, 0))
+        col_counts = (
+            np.minimum(col_starts + size[1], n_cols) -
+            np.maximum(col_starts, 0))
+
+        output /= np.outer(row_counts, col_counts)[None, :, :, None]
+        return output
+
+
+class MaxPoolingOperation(PoolingOperation):
+    pooling_type = 'MAX'
+
+
+class AveragePoolingOperation(PoolingOperation):
+    pooling_type = 'AVG'
+
+
+class GlobalPoolingOperation(Operation):
+    functions = {'avg': np.mean, 'max': np.max, 'sum': np.sum}
+
+    def __init__(self, *args, **kwargs):
+        super(GlobalPoolingOperation, self).__init__(*args, **kwargs)
+        function = self.configs['function']
+
+        if function not in self.functions:
+            raise ValueError(
+                "Global pooling supports only {} functions, got {!r}"
+                "".format(', '.join(self.functions), function))
+
+        self.function = self.functions[function]
+
+    def output(self, input):
+        if input.ndim == 2:
+            return input
+
+        output = self.buffer('output', (input.shape[0], input.shape[-1]))
+        return self.function(
+            input, axis=tuple(range(1, input.ndim - 1)), out=output)
+
+
+class UpscaleOperation(Operation):
+    def output(self, input):
+        row_scale, col_scale = self.configs['scale']
+        n_samples, n_rows, n_cols, n_channels = input.shape
+
+        output = self.buffer('output', (
+            n_samples, n_rows * row_scale, n_cols * col_scale, n_channels))
+
+        scaled_output = output.reshape((
+            n_samples, n_rows, row_scale, n_cols, col_scale, n_channels))
+        scaled_output[...] = input[:, :, None, :, None, :]
+
+        return output
+
+
+class BatchNormOperation(Operation):
+    def __init__(self, *args, **kwargs):
+        super(BatchNormOperation, self).__init__(*args, **kwargs)
+        parameters = self.parameters
+
+        self.scale = parameters['gamma'] * parameters['running_inv_std']
+        self.shift = (
+            parameters['beta'] - parameters['running_mean'] * self.scale)
+
+    def output(self, input):
+        output = self.buffer('output', input.shape)
+        np.multiply(input, self.scale, out=output)
+        output += self.shift
+        return output
+
+
+class EmbeddingOperation(Operation):
+    def __init__(self, *args, **kwargs):
+        super(EmbeddingOperation, self).__init__(*args, **kwargs)
+        parameters = self.parameters
+
+        if 'weight' in parameters:
+            self.weight = parameters['weight']
+
+        else:
+            n_partitions = self.configs['n_partitions']
+            self.weight = np.concatenate([
+                parameters['weight_part_{}'.format(index)]
+                for index in range(n_partitions)
+            ])
+
+    def output(self, input):
+        indices = input.astype(np.intp)
+        output = self.buffer(
+            'output', indices.shape + self.weight.shape[1:])
+
+        return np.take(self.weight, indices, axis=0, out=output)
+
+
+class ReshapeOperation(Operation):
+    def output(self, input):
+        return input.reshape((input.shape[0],) + tuple(self.configs['shape']))
+
+
+class TransposeOperation(Operation):
+    def output(self, input):
+        return np.transpose(input, self.configs['perm'])
+
+
+class ConcatenateOperation(Operation):
+    def output(self, *inputs):
+        axis = self.configs['axis']
+        output_shape = list(inputs[0].shape)
+        output_shape[axis] = sum(input.shape[axis] for input in inputs)
+
+        output = self.buffer('output', output_shape)
+        return np.concatenate(inputs, axis=axis, out=output)
+
+
+class ElementwiseOperation(Operation):
+    functions = {'add': np.add, 'multiply': np.multiply}
+
+    def __init__(self, *args, **kwargs):
+        super(ElementwiseOperation, self).__init__(*args, **kwargs)
+        function = self.configs['merge_function']
+
+        if function not in self.functions:
+            raise ValueError(
+                "Elementwise layer supports only {} functions, got {!r}"
+                "".format(', '.join(self.functions), function))
+
+        self.function = self.functions[function]
+
+    def output(self, *inputs):
+        output = self.buffer('output', np.broadcast(*inputs).shape)
+        self.function(inputs[0], inputs[1], out=output)
+
+        for input in inputs[2:]:
+            self.function(output, input, out=output)
+
+        return output
+
+
+operations = {
+    'Input': IdentityOperation,
+    'Identity': IdentityOperation,
+    'Dropout': IdentityOperation,
+    'GaussianNoise': IdentityOperation,
+    'DropBlock': IdentityOperation,
+
+    'Linear': LinearOperation,
+    'Sigmoid': SigmoidOperation,
+    'HardSigmoid': HardSigmoidOperation,
+    'Tanh': TanhOperation,
+    'Relu': ReluOperation,
+    'LeakyRelu': LeakyReluOperation,
+    'Softplus': SoftplusOperation,
+    'Softmax': SoftmaxOperation,
+    'Elu': EluOperation,
+    'PRelu': PReluOperation,
+
+    'Convolution': ConvolutionOperation,
+    'MaxPooling': MaxPoolingOperation,
+    'AveragePooling': AveragePoolingOperation,
+    'GlobalPooling': GlobalPoolingOperation,
+    'Upscale': UpscaleOperation,
+
+    'BatchNorm': BatchNormOperation,
+    'Embedding': EmbeddingOperation,
+    'Reshape': ReshapeOperation,
+    'Transpose': TransposeOperation,
+    'Concatenate': ConcatenateOperation,
+    'Elementwise': ElementwiseOperation,
+}
+
+
+class ExecutionPlan(object):
+    """
+    Propagates inputs through the trained network using only NumPy
+    operations. Plan doesn't require Tensorflow, which makes it
+    suitable for the fast inference with small networks, since it
+    avoids overhead of the Tensorflow's import and session calls.
+
+    Every layer gets compiled into the operation that stores its
+    intermediate results in the preallocated buffers. Buffers are
+    allocated once per each shape of the inputs, which means that
+    there are no allocations for the repeated calls with the same
+    batch size.
+
+    Plan supports the following layers: :layer:`Input`,
+    :layer:`Identity`, :layer:`Linear` and layers with activation
+    functions, :layer:`Convolution`, :layer:`MaxPooling`,
+    :layer:`AveragePooling`, :layer:`GlobalPooling`, :layer:`Upscale`,
+    :layer:`BatchNorm`, :layer:`Embedding`, :layer:`Reshape`,
+    :layer:`Transpose`, :layer:`Concatenate` and :layer:`Elementwise`.
+    Stochastic layers pass inputs without changes. Plan can also run
+    quantized :layer:`Linear` and :layer:`Convolution` layers produced
+    by the :func:`quantize <neupy.quantization.quantize>` function and
+    :layer:`Linear` layers with sparse weights produced by the
+    :func:`sparsify <neupy.pruning.sparsify>` function.
+
+    Parameters
+    ----------
+    data : dict
+        Network stored in the dictionary. Learn more about the format
+        from the :func:`save_dict <neupy.storage.save_dict>` function.
+
+    dtype : str or numpy dtype
+        Data type of the parameters and outputs. Defaults to
+        ``float32``.
+
+    Attributes
+    ----------
+    input_layers : list of str
+        Names of the input layers.
+
+    output_layers : list of str
+        Names of the output layers.
+
+    operations : list
+        Operations per each layer in topological order. Each element
+        is a tuple that has name of the layer, operation and names of
+        the input layers.
+
+    Methods
+    -------
+    predict(*inputs, batch_size=None)
+        Propagates inputs through the network and returns output
+        from the network.
+
+    Examples
+    --------
+    >>> from neupy import runtime
+    >>> plan = runtime.load_hdf5('/path/to/network.hdf5')
+    >>> plan.predict(x_test)
+    """
+    def __init__(self, data, dtype='float32'):
+        self.dtype = np.dtype(dtype)
+
+        graph = OrderedDict(
+            (layer_name, list(next_layers))
+            for layer_name, next_layers in data['graph'])
+
+        # Order of the inputs defined by the order of the
+        # layers in the graph
+        self.backward_graph = OrderedDict(
+            (layer_name, []) for layer_name in graph)
+
+        for layer_name, next_layers in graph.items():
+            for next_layer in next_layers:
+                self.backward_graph[next_layer].append(layer_name)
+
+        self.input_layers = [
+            layer_name for layer_name, prev_layers
+            in self.backward_graph.items() if not prev_layers]
+
+        self.output_layers = [
+            layer_name for layer_name, next_layers
+            in graph.items() if not next_layers]
+
+        self.operations = []
+
+        # Layers stored in topological order
+        for layer in data['layers']:
+            class_name = layer['class_name']
+
+            if class_name not in operations:
+                raise ValueError(
+                    "Layer `{}` cannot be compiled, because `{}` layers "
+                    "are not supported".format(layer['name'], class_name))
+
+            parameters = dict(
+                (name, as_parameter(name, parameter['value'], self.dtype))
+                for name, parameter in layer['parameters'].items())
+
+            operation = operations[class_name](
+                layer.get('configs', {}), parameters, self.dtype)
+
+            self.operations.append((
+                layer['name'],
+                operation,
+                self.backward_graph[layer['name']],
+            ))
+
+    def propagate_forward(self, inputs):
+        """
+        Propagates inputs through the network and returns outputs from
+        all layers. Outputs are stored in the buffers, which means that
+        the next call will overwrite them.
+        """
+        outputs = dict(zip(self.input_layers, inputs))
+
+        for layer_name, operation, input_layers in self.operations:
+            if layer_name in self.input_layers:
+                layer_inputs = [outputs[layer_name]]
+            else:
+                layer_inputs = [outputs[name] for name in input_layers]
+
+            outputs[layer_name] = operation.output(*layer_inputs)
+
+        return outputs
+
+    def predict_batch(self, inputs):
+        outputs = self.propagate_forward(inputs)
+
+        # Outputs have to be copied, since they're stored
+        # in the buffers and the next call will overwrite them
+        return [np.array(outputs[name]) for name in self.output_layers]
+
+    def predict(self, *inputs, **kwargs):
+        batch_size = kwargs.pop('batch_size', None)
+
+        # We require do to this check for python 2 compatibility
+        if kwargs:
+            raise TypeError("Unknown arguments: {}".format(kwargs))
+
+        if len(inputs) != len(self.input_layers):
+            raise ValueError(
+                "Network has {} inputs, but {} inputs was provided"
+                "".format(len(self.input_layers), len(inputs)))
+
+        inputs = [np.asarray(input, dtype=self.dtype) for input in inputs]
+        n_samples = inputs[0].shape[0]
+
+        if batch_size is None or batch_size >= n_samples:
+            outputs = self.predict_batch(inputs)
+
+        else:
+            batch_outputs = []
+
+            for start in range(0, n_samples, batch_size):
+                batch_outputs.append(self.predict_batch([
+                    input[start:start + batch_size] for input in inputs]))
+
+            outputs = [
+                np.concatenate(output, axis=0)
+                for output in zip(*batch_outputs)]
+
+        if len(outputs) == 1:
+            return outputs[0]
+
+        return outputs
+
+
+def load_dict(data, dtype='float32'):
+    """
+    Compiles network stored in the dictionary into the execution plan.
+
+    Parameters
+    ----------
+    data : dict
+        Network stored in the dictionary.
+
+    dtype : str or numpy dtype
+        Data type of the parameters and outputs. Defaults to
+        ``float32``.
+
+    Returns
+    -------
+    ExecutionPlan
+    """
+    return ExecutionPlan(data, dtype)
+
+
+def load_pickle(filepath, dtype='float32'):
+    """
+    Compiles network stored in the pickle file into the execution plan.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file that stores network.
+
+    dtype : str or numpy dtype
+        Data type of the parameters and outputs. Defaults to
+        ``float32``.
+
+    Returns
+    -------
+    ExecutionPlan
+    """
+    return ExecutionPlan(read_pickle(filepath), dtype)
+
+
+def load_json(filepath, dtype='float32'):
+    """
+    Compiles network stored in the JSON file into the execution plan.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file that stores network.
+
+    dtype : str or numpy dtype
+        Data type of the parameters and outputs. Defaults to
+        ``float32``.
+
+    Returns
+    -------
+    ExecutionPlan
+    """
+    return ExecutionPlan(read_json(filepath), dtype)
+
+
+def load_hdf5(filepath, dtype='float32'):
+    """
+    Compiles network stored in the HDF5 file into the execution plan.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file that stores network.
+
+    dtype : str or numpy dtype
+        Data type of the parameters and outputs. Defaults to
+        ``float32``.
+
+    Returns
+    -------
+    ExecutionPlan
+    """
+    return ExecutionPlan(read_hdf5(filepath), dtype)
+
+
+def compile_network(network, dtype='float32'):
+    """
+    Compiles network into the execution plan. Unlike the other functions
+    from the module, function requires Tensorflow in order to extract
+    parameters from the network.
+
+    Parameters
+    ----------
+    network : network or optimizer
+
+    dtype : str or numpy dtype
+        Data type of the parameters and outputs. Defaults to
+        ``float32``.
+
+    Returns
+    -------
+    ExecutionPlan
+
+    Examples
+    --------
+    >>> from neupy import runtime
+    >>> from neupy.layers import *
+    >>>
+    >>> network = Input(10) >> Relu(20) >> Softmax(4)
+    >>> plan = runtime.compile_network(network)
+    """
+    # Import happens here, because module has
+    # to be used without Tensorflow installed
+    from neupy import storage
+    return ExecutionPlan(storage.save_dict(network), dtype)
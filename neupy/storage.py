@@ -1,17 +1,18 @@
-import json
 from time import gmtime, strftime
 
-import six
-import h5py
 import numpy as np
 import tensorflow as tf
-from six.moves import cPickle as pickle
 
 import neupy
+from neupy import init
 from neupy.core.docs import shared_docs
 from neupy.layers.graph import LayerGraph
 from neupy.algorithms.base import BaseNetwork
 from neupy.utils import asfloat, tf_utils
+from neupy.runtime import (
+    read_pickle, read_json, read_hdf5,
+    write_pickle, write_json, write_hdf5,
+)
 
 
 __all__ = (
@@ -258,6 +259,26 @@ def load_dict(network, data, ignore_missing=False,
             load_dict_sequentially(layers_conn, layers_data)
 
 
+def get_layer_config(layer, option_name):
+    """
+    Returns layer's option in the format that can be restored without
+    the library. Options with predefined choices are stored using the
+    choice's name and initializers are stored as their representation.
+    """
+    value = getattr(layer, option_name)
+    option = layer.options[option_name].value
+
+    if isinstance(value, init.Initializer):
+        return repr(value)
+
+    if hasattr(option, 'choices') and not isinstance(value, np.ndarray):
+        for choice_name, choice in option.choices.items():
+            if choice is value:
+                return choice_name
+
+    return value
+
+
 def save_dict(network):
     """
     Save network into the dictionary.
@@ -314,7 +335,7 @@ def save_dict(network):
 
         for option_name in layer.options:
             if option_name not in parameters:
-                configs[option_name] = getattr(layer, option_name)
+                configs[option_name] = get_layer_config(layer, option_name)
 
         data['layers'].append({
             'class_name': layer.__class__.__name__,
@@ -353,12 +374,7 @@ def save_pickle(network, filepath, python_compatible=False):
     >>> storage.save_pickle(network, '/path/to/parameters.pickle')
     """
     network = extract_network(network)
-    data = save_dict(network)
-
-    with open(filepath, 'wb+') as f:
-        # Protocol 2 is compatible for both python versions
-        protocol = pickle.HIGHEST_PROTOCOL if not python_compatible else 2
-        pickle.dump(data, f, protocol)
+    write_pickle(save_dict(network), filepath, python_compatible)
 
 
 @shared_docs(load_dict)
@@ -393,13 +409,7 @@ def load_pickle(network, filepath, ignore_missing=False,
     >>> storage.load_pickle(network, '/path/to/parameters.pickle')
     """
     network = extract_network(network)
-
-    with open(filepath, 'rb') as f:
-        # Specify encoding for python 3 in order to be able to
-        # read files that has been created in python 2
-        options = {'encoding': 'latin1'} if six.PY3 else {}
-        data = pickle.load(f, **options)
-
+    data = read_pickle(filepath)
     load_dict(network, data, ignore_missing, load_by)
 
 
@@ -423,31 +433,7 @@ def save_hdf5(network, filepath):
     >>> storage.save_hdf5(network, '/path/to/parameters.hdf5')
     """
     network = extract_network(network)
-    data = save_dict(network)
-
-    with h5py.File(filepath, mode='w') as f:
-        layer_names = []
-
-        for layer in data['layers']:
-            layer_name = layer['name']
-            layer_group = f.create_group(layer_name)
-
-            for attrname, attrvalue in layer.items():
-                if attrname != 'parameters':
-                    layer_group.attrs[attrname] = json.dumps(
-                        attrvalue, default=repr)
-
-            for param_name, param in layer['parameters'].items():
-                dataset = layer_group.create_dataset(
-                    param_name, data=param['value'])
-
-                dataset.attrs['trainable'] = param['trainable']
-
-            layer_names.append(layer_name)
-
-        f.attrs['metadata'] = json.dumps(data['metadata'])
-        f.attrs['graph'] = json.dumps(data['graph'])
-        f.attrs['layer_names'] = json.dumps(layer_names)
+    write_hdf5(save_dict(network), filepath)
 
 
 @shared_docs(load_dict)
@@ -481,51 +467,10 @@ def load_hdf5(network, filepath, ignore_missing=False,
     >>> storage.load_hdf5(network, '/path/to/parameters.hdf5')
     """
     network = extract_network(network)
-    data = {}
-
-    with h5py.File(filepath, mode='r') as f:
-        data['metadata'] = json.loads(f.attrs['metadata'])
-        data['graph'] = json.loads(f.attrs['graph'])
-        data['layers'] = []
-
-        layer_names = json.loads(f.attrs['layer_names'])
-
-        for layer_name in layer_names:
-            layer_group = f[layer_name]
-            layer = {'name': layer_name}
-
-            for attrname, attrvalue in layer_group.attrs.items():
-                try:
-                    layer[attrname] = json.loads(attrvalue)
-                except ValueError:
-                    layer[attrname] = attrvalue
-
-            layer['parameters'] = {}
-            for param_name, parameter in layer_group.items():
-                layer['parameters'][param_name] = {
-                    'value': parameter.value,
-                    'trainable': parameter.attrs['trainable'],
-                }
-
-            data['layers'].append(layer)
-
+    data = read_hdf5(filepath)
     load_dict(network, data, ignore_missing, load_by)
 
 
-def convert_numpy_array_to_list_recursively(data):
-    for key, value in data.items():
-        if isinstance(value, dict):
-            convert_numpy_array_to_list_recursively(value)
-
-        elif isinstance(value, np.ndarray):
-            data[key] = value.tolist()
-
-        elif isinstance(value, list):
-            for entity in value:
-                if isinstance(entity, dict):
-                    convert_numpy_array_to_list_recursively(entity)
-
-
 @shared_docs(save_dict)
 def save_json(network, filepath, indent=None):
     """
@@ -552,14 +497,7 @@ def save_json(network, filepath, indent=None):
     >>> storage.save_json(network, '/path/to/parameters.json')
     """
     network = extract_network(network)
-    data = save_dict(network)
-
-    with open(filepath, 'w') as f:
-        # Without extra data processor we won't be able to dump
-        # numpy array into json without raising an error.
-        # `json` will have issues with numpy array encoding
-        convert_numpy_array_to_list_recursively(data)
-        return json.dump(data, f, indent=indent, default=repr)
+    write_json(save_dict(network), filepath, indent)
 
 
 @shared_docs(load_dict)
@@ -593,11 +531,7 @@ def load_json(network, filepath, ignore_missing=False,
     >>> storage.load_json(network, '/path/to/parameters.json')
     """
     network = extract_network(network)
-    data = save_dict(network)
-
-    with open(filepath, 'r') as f:
-        data = json.load(f)
-
+    data = read_json(filepath)
     load_dict(network, data, ignore_missing, load_by)
 
 
@@ -9,7 +9,7 @@ from neupy.utils.misc import as_tuple
 
 
 __all__ = (
-    'apply_batches', 'minibatches',
+    'apply_batches', 'minibatches', 'bucket_minibatches',
     'count_minibatches', 'count_samples',
 )
 
@@ -74,6 +74,58 @@ def minibatches(inputs, batch_size=None, shuffle=False):
         yield inputs
 
 
+def bucket_minibatches(inputs, lengths, batch_size=None, shuffle=False):
+    """
+    Iterates batch slices. Each mini-batch contains samples with
+    similar sequence lengths, which means that less computations
+    will be wasted on the padding.
+
+    Parameters
+    ----------
+    inputs : array-like, list
+
+    lengths : array-like
+        Sequence length per each sample.
+
+    batch_size : int
+        Mini-batch size. Number should be greater than ``0``.
+
+    shuffle : bool
+        Shuffles order of the mini-batches and order of the samples
+        that have the same length. Defaults to ``False``.
+
+    Yields
+    ------
+    object
+        Batch slices.
+    """
+    lengths = np.asarray(lengths).ravel()
+    n_samples = count_samples(inputs)
+    batch_size = n_samples if batch_size is None else batch_size
+    n_batches = count_minibatches(inputs, batch_size)
+
+    if len(lengths) != n_samples:
+        raise ValueError(
+            "Number of sequence lengths doesn't match number of samples. "
+            "Lengths: {}, Samples: {}".format(len(lengths), n_samples))
+
+    indices = np.arange(n_samples)
+
+    if shuffle:
+        np.random.shuffle(indices)
+
+    # Stable sort keeps random order for the samples with the same length
+    indices = indices[np.argsort(lengths[indices], kind='mergesort')]
+    batch_order = np.arange(n_batches)
+
+    if shuffle:
+        np.random.shuffle(batch_order)
+
+    for index in batch_order:
+        batch_slice = slice(index * batch_size, (index + 1) * batch_size)
+        yield apply_slices(inputs, indices[batch_slice])
+
+
 def average_batch_errors(errors, n_samples, batch_size):
     """
     Computes average error per sample. Function assumes that error from
@@ -1,9 +1,112 @@
+from functools import wraps
+from contextlib import contextmanager
+
 import numpy as np
 import tensorflow as tf
 from scipy.sparse import issparse
 
 
-__all__ = ('format_data', 'asfloat')
+__all__ = (
+    'format_data', 'asfloat',
+    'get_float_type', 'set_float_type', 'float_type',
+)
+
+
+FLOAT_TYPES = ('float16', 'float32', 'float64')
+# Stored in the list in order to be able to modify it
+# without global statement
+_float_type = ['float32']
+
+
+def get_float_type():
+    """
+    Returns name of the float type that will be used for all
+    variables, placeholders and data created by the library.
+
+    Returns
+    -------
+    str
+        Float type, for example ``float32``.
+    """
+    return _float_type[0]
+
+
+def set_float_type(dtype):
+    """
+    Sets float type that will be used for all variables, placeholders
+    and data created by the library. Type will be applied only to
+    the networks and algorithms that were created after the call.
+
+    Parameters
+    ----------
+    dtype : {``float16``, ``float32``, ``float64``}
+        Float type. For example, ``float16`` can be used in order to
+        reduce memory usage during the inference and ``float64``
+        might be useful for the algorithms that sensitive to
+        the numerical precision.
+
+    Raises
+    ------
+    ValueError
+        In case if float type isn't supported.
+
+    Examples
+    --------
+    >>> from neupy import utils
+    >>> utils.set_float_type('float64')
+    """
+    dtype = tf.as_dtype(dtype).name
+
+    if dtype not in FLOAT_TYPES:
+        raise ValueError(
+            "Unsupported float type {!r}, expected one of the following "
+            "types: {}".format(dtype, ', '.join(FLOAT_TYPES)))
+
+    _float_type[0] = dtype
+
+
+@contextmanager
+def float_type(dtype):
+    """
+    Context manager that sets float type only for the networks and
+    algorithms that were created inside of it. Layers, networks and
+    algorithms remember float type that was active during their
+    creation and they use it for their variables, placeholders and
+    operations even outside of the context.
+
+    Parameters
+    ----------
+    dtype : {``float16``, ``float32``, ``float64``}
+
+    Examples
+    --------
+    >>> from neupy import algorithms, layers, utils
+    >>>
+    >>> with utils.float_type('float64'):
+    ...     network = layers.Input(2) >> layers.Sigmoid(1)
+    ...     optimizer = algorithms.LevenbergMarquardt(network)
+    """
+    previous_dtype = get_float_type()
+    set_float_type(dtype)
+
+    try:
+        yield
+    finally:
+        set_float_type(previous_dtype)
+
+
+def float_type_scope(method):
+    """
+    Decorator that runs method with the float type stored in the
+    ``float_type`` attribute of the object.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with float_type(self.float_type):
+            if hasattr(method, '__self__'):  # check if method bounded
+                return method(*args, **kwargs)
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 def format_data(data, is_feature1d=True, copy=False, make_float=True):
@@ -59,7 +162,9 @@ def format_data(data, is_feature1d=True, copy=False, make_float=True):
 
 def asfloat(value):
     """
-    Convert variable to 32 bit float number.
+    Convert variable to float number. Type of the float number
+    specified with the :func:`set_float_type` function and
+    by default it's equal to ``float32``.
 
     Parameters
     ----------
@@ -69,21 +174,21 @@ def asfloat(value):
     Returns
     -------
     matrix, ndarray, Tensorfow variable or scalar
-        Output would be input value converted to 32 bit float.
+        Output would be input value converted to float.
     """
-    float_type = 'float32'
+    dtype = get_float_type()
 
     if isinstance(value, (np.matrix, np.ndarray)):
-        if value.dtype != np.dtype(float_type):
-            return value.astype(float_type)
+        if value.dtype != np.dtype(dtype):
+            return value.astype(dtype)
 
         return value
 
     elif isinstance(value, (tf.Tensor, tf.SparseTensor)):
-        return tf.cast(value, tf.float32)
+        return tf.cast(value, dtype)
 
     elif issparse(value):
         return value
 
-    float_x_type = np.cast[float_type]
+    float_x_type = np.cast[dtype]
     return float_x_type(value)
@@ -4,7 +4,7 @@ import numpy as np
 import tensorflow as tf
 
 from neupy.utils.misc import as_tuple
-from neupy.utils.processing import asfloat
+from neupy.utils.processing import asfloat, get_float_type
 
 
 __all__ = (
@@ -317,6 +317,6 @@ def create_variable(value, name, shape, trainable=True):
     return tf.Variable(
         asfloat(value),
         name=name,
-        dtype=tf.float32,
+        dtype=get_float_type(),
         trainable=trainable,
     )
@@ -1,3 +1,5 @@
+import tempfile
+
 import numpy as np
 
 from neupy import algorithms, init
@@ -100,3 +102,60 @@ class OjaTestCase(BaseTestCase):
                 target,
                 decimal=1
             )
+
+    def test_oja_mini_batches(self):
+        ojanet = algorithms.Oja(
+            minimized_data_size=1,
+            step=0.01,
+            batch_size=1,
+            weight=init.Constant(0.1),
+            verbose=False
+        )
+        ojanet.train(self.data, epochs=100)
+
+        minimized_data = ojanet.predict(self.data)
+        np.testing.assert_array_almost_equal(
+            np.abs(minimized_data), self.result, decimal=2)
+
+    def test_oja_partial_fit(self):
+        def data_chunks(n_passes):
+            for _ in range(n_passes):
+                yield self.data[:2]
+                yield self.data[2:]
+
+        ojanet = algorithms.Oja(
+            minimized_data_size=1,
+            step=0.01,
+            weight=init.Constant(0.1),
+            verbose=False
+        )
+        output = ojanet.partial_fit(data_chunks(n_passes=100))
+        self.assertIs(output, ojanet)
+        self.assertEqual(ojanet.n_updates_made, 200)
+
+        minimized_data = ojanet.predict(self.data)
+        np.testing.assert_array_almost_equal(
+            np.abs(minimized_data), self.result, decimal=2)
+
+        with self.assertRaises(ValueError):
+            ojanet.partial_fit(np.random.random((4, 3)))
+
+    def test_oja_partial_fit_memmap(self):
+        with tempfile.NamedTemporaryFile() as temp:
+            data = np.memmap(
+                temp.name, dtype='float64', mode='w+', shape=(4, 2))
+            data[:] = self.data
+
+            ojanet = algorithms.Oja(
+                minimized_data_size=1,
+                step=0.01,
+                batch_size=2,
+                weight=init.Constant(0.1),
+                verbose=False
+            )
+            for _ in range(100):
+                ojanet.partial_fit(data)
+
+            minimized_data = ojanet.predict(self.data)
+            np.testing.assert_array_almost_equal(
+                np.abs(minimized_data), self.result, decimal=2)
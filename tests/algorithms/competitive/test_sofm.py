@@ -1,4 +1,5 @@
 import math
+import tempfile
 
 import numpy as np
 
@@ -821,6 +822,39 @@ class SOFMWeightInitializationTestCase(BaseTestCase):
                 np.linalg.norm((top - center) ** 2),
                 np.linalg.norm((top - bottom) ** 2))
 
+    def test_linear_weight_init_in_chunks(self):
+        X = np.random.random((100, 4))
+        expected_weight = sofm.linear_initialization(X, (3, 3))
+
+        with tempfile.NamedTemporaryFile() as temp:
+            X_memmap = np.memmap(
+                temp.name, dtype='float64', mode='w+', shape=X.shape)
+            X_memmap[:] = X
+
+            weight = sofm.linear_initialization(
+                X_memmap, (3, 3), chunk_size=30)
+            np.testing.assert_array_almost_equal(weight, expected_weight)
+
+        def data_chunks():
+            for i in range(0, 100, 7):
+                yield X[i:i + 7]
+
+        sofmnet = algorithms.SOFM(
+            n_inputs=4,
+            features_grid=(3, 3),
+            weight='init_pca',
+        )
+        sofmnet.init_weights(data_chunks)
+        np.testing.assert_array_almost_equal(
+            sofmnet.weight, expected_weight)
+
+    def test_linear_weight_init_with_list_input(self):
+        X = np.random.random((20, 4))
+        expected_weight = sofm.linear_initialization(X, (3, 3))
+
+        weight = sofm.linear_initialization(X.tolist(), (3, 3))
+        np.testing.assert_array_almost_equal(weight, expected_weight)
+
     def test_sofm_double_initialization_exception_cos_distance(self):
         sofm = algorithms.SOFM(
             n_inputs=2,
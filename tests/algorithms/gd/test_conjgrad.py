@@ -127,6 +127,17 @@ class ConjugateGradientTestCase(BaseTestCase):
             epochs=200,
         )
 
+    def test_conjugate_gradient_batch_line_search_overfit(self):
+        self.assertCanNetworkOverfit(
+            partial(
+                algorithms.ConjugateGradient,
+                update_function='fletcher_reeves',
+                line_search='batch',
+                verbose=False,
+            ),
+            epochs=200,
+        )
+
     def test_conjugate_gradient_dai_yuan_overfit(self):
         self.assertCanNetworkOverfit(
             partial(
@@ -83,6 +83,98 @@ class GradientDescentTestCase(BaseTestCase):
         self.assertAlmostEqual(recovered_optimizer.step, 0.2)
         self.assertEqual(recovered_optimizer.shuffle_data, True)
 
+    def test_gradient_accumulation(self):
+        x_train = np.random.random((8, 2))
+        y_train = np.random.random((8, 1))
+
+        def train_network(**options):
+            network = layers.join(
+                layers.Input(2),
+                layers.Sigmoid(3, weight=np.ones((2, 3)) * 0.1),
+                layers.Sigmoid(1, weight=np.ones((3, 1)) * 0.2),
+            )
+            optimizer = algorithms.Adam(
+                network, step=0.1, shuffle_data=False,
+                verbose=False, **options)
+            optimizer.train(x_train, y_train, epochs=3)
+
+            return [self.eval(var) for var in network.variables.values()]
+
+        expected_parameters = train_network(batch_size=8)
+        actual_parameters = train_network(batch_size=2, accumulate_steps=4)
+
+        for expected, actual in zip(expected_parameters, actual_parameters):
+            np.testing.assert_array_almost_equal(expected, actual, decimal=5)
+
+        scaled_parameters = train_network(batch_size=8, loss_scale=1024)
+
+        for expected, actual in zip(expected_parameters, scaled_parameters):
+            np.testing.assert_array_almost_equal(expected, actual, decimal=5)
+
+    def test_data_parallel_replicas(self):
+        x_train = np.random.random((8, 2))
+        y_train = np.random.random((8, 1))
+
+        def train_network(**options):
+            network = layers.join(
+                layers.Input(2),
+                layers.Sigmoid(3, weight=np.ones((2, 3)) * 0.1),
+                layers.Sigmoid(1, weight=np.ones((3, 1)) * 0.2),
+            )
+            optimizer = algorithms.Momentum(
+                network, step=0.1, shuffle_data=False,
+                verbose=False, **options)
+            optimizer.train(x_train, y_train, epochs=3)
+
+            parameters = [
+                self.eval(var) for var in network.variables.values()]
+            return optimizer.errors.train, parameters
+
+        expected_errors, expected_parameters = train_network(batch_size=8)
+
+        # The last mini-batch has less samples than number of replicas
+        for batch_size, n_replicas in [(8, 3), (5, 4)]:
+            errors, parameters = train_network(
+                batch_size=batch_size, n_replicas=n_replicas)
+
+            if batch_size == 8:
+                np.testing.assert_array_almost_equal(
+                    expected_errors, errors, decimal=5)
+
+                for expected, actual in zip(expected_parameters, parameters):
+                    np.testing.assert_array_almost_equal(
+                        expected, actual, decimal=5)
+
+            self.assertTrue(np.all(np.isfinite(errors)))
+
+    def test_hogwild_training(self):
+        x_train, x_test, y_train, y_test = simple_classification()
+        optimizer = algorithms.GradientDescent(
+            [
+                layers.Input(10),
+                layers.Sigmoid(20),
+                layers.Sigmoid(1),
+            ],
+            step=0.5,
+            batch_size=4,
+            n_threads=4,
+            loss='binary_crossentropy',
+            verbose=False,
+        )
+        optimizer.train(x_train, y_train, x_test, y_test, epochs=20)
+
+        n_batches = int(np.ceil(len(x_train) / 4.))
+        self.assertEqual(optimizer.n_updates_made, 20 * n_batches)
+        self.assertLess(optimizer.errors.valid[-1], optimizer.errors.valid[0])
+
+    def test_hogwild_with_gradient_accumulation_exception(self):
+        with self.assertRaisesRegexp(ValueError, "multiple threads"):
+            algorithms.GradientDescent(
+                layers.Input(2) >> layers.Sigmoid(1),
+                n_threads=2,
+                accumulate_steps=2,
+            )
+
     def test_optimizer_with_bad_shape_input_passed(self):
         optimizer = algorithms.GradientDescent(
             [
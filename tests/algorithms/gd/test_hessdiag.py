@@ -1,7 +1,10 @@
 from functools import partial
 
+import numpy as np
+
 from neupy import algorithms, layers
 from neupy import init
+from neupy.algorithms.gd.hessdiag import rademacher
 
 from helpers import compare_networks
 from helpers import simple_classification
@@ -67,3 +70,38 @@ class HessianDiagonalTestCase(BaseTestCase):
             epochs=6000,
             min_accepted_loss=0.002
         )
+
+    def test_rademacher_distribution(self):
+        samples = self.eval(rademacher((1000,)))
+
+        self.assertEqual(samples.shape, (1000,))
+        self.assertTrue(np.all((samples == -1) | (samples == 1)))
+        self.assertAlmostEqual(samples.mean(), 0, places=1)
+
+    def test_hutchinson_hessian_diagonal_estimation(self):
+        x_train = np.random.random((20, 3))
+        y_train = np.random.random((20, 1))
+
+        # Linear network with MSE loss has Hessian
+        # matrix equal to 2 * X.T * X / n
+        network = layers.Input(3) >> layers.Linear(1, bias=None)
+        optimizer = algorithms.HessianDiagonal(
+            network,
+            n_probes=20,
+            decay=0.99,
+            step=0,
+            verbose=False,
+        )
+        optimizer.train(x_train, y_train, epochs=100)
+
+        expected_diag = 2 * (x_train ** 2).mean(axis=0)
+        hessian_diag = self.eval(optimizer.variables.hessian_diag)
+        corrected_diag = hessian_diag / (1 - 0.99 ** 100)
+
+        np.testing.assert_allclose(corrected_diag, expected_diag, rtol=0.1)
+
+    def test_hessian_diagonal_decay_exception(self):
+        network = layers.Input(3) >> layers.Linear(1)
+
+        with self.assertRaisesRegexp(ValueError, "excluding 1"):
+            algorithms.HessianDiagonal(network, decay=1, verbose=False)
@@ -0,0 +1,106 @@
+from functools import partial
+
+import numpy as np
+import tensorflow as tf
+
+from neupy import algorithms, layers
+from neupy.utils import tensorflow_session
+from neupy.algorithms.gd.hessian import find_hessian_and_gradient
+from neupy.algorithms.gd.hessian_free import (
+    hessian_vector_product, gauss_newton_vector_product,
+    conjugate_gradient,
+)
+
+from helpers import compare_networks
+from helpers import simple_classification
+from base import BaseTestCase
+
+
+class HessianFreeTestCase(BaseTestCase):
+    def test_hessian_vector_product(self):
+        x = tf.placeholder(name='x', dtype=tf.float32, shape=(1,))
+        y = tf.placeholder(name='y', dtype=tf.float32, shape=(1,))
+        vector = tf.constant([1., -2.])
+
+        f = x ** 2 + y ** 3 + 7 * x * y
+        hessian, gradient = find_hessian_and_gradient(f, [x, y])
+        product = hessian_vector_product(gradient, [x, y], vector)
+
+        session = tensorflow_session()
+        hessian_output, product_output = session.run(
+            [hessian, product], feed_dict={x: [1], y: [2]})
+
+        np.testing.assert_array_almost_equal(
+            product_output,
+            np.dot(hessian_output, [1, -2]),
+        )
+
+    def test_gauss_newton_vector_product(self):
+        w = tf.Variable(np.array([1., 2., 3.], dtype=np.float32))
+        x = tf.constant(np.array([[1., 0., 2.], [0., 1., 1.]], np.float32))
+        target = tf.constant(np.array([1., 1.], dtype=np.float32))
+        vector = tf.constant([1., 0., -1.])
+
+        outputs = tf.tensordot(x, w, 1)
+        loss = tf.reduce_sum((outputs - target) ** 2)
+        product = gauss_newton_vector_product(loss, outputs, [w], vector)
+
+        # For linear model and squared loss Gauss-Newton
+        # matrix is equal to 2 * x.T * x
+        x_value = self.eval(x)
+        np.testing.assert_array_almost_equal(
+            self.eval(product),
+            2 * x_value.T.dot(x_value).dot([1, 0, -1]),
+        )
+
+    def test_conjugate_gradient(self):
+        A = np.array([[4., 1.], [1., 3.]], dtype=np.float32)
+        b = np.array([1., 2.], dtype=np.float32)
+
+        solution = conjugate_gradient(
+            lambda vector: tf.tensordot(tf.constant(A), vector, 1),
+            b=tf.constant(b),
+            x0=tf.zeros(2),
+            n_iterations=10,
+            tolerance=1e-7,
+        )
+        np.testing.assert_array_almost_equal(
+            self.eval(solution), np.linalg.solve(A, b))
+
+    def test_compare_bp_and_hessian_free(self):
+        x_train, x_test, y_train, y_test = simple_classification()
+
+        for curvature in ('gauss-newton', 'hessian'):
+            compare_networks(
+                # Test classes
+                partial(algorithms.GradientDescent, batch_size=None),
+                partial(algorithms.HessianFree, curvature=curvature),
+                # Test data
+                (x_train, y_train, x_test, y_test),
+                # Network configurations
+                network=[
+                    layers.Input(10),
+                    layers.Sigmoid(15),
+                    layers.Sigmoid(1)
+                ],
+                shuffle_data=True,
+                verbose=False,
+                show_epoch=1,
+                # Test configurations
+                epochs=5,
+                show_comparison_plot=False
+            )
+
+    def test_hessian_free_assign_step_exception(self):
+        with self.assertRaises(ValueError):
+            # Don't have step parameter
+            algorithms.HessianFree(
+                layers.Input(2) >> layers.Sigmoid(3) >> layers.Sigmoid(1),
+                step=0.01,
+            )
+
+    def test_hessian_free_overfit(self):
+        self.assertCanNetworkOverfit(
+            partial(algorithms.HessianFree, verbose=False, damping=0.1),
+            epochs=200,
+        )
@@ -7,7 +7,8 @@ from sklearn.model_selection import train_test_split
 
 from neupy import algorithms, layers
 from neupy.utils import asfloat
-from neupy.algorithms.gd.lev_marq import compute_jacobian
+from neupy.algorithms.gd.lev_marq import (
+    compute_jacobian, compute_jtj_and_jte)
 
 from base import BaseTestCase
 
@@ -44,6 +45,25 @@ class LevenbergMarquardtTestCase(BaseTestCase):
             self.eval(jacobian_actual)
         )
 
+    def test_jtj_and_jte_computed_in_blocks(self):
+        w = tf.Variable(asfloat(np.random.random((3, 2))), name='w')
+        b = tf.Variable(asfloat(np.random.random(2)), name='b')
+
+        x = asfloat(np.random.random((7, 3)))
+        error_func = tf.reshape(tf.tanh(tf.matmul(x, w) + b) ** 2, [-1])
+
+        jacobian = self.eval(compute_jacobian(error_func, [w, b]))
+        errors = self.eval(error_func)
+
+        for block_size in (1, 3, 14, 100):
+            jtj, jte = self.eval(
+                compute_jtj_and_jte(error_func, [w, b], block_size))
+
+            np.testing.assert_array_almost_equal(
+                jtj, jacobian.T.dot(jacobian), decimal=5)
+            np.testing.assert_array_almost_equal(
+                jte, jacobian.T.dot(errors.reshape(-1, 1)), decimal=5)
+
     def test_levenberg_marquardt_exceptions(self):
         with self.assertRaises(ValueError):
             algorithms.LevenbergMarquardt(
@@ -85,6 +105,17 @@ class LevenbergMarquardtTestCase(BaseTestCase):
 
         self.assertGreater(0.01, error)
 
+    def test_levenberg_marquardt_mini_batches(self):
+        self.assertCanNetworkOverfit(
+            partial(
+                algorithms.LevenbergMarquardt,
+                batch_size=4,
+                jacobian_block_size=3,
+                verbose=False,
+            ),
+            epochs=50,
+        )
+
     def test_levenberg_marquardt_overfit(self):
         self.assertCanNetworkOverfit(
             partial(algorithms.LevenbergMarquardt, verbose=False),
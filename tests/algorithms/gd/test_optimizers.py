@@ -1,5 +1,7 @@
 from functools import partial
 
+import numpy as np
+
 from neupy import algorithms, layers
 
 from helpers import simple_classification, compare_networks
@@ -52,6 +54,42 @@ class OptimizersTestCase(BaseTestCase):
         optimizer.train(x_train, y_train, x_test, y_test, epochs=200)
         self.assertGreater(0.2, optimizer.errors.valid[-1])
 
+    def test_lazy_updates_for_embedding(self):
+        x_train = np.random.randint(0, 5, size=(20, 2))
+        y_train = np.random.random((20, 1))
+        weight = np.random.random((10, 3))
+
+        def train_network(optimizer_class, lazy, epochs):
+            network = layers.join(
+                layers.Input(2),
+                layers.Embedding(10, 3, weight=weight),
+                layers.Reshape(),
+                layers.Sigmoid(1),
+            )
+            optimizer = optimizer_class(
+                network, step=0.1, lazy=lazy,
+                batch_size=None, verbose=False)
+            optimizer.train(x_train, y_train, epochs=epochs)
+
+            embedding = network.layers[1]
+            return self.eval(embedding.weight)
+
+        for optimizer_class in (algorithms.Adam, algorithms.Adamax):
+            # First update is the same, since moving
+            # averages were equal to zero
+            np.testing.assert_array_almost_equal(
+                train_network(optimizer_class, lazy=False, epochs=1),
+                train_network(optimizer_class, lazy=True, epochs=1),
+            )
+
+            trained_weight = train_network(
+                optimizer_class, lazy=True, epochs=10)
+
+            # Rows that weren't used during the training stay the same
+            np.testing.assert_array_almost_equal(
+                trained_weight[5:], weight[5:])
+            self.assertFalse(np.allclose(trained_weight[:5], weight[:5]))
+
     def test_rmsprop(self):
         x_train, x_test, y_train, y_test = simple_classification()
         optimizer = algorithms.RMSProp(
@@ -2,9 +2,10 @@ from functools import partial
 from collections import namedtuple
 
 import numpy as np
+import tensorflow as tf
 from sklearn import metrics
 
-from neupy.utils import asfloat
+from neupy.utils import asfloat, make_single_vector, tf_utils
 from neupy import algorithms, layers, init
 from neupy.algorithms.gd import quasi_newton as qn
 
@@ -157,6 +158,58 @@ class QuasiNewtonTestCase(BaseTestCase):
             min_accepted_loss=0.002,
         )
 
+    def test_quasi_newton_batch_line_search_overfit(self):
+        self.assertCanNetworkOverfit(
+            partial(
+                algorithms.QuasiNewton,
+                h0_scale=2,
+                update_function='bfgs',
+                line_search='batch',
+                n_line_search_steps=8,
+                verbose=False,
+            ),
+            epochs=100,
+            min_accepted_loss=0.002,
+        )
+
+    def test_line_search_functions_with_regularizer(self):
+        x_train = asfloat(np.random.random((10, 3)))
+        y_train = asfloat(np.random.random((10, 1)))
+
+        for line_search in ('wolfe', 'batch'):
+            optimizer = algorithms.QuasiNewton(
+                layers.Input(3) >> layers.Sigmoid(4) >> layers.Sigmoid(1),
+                regularizer=algorithms.l2(1.0),
+                line_search=line_search,
+                verbose=False,
+            )
+            parameters = [
+                variable for variable in optimizer.network.variables.values()
+                if variable.trainable]
+
+            parameter_vector = make_single_vector(parameters)
+            parameter_update = asfloat(
+                np.random.random(optimizer.network.n_parameters) - 0.5)
+
+            phi, derphi, phi0, derphi0 = optimizer.line_search_functions(
+                parameter_vector, parameter_update)
+
+            if line_search == 'batch':
+                phi_zero = phi(asfloat(np.array([0., 1.])))[0]
+                derphi_zero = derphi0
+            else:
+                phi_zero = phi(0.)
+                derphi_zero = derphi(tf.constant(asfloat(0.)))
+
+            session = tf_utils.tensorflow_session()
+            values = session.run([phi_zero, phi0, derphi_zero, derphi0], {
+                optimizer.network.inputs: x_train,
+                optimizer.target: y_train,
+            })
+
+            self.assertAlmostEqual(values[0], values[1], places=5)
+            self.assertAlmostEqual(values[2], values[3], places=5)
+
     def test_quasi_newton_dfp_overfit(self):
         self.assertCanNetworkOverfit(
             partial(
@@ -196,3 +249,47 @@ class QuasiNewtonTestCase(BaseTestCase):
 
         value = self.eval(qn.safe_reciprocal(1e-8, epsilon=0.01))
         self.assertAlmostEqual(100, value)
+
+    def test_lbfgs_two_loop_recursion(self):
+        delta_ws = asfloat(np.array([
+            [0, 0, 0],
+            [0.1, 0.2, 0.3],
+        ]))
+        delta_grads = asfloat(np.array([
+            [0, 0, 0],
+            [0.3, -0.3, 0.5],
+        ]))
+        gradient = asfloat(np.array([1, -1, 2]))
+
+        # L-BFGS with enough memory produces the same direction
+        # as BFGS that starts from the scaled identity matrix
+        gamma = delta_ws[1].dot(delta_grads[1]) / (
+            delta_grads[1].dot(delta_grads[1]))
+        inv_hessian = self.eval(qn.bfgs(
+            asfloat(gamma * np.eye(3)), delta_ws[1], delta_grads[1]))
+
+        direction = self.eval(qn.lbfgs_two_loop(
+            gradient, delta_ws, delta_grads, h0_scale=1))
+
+        np.testing.assert_array_almost_equal(
+            direction, inv_hessian.dot(gradient), decimal=5)
+
+        # Without valid pairs direction is a scaled gradient
+        direction = self.eval(qn.lbfgs_two_loop(
+            gradient, asfloat(np.zeros((2, 3))), asfloat(np.zeros((2, 3))),
+            h0_scale=2))
+        np.testing.assert_array_almost_equal(direction, 2 * gradient)
+
+    def test_lbfgs_overfit(self):
+        self.assertCanNetworkOverfit(
+            partial(algorithms.LBFGS, n_memory=5, verbose=False),
+            epochs=100,
+            min_accepted_loss=0.002,
+        )
+
+    def test_lbfgs_exceptions(self):
+        with self.assertRaises(ValueError):
+            algorithms.LBFGS(
+                layers.Input(2) >> layers.Sigmoid(3) >> layers.Sigmoid(1),
+                update_function='bfgs',
+            )
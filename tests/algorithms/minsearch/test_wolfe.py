@@ -50,6 +50,23 @@ class WolfeInterpolationTestCase(BaseTestCase):
             with self.assertRaises(ValueError, msg=error_desc):
                 wolfe.line_search(f=func, f_deriv=func, **testcase)
 
+    def test_batch_line_search(self):
+        def f_batch(x):
+            return (x - 1.3) ** 2
+
+        step = wolfe.batch_line_search(
+            f_batch, steps=[4, 2, 1, 0.5], f0=1.69, f_deriv0=-2.6)
+        self.assertAlmostEqual(self.eval(step), 1)
+
+        # None of the steps satisfies Armijo condition
+        step = wolfe.batch_line_search(
+            f_batch, steps=[4, 2, 1], f0=0, f_deriv0=-1)
+        self.assertAlmostEqual(self.eval(step), 1)
+
+        with self.assertRaises(ValueError):
+            wolfe.batch_line_search(
+                f_batch, steps=[1], f0=0, f_deriv0=-1, c1=2)
+
     def test_sequential_and(self):
         for input_values in product([False, True], repeat=4):
             expected_value = reduce(operator.and_, input_values)
@@ -1,4 +1,5 @@
 import pickle
+import itertools
 
 import numpy as np
 
@@ -140,3 +141,69 @@ class BernoulliRBMTestCase(BaseTestCase):
         hidden_state = rbm.visible_to_hidden(self.data)
         prediction = rbm.predict(self.data)
         np.testing.assert_array_almost_equal(hidden_state, prediction)
+
+    def test_rbm_contrastive_divergence_k_steps(self):
+        for persistent in (True, False):
+            rbm = algorithms.RBM(
+                n_visible=4,
+                n_hidden=1,
+                n_gibbs_steps=5,
+                persistent=persistent,
+            )
+            rbm.train(self.data, epochs=100)
+
+            output = rbm.visible_to_hidden(self.data)
+            np.testing.assert_array_equal(
+                output.round(),
+                np.array([[0, 0, 0, 0, 1, 1, 1, 1, 1, 1]]).T,
+                err_msg="Persistent chain: {}".format(persistent),
+            )
+
+    def test_rbm_multi_step_gibbs_sampling(self):
+        rbm = algorithms.RBM(n_visible=4, n_hidden=1)
+        rbm.train(self.data, epochs=500)
+
+        sampled_data = rbm.gibbs_sampling(self.data, n_iter=1000)
+        self.assertEqual(sampled_data.shape, self.data.shape)
+        self.assertTrue(np.all((sampled_data == 0) | (sampled_data == 1)))
+
+        not_sampled_data = rbm.gibbs_sampling(self.data, n_iter=0)
+        np.testing.assert_array_equal(not_sampled_data, self.data)
+
+    def test_rbm_score_multiple_corrupted_features(self):
+        rbm = algorithms.RBM(
+            n_visible=4,
+            n_hidden=1,
+            step=0.5,
+            batch_size=10,
+            n_corrupted_features=4,
+        )
+        rbm.train(self.data, epochs=500)
+
+        rbm_error_for_known = rbm.score(np.array([[0, 1, 0, 1]]))
+        rbm_error_for_unknown = rbm.score(np.array([[0, 1, 0, 0]]))
+
+        self.assertLess(rbm_error_for_unknown, rbm_error_for_known)
+
+        with self.assertRaisesRegexp(ValueError, "can't be larger"):
+            algorithms.RBM(n_visible=4, n_hidden=1, n_corrupted_features=5)
+
+    def test_rbm_log_likelihood(self):
+        rbm = algorithms.RBM(n_visible=4, n_hidden=2, step=0.1)
+        rbm.train(self.data, epochs=100)
+
+        weight, h_bias, v_bias = self.eval(
+            [rbm.weight, rbm.hidden_bias, rbm.visible_bias])
+
+        def negative_free_energy(visible):
+            wx_b = np.dot(visible, weight) + h_bias
+            return np.dot(visible, v_bias) + np.logaddexp(0, wx_b).sum(axis=1)
+
+        all_visible = np.array(list(itertools.product([0, 1], repeat=4)))
+        log_partition = np.log(
+            np.exp(negative_free_energy(all_visible)).sum())
+
+        expected = np.mean(negative_free_energy(self.data)) - log_partition
+        actual = rbm.log_likelihood(self.data, n_chains=100, n_betas=1000)
+
+        self.assertAlmostEqual(actual, expected, places=1)
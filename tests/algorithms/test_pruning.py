@@ -0,0 +1,74 @@
+import numpy as np
+
+from neupy import algorithms, layers
+
+from base import BaseTestCase
+from helpers import simple_classification
+
+
+class MagnitudePruningTestCase(BaseTestCase):
+    def test_pruning_schedule(self):
+        signal = algorithms.MagnitudePruning(
+            sparsity=0.8, start_epoch=3, end_epoch=7, frequency=2)
+
+        sparsities = [signal.target_sparsity(epoch) for epoch in range(10)]
+        np.testing.assert_array_almost_equal(sparsities, [
+            0, 0, 0,
+            0, 0,
+            0.7, 0.7,
+            0.8, 0.8, 0.8,
+        ])
+
+        signal = algorithms.MagnitudePruning(sparsity=0.5, start_epoch=2)
+        self.assertEqual(signal.target_sparsity(1), 0)
+        self.assertEqual(signal.target_sparsity(2), 0.5)
+
+    def test_pruning_exceptions(self):
+        with self.assertRaisesRegexp(ValueError, "between 0 and 1"):
+            algorithms.MagnitudePruning(sparsity=1.5)
+
+        with self.assertRaisesRegexp(ValueError, "cannot end before"):
+            algorithms.MagnitudePruning(
+                sparsity=0.5, start_epoch=5, end_epoch=2)
+
+        with self.assertRaisesRegexp(ValueError, "positive number"):
+            algorithms.MagnitudePruning(sparsity=0.5, frequency=0)
+
+    def test_gradual_pruning(self):
+        x_train, x_test, y_train, y_test = simple_classification()
+        signal = algorithms.MagnitudePruning(
+            sparsity=0.9, start_epoch=2, end_epoch=10, frequency=2)
+
+        optimizer = algorithms.Adam(
+            [layers.Input(10), layers.Relu(40), layers.Sigmoid(1)],
+            step=0.01,
+            batch_size=10,
+            verbose=False,
+            signals=signal,
+        )
+        optimizer.train(x_train, y_train, x_test, y_test, epochs=20)
+
+        self.assertEqual(signal.current_sparsity, 0.9)
+        self.assertGreater(0.2, optimizer.errors.valid[-1])
+
+        for layer in optimizer.network.layers:
+            if isinstance(layer, layers.Linear):
+                weight = self.eval(layer.weight)
+                self.assertAlmostEqual(np.mean(weight == 0), 0.9, places=1)
+
+    def test_one_shot_pruning_selected_layers(self):
+        x_train, _, y_train, _ = simple_classification()
+        relu = layers.Relu(20)
+        sigmoid = layers.Sigmoid(1)
+
+        optimizer = algorithms.GradientDescent(
+            [layers.Input(10), relu, sigmoid],
+            batch_size=None,
+            verbose=False,
+            signals=algorithms.MagnitudePruning(
+                sparsity=0.5, layers=[relu]),
+        )
+        optimizer.train(x_train, y_train, epochs=5)
+
+        self.assertEqual(np.mean(self.eval(relu.weight) == 0), 0.5)
+        self.assertLess(np.mean(self.eval(sigmoid.weight) == 0), 0.5)
@@ -92,6 +92,21 @@ class BoundedPropertiesTestCase(BaseTestCase):
         with self.assertRaises(ValueError):
             a.bounded_property = -2
 
+    def test_bounded_property_excluded_values(self):
+        class A(Configurable):
+            positive = BoundedProperty(minval=0, exclude_minval=True)
+            fraction = ProperFractionProperty(exclude_maxval=True)
+
+        a = A()
+        a.positive = 1e-10
+        a.fraction = 0
+
+        with self.assertRaisesRegexp(ValueError, "excluding 0"):
+            a.positive = 0
+
+        with self.assertRaisesRegexp(ValueError, "excluding 1"):
+            a.fraction = 1
+
     def test_propert_raciton_property(self):
         class A(Configurable):
             fraction = ProperFractionProperty()
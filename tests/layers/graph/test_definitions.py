@@ -216,6 +216,28 @@ class DefinitionsTestCase(BaseTestCase):
         self.assertShapesEqual((None, 5, 5, 3), network.input_shape)
         self.assertShapesEqual((None, 5, 5, 11), network.output_shape)
 
+    def test_join_many_layers(self):
+        hidden_layers = [layers.Relu(10) for _ in range(300)]
+        network = layers.join(layers.Input(5), *hidden_layers)
+
+        self.assertEqual(len(network), 301)
+        self.assertSequenceEqual(network.layers[1:], hidden_layers)
+        self.assertEqual(network.output_layers, [hidden_layers[-1]])
+        self.assertShapesEqual(network.output_shape, (None, 10))
+
+    def test_cached_output_shapes(self):
+        network = layers.join(
+            layers.Input(10),
+            layers.Relu(5),
+            layers.Softmax(3),
+        )
+        self.assertIs(
+            network.get_output_shape(*network.input_shapes),
+            network.output_shape)
+
+        self.assertShapesEqual(
+            network.get_output_shape((7, 10)), (7, 3))
+
     def test_fail_many_to_many_connection(self):
         network_a = layers.join(
             layers.Input(10),
@@ -300,3 +322,22 @@ class RepeatArchitectureTestCase(BaseTestCase):
         network = layers.repeat(layers.Relu(10, name='rl{}'), n=4)
         layer_names = [layer.name for layer in network.layers]
         self.assertSequenceEqual(layer_names, ['rl1', 'rl2', 'rl3', 'rl4'])
+
+    def test_repeat_shares_parameters_until_variables_created(self):
+        weight = asfloat(np.random.random((10, 10)))
+        network = layers.join(
+            layers.Input(10),
+            layers.repeat(layers.Relu(10, weight=weight), n=3),
+        )
+        relu_layers = network.layers[1:]
+
+        for layer in relu_layers:
+            self.assertIs(layer.weight, weight)
+
+        network.create_variables()
+        variables = set(layer.weight for layer in relu_layers)
+        self.assertEqual(len(variables), 3)
+
+        for layer in relu_layers:
+            np.testing.assert_array_almost_equal(
+                self.eval(layer.weight), weight)
@@ -1,4 +1,5 @@
 import numpy as np
+import tensorflow as tf
 
 from neupy import layers
 from neupy.utils import asfloat
@@ -20,6 +21,34 @@ class UsageTestCase(BaseTestCase):
         with self.assertRaisesRegexp(ValueError, "but 2 inputs was provided"):
             network.output(input_value_1, input_value_2)
 
+    def test_network_output_caching(self):
+        network = layers.join(
+            layers.Input(4),
+            layers.Relu(5),
+            layers.Dropout(0.5),
+            layers.Softmax(3),
+        )
+        x = tf.placeholder(tf.float32, shape=(None, 4))
+
+        output = network.output(x)
+        graph = tf.get_default_graph()
+        n_operations = len(graph.get_operations())
+
+        self.assertIs(network.output(x), output)
+        self.assertEqual(len(graph.get_operations()), n_operations)
+
+        self.assertIsNot(network.output(x, training=True), output)
+        self.assertIs(
+            network.output(x, training=True),
+            network.output(x, training=True))
+
+        self.assertIs(network.output(network.inputs), network.outputs)
+        self.assertIsNot(network.build_output(x), output)
+
+        # Numpy arrays cannot be cached
+        x_value = asfloat(np.random.random((3, 4)))
+        self.assertIsNot(network.output(x_value), network.output(x_value))
+
     def test_multi_outputs_propagation(self):
         network = layers.join(
             layers.Input(4),
@@ -1,4 +1,7 @@
+import tempfile
+
 import numpy as np
+import tensorflow as tf
 
 from neupy import layers
 from neupy.utils import asfloat
@@ -46,3 +49,67 @@ class EmbeddingLayerTestCase(BaseTestCase):
         variables = network.layer('embed').variables
         self.assertSequenceEqual(list(variables.keys()), ['weight'])
         self.assertShapesEqual(variables['weight'].shape, (3, 5))
+
+    def test_memmapped_embedding(self):
+        weight = np.random.random((10, 3))
+
+        with tempfile.NamedTemporaryFile(suffix='.npy') as temp:
+            np.save(temp.name, weight)
+            table = np.load(temp.name, mmap_mode='r')
+
+            network = layers.join(
+                layers.Input(2),
+                layers.Embedding(10, 3, weight=table, name='embed'),
+            )
+            input_value = asfloat(np.array([[0, 9], [9, 4], [4, 4]]))
+            actual_output = self.eval(network.output(input_value))
+
+            self.assertDictEqual(network.layer('embed').variables, {})
+            self.assertShapesEqual(network.output_shape, (None, 2, 3))
+            np.testing.assert_array_almost_equal(
+                actual_output, weight[input_value.astype(int)])
+
+        with self.assertRaisesRegexp(ValueError, "expected shape"):
+            layers.join(
+                layers.Input(2),
+                layers.Embedding(5, 3, weight=table),
+            ).outputs
+
+    def test_partitioned_embedding(self):
+        weight = np.random.random((10, 3))
+        network = layers.join(
+            layers.Input(2),
+            layers.Embedding(10, 3, weight=weight, n_partitions=3),
+        )
+        input_value = asfloat(np.array([[0, 9], [3, 4], [5, 7]]))
+        output = network.output(input_value)
+
+        embedding = network.layers[1]
+        self.assertSequenceEqual(
+            list(embedding.variables.keys()),
+            ['weight_part_0', 'weight_part_1', 'weight_part_2'])
+
+        partition_shapes = [
+            tuple(var.shape.as_list())
+            for var in embedding.variables.values()]
+        self.assertEqual(partition_shapes, [(4, 3), (3, 3), (3, 3)])
+
+        np.testing.assert_array_almost_equal(
+            self.eval(output), weight[input_value.astype(int)])
+        np.testing.assert_array_almost_equal(
+            self.eval(embedding.weight), weight)
+
+        gradients = tf.gradients(
+            tf.reduce_sum(output), embedding.weight_partitions)
+
+        for gradient in gradients:
+            self.assertIsInstance(gradient, tf.IndexedSlices)
+
+    def test_partitioned_embedding_exceptions(self):
+        with self.assertRaisesRegexp(ValueError, "partitions"):
+            layers.Embedding(3, 2, n_partitions=4)
+
+        table = np.memmap(tempfile.TemporaryFile(), shape=(10, 3), mode='w+')
+
+        with self.assertRaisesRegexp(ValueError, "cannot be partitioned"):
+            layers.Embedding(10, 3, weight=table, n_partitions=4)
@@ -0,0 +1,157 @@
+import numpy as np
+
+from neupy import layers
+from neupy.utils import asfloat, tf_utils
+
+from base import BaseTestCase
+
+
+def random_batch_norm(n_features, shape=None):
+    shape = shape or (1, n_features)
+    return layers.BatchNorm(
+        running_mean=asfloat(np.random.random(shape)),
+        running_inv_std=asfloat(np.random.random(shape) + 0.5),
+        gamma=asfloat(np.random.random(shape) + 0.5),
+        beta=asfloat(np.random.random(shape)),
+    )
+
+
+class OptimizeForInferenceTestCase(BaseTestCase):
+    def assertSameOutputs(self, network, optimized_network, X):
+        np.testing.assert_array_almost_equal(
+            network.predict(X), optimized_network.predict(X), decimal=5)
+
+    def test_fold_batch_norm_into_linear_layer(self):
+        network = layers.join(
+            layers.Input(10),
+            layers.Linear(20, bias=None),
+            random_batch_norm(20),
+            layers.Relu(),
+            layers.Linear(15),
+            random_batch_norm(15),
+            layers.Dropout(0.5),
+            layers.Softmax(4),
+        )
+        optimized_network = layers.optimize_for_inference(network)
+
+        self.assertEqual(len(optimized_network), 5)
+        self.assertShapesEqual(optimized_network.output_shape, (None, 4))
+
+        for layer in optimized_network:
+            self.assertNotIsInstance(layer, (layers.BatchNorm, layers.Dropout))
+            self.assertNotIn(layer, network)
+
+        X = asfloat(np.random.random((12, 10)))
+        self.assertSameOutputs(network, optimized_network, X)
+
+    def test_optimized_network_has_own_parameters(self):
+        relu = layers.Relu(20)
+        network = layers.join(
+            layers.Input(10),
+            relu,
+            layers.Linear(5, bias=None),
+            random_batch_norm(5),
+        )
+        optimized_network = layers.optimize_for_inference(network)
+        self.assertEqual(len(optimized_network), 3)
+
+        original_variables = list(network.variables.values())
+
+        for variable in optimized_network.variables.values():
+            for original_variable in original_variables:
+                self.assertIsNot(variable, original_variable)
+
+        X = asfloat(np.random.random((6, 10)))
+        expected_output = optimized_network.predict(X)
+
+        session = tf_utils.tensorflow_session()
+        relu.weight.load(asfloat(np.zeros((10, 20))), session)
+
+        np.testing.assert_array_almost_equal(
+            expected_output, optimized_network.predict(X))
+
+    def test_fold_batch_norm_into_convolution(self):
+        network = layers.join(
+            layers.Input((8, 8, 3)),
+            layers.Convolution((3, 3, 6), padding='same'),
+            random_batch_norm(6, shape=(1, 1, 1, 6)),
+            layers.Relu(),
+            layers.GaussianNoise(std=1),
+            layers.Convolution((3, 3, 4), bias=None),
+            random_batch_norm(4, shape=(1, 1, 1, 4)),
+            layers.DropBlock(keep_proba=0.5, block_size=2),
+            layers.Reshape(),
+        )
+        optimized_network = layers.optimize_for_inference(network)
+
+        self.assertEqual(len(optimized_network), 5)
+
+        X = asfloat(np.random.random((4, 8, 8, 3)))
+        self.assertSameOutputs(network, optimized_network, X)
+
+    def test_batch_norm_cannot_be_folded(self):
+        network = layers.join(
+            layers.Input(10),
+            # Activation function is applied before the normalization
+            layers.Relu(20),
+            random_batch_norm(20),
+        )
+        optimized_network = layers.optimize_for_inference(network)
+        self.assertEqual(len(optimized_network), 3)
+
+        X = asfloat(np.random.random((6, 10)))
+        self.assertSameOutputs(network, optimized_network, X)
+
+        network = layers.join(
+            layers.Input((4, 4, 2)),
+            layers.Convolution((1, 1, 3)),
+            # Normalization isn't applied per channel
+            layers.BatchNorm(axes=[0, 3], running_mean=1),
+        )
+        optimized_network = layers.optimize_for_inference(network)
+        self.assertEqual(len(optimized_network), 3)
+
+        X = asfloat(np.random.random((6, 4, 4, 2)))
+        self.assertSameOutputs(network, optimized_network, X)
+
+    def test_linear_layer_with_many_outputs(self):
+        network = layers.join(
+            layers.Input(10),
+            layers.Linear(5),
+            layers.parallel(
+                random_batch_norm(5),
+                layers.Relu(),
+            ),
+            layers.Concatenate(),
+        )
+        optimized_network = layers.optimize_for_inference(network)
+        self.assertEqual(len(optimized_network), 5)
+
+        X = asfloat(np.random.random((6, 10)))
+        self.assertSameOutputs(network, optimized_network, X)
+
+    def test_remove_stochastic_layers_keeps_inputs_order(self):
+        network = layers.join(
+            layers.Input(10),
+            layers.parallel(
+                layers.Relu(4) >> layers.Dropout(0.5),
+                layers.Sigmoid(3),
+                layers.Tanh(2) >> layers.GaussianNoise(std=1),
+            ),
+            layers.Concatenate(),
+            layers.Dropout(0.2),
+        )
+        optimized_network = layers.optimize_for_inference(network)
+
+        self.assertEqual(len(optimized_network), 5)
+        self.assertShapesEqual(optimized_network.output_shape, (None, 9))
+
+        X = asfloat(np.random.random((6, 10)))
+        self.assertSameOutputs(network, optimized_network, X)
+
+    def test_remove_output_layer(self):
+        network = layers.Input(5) >> layers.Dropout(0.5)
+        optimized_network = layers.optimize_for_inference(network)
+
+        self.assertEqual(len(optimized_network), 1)
+        self.assertShapesEqual(optimized_network.output_shape, (None, 5))
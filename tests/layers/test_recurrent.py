@@ -5,19 +5,22 @@ from sklearn.model_selection import train_test_split
 from neupy.datasets import reber
 from neupy.utils import asfloat, tensorflow_session
 from neupy.exceptions import LayerConnectionError
-from neupy.layers.recurrent import clip_gradient
+from neupy.layers.recurrent import clip_gradient, project_sequence
 from neupy import layers, algorithms, init
 
 from base import BaseTestCase
 
 
-def add_sequence_padding(data):
+def add_sequence_padding(data, pad_end=False):
     n_sampels = len(data)
     max_seq_length = max(map(len, data))
 
     data_matrix = np.zeros((n_sampels, max_seq_length))
     for i, sample in enumerate(data):
-        data_matrix[i, -len(sample):] = sample
+        if pad_end:
+            data_matrix[i, :len(sample)] = sample
+        else:
+            data_matrix[i, -len(sample):] = sample
 
     return data_matrix
 
@@ -42,6 +45,25 @@ class GradientClippingTestCase(BaseTestCase):
         self.assertAlmostEqual(self.eval(gradient), -1.5)
 
 
+class ProjectSequenceTestCase(BaseTestCase):
+    def test_project_sequence(self):
+        sequence = np.random.random((4, 3, 5))
+        weights = np.random.random((5, 8))
+        biases = np.random.random(8)
+
+        projection = project_sequence(
+            tf.constant(asfloat(sequence)),
+            tf.constant(asfloat(weights)),
+            tf.constant(asfloat(biases)))
+
+        self.assertShapesEqual(projection.shape, (4, 3, 8))
+        np.testing.assert_array_almost_equal(
+            self.eval(projection),
+            sequence.dot(weights) + biases,
+            decimal=5,
+        )
+
+
 class LSTMTestCase(BaseTestCase):
     single_thread = True
     random_seed = 44
@@ -178,6 +200,28 @@ class LSTMTestCase(BaseTestCase):
 
         self.assertGreaterEqual(accuracy, 0.8)
 
+    def test_lstm_scan_and_unrolled_scan_outputs(self):
+        X = asfloat(np.random.random((7, 6, 3)))
+        weights = dict(
+            input_weights=init.Normal(seed=1),
+            hidden_weights=init.Normal(seed=2),
+        )
+
+        network_scan = layers.join(
+            layers.Input((6, 3)),
+            layers.LSTM(4, only_return_final=False, **weights),
+        )
+        network_unrolled = layers.join(
+            layers.Input((6, 3)),
+            layers.LSTM(
+                4, only_return_final=False, unroll_scan=True, **weights),
+        )
+
+        np.testing.assert_array_almost_equal(
+            self.eval(network_scan.output(X)),
+            self.eval(network_unrolled.output(X)),
+        )
+
     def test_lstm_connection_exceptions(self):
         network = layers.join(layers.LSTM(10), layers.Reshape())
 
@@ -314,3 +358,151 @@ class GRUTestCase(BaseTestCase):
 
         with self.assertRaises(LayerConnectionError):
             layers.join(layers.Input(1), network)
+
+
+class VariableLengthSequencesTestCase(BaseTestCase):
+    def assertOutputIgnoresPadding(self, layer_class, **options):
+        lengths = np.array([6, 3, 4, 1])
+        X = asfloat(np.random.random((4, 6, 2)))
+
+        final_layer = layer_class(3, **options)
+        final_network = layers.join(
+            layers.Input((6, 2)) | layers.Input(1),
+            final_layer,
+        )
+        sequence_network = layers.join(
+            layers.Input((6, 2)) | layers.Input(1),
+            layer_class(3, only_return_final=False, **options),
+        )
+        self.assertShapesEqual(final_network.output_shape, (None, 3))
+        self.assertShapesEqual(sequence_network.output_shape, (None, 6, 3))
+
+        final_output = self.eval(final_network.output(X, lengths))
+        sequence_output = self.eval(sequence_network.output(X, lengths))
+
+        for i, length in enumerate(lengths):
+            sequence = X[i:i + 1, :length]
+            expected_output = self.eval(final_layer.output(sequence))
+            np.testing.assert_array_almost_equal(
+                final_output[i:i + 1], expected_output)
+
+            # Outputs for the padded time steps are equal to zero
+            np.testing.assert_array_equal(sequence_output[i, length:], 0)
+            self.assertTrue(np.all(sequence_output[i, :length] != 0))
+
+    def test_lstm_with_sequence_lengths(self):
+        self.assertOutputIgnoresPadding(layers.LSTM)
+        self.assertOutputIgnoresPadding(layers.LSTM, peepholes=True)
+        self.assertOutputIgnoresPadding(layers.LSTM, backwards=True)
+        self.assertOutputIgnoresPadding(layers.LSTM, unroll_scan=True)
+        self.assertOutputIgnoresPadding(
+            layers.LSTM, unroll_scan=True, backwards=True)
+
+    def test_gru_with_sequence_lengths(self):
+        self.assertOutputIgnoresPadding(layers.GRU)
+        self.assertOutputIgnoresPadding(layers.GRU, backwards=True)
+        self.assertOutputIgnoresPadding(layers.GRU, unroll_scan=True)
+
+    def test_sequence_lengths_connection_exceptions(self):
+        with self.assertRaises(LayerConnectionError):
+            layers.join(
+                layers.Input((6, 2)) | layers.Input((4, 2)),
+                layers.LSTM(3),
+            )
+
+    def test_bucketing_with_sequence_lengths(self):
+        data, labels = reber.make_reber_classification(
+            n_samples=100,
+            return_indices=True,
+        )
+        lengths = np.array([len(sample) for sample in data])
+        data = add_sequence_padding(data + 1, pad_end=True)
+
+        n_categories = len(reber.avaliable_letters) + 1
+        n_time_steps = data.shape[1]
+
+        x_train, x_test, l_train, l_test, y_train, y_test = train_test_split(
+            data, lengths, labels, test_size=0.2)
+
+        network = algorithms.RMSProp(
+            [
+                (
+                    layers.Input(n_time_steps) >>
+                    layers.Embedding(n_categories, 10)
+                ) | layers.Input(1),
+                layers.LSTM(20),
+                layers.Sigmoid(1),
+            ],
+            step=0.05,
+            verbose=False,
+            batch_size=16,
+            bucket_by=1,
+            shuffle_data=True,
+            loss='binary_crossentropy',
+        )
+        network.train(
+            [x_train, l_train], y_train,
+            [x_test, l_test], y_test, epochs=20)
+
+        y_predicted = network.predict(x_test, l_test).round()
+        accuracy = (y_predicted.T == y_test).mean()
+        self.assertGreaterEqual(accuracy, 0.8)
+
+
+class StatefulPredictorTestCase(BaseTestCase):
+    def test_stateful_predictor(self):
+        for layer_class in (layers.LSTM, layers.GRU):
+            network = layers.join(
+                layers.Input((None, 2)),
+                layer_class(3),
+                layers.Sigmoid(1),
+            )
+            predictor = layers.StatefulPredictor(network)
+
+            X = asfloat(np.random.random((2, 6, 2)))
+            expected_output = self.eval(network.output(X))
+
+            predictor.predict(['a', 'b'], X[:, :2])
+            predictor.predict(['a', 'b'], X[:, 2:3])
+            # Order of the streams shouldn't matter
+            predictor.predict(['b', 'a'], X[::-1, 3:5])
+            actual_output = predictor.predict(['a', 'b'], X[:, 5:])
+
+            np.testing.assert_array_almost_equal(
+                actual_output, expected_output)
+            self.assertEqual(sorted(predictor.states), ['a', 'b'])
+
+            # New stream starts from the initial states
+            predictor.reset('a')
+            self.assertEqual(list(predictor.states), ['b'])
+            np.testing.assert_array_almost_equal(
+                predictor.predict(['a'], X[:1, :1]),
+                self.eval(network.output(X[:1, :1])),
+            )
+
+            predictor.reset()
+            self.assertEqual(predictor.states, {})
+
+    def test_stateful_predictor_with_stochastic_layers(self):
+        network = layers.join(
+            layers.Input((None, 2)),
+            layers.LSTM(3, only_return_final=False),
+            layers.Dropout(0.5),
+            layers.GaussianNoise(std=1),
+            layers.LSTM(4),
+            layers.BatchNorm(),
+            layers.Sigmoid(1),
+        )
+        predictor = layers.StatefulPredictor(network)
+
+        X = asfloat(np.random.random((2, 4, 2)))
+        expected_output = self.eval(network.output(X))
+
+        predictor.predict(['a', 'b'], X[:, :3])
+        actual_output = predictor.predict(['a', 'b'], X[:, 3:])
+
+        np.testing.assert_array_almost_equal(actual_output, expected_output)
+
+    def test_stateful_predictor_exceptions(self):
+        with self.assertRaises(ValueError):
+            layers.StatefulPredictor(layers.Input(2) >> layers.Sigmoid(1))
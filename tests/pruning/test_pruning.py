@@ -0,0 +1,112 @@
+import tempfile
+
+import numpy as np
+
+from neupy import layers, storage, runtime, pruning
+from neupy.pruning import magnitude_mask
+from neupy.quantization import parameters_size
+from neupy.utils import asfloat
+
+from base import BaseTestCase
+
+
+class PruningTestCase(BaseTestCase):
+    def test_magnitude_mask(self):
+        weight = np.array([
+            [1.0, -0.5, 0],
+            [-2.0, 0.25, 3],
+        ])
+        mask = magnitude_mask(weight, sparsity=0.5)
+        np.testing.assert_array_equal(
+            mask, [[True, False, False], [True, False, True]])
+
+        mask = magnitude_mask(weight, sparsity=0)
+        self.assertTrue(mask.all())
+
+    def test_prune_dense_network(self):
+        network = layers.join(
+            layers.Input(20),
+            layers.Relu(64),
+            layers.Dropout(0.5),
+            layers.Softmax(4),
+        )
+        data = storage.save_dict(network)
+        pruned_data = pruning.prune(data, sparsity=0.9)
+
+        for layer in pruned_data['layers']:
+            if layer['class_name'] in ('Relu', 'Softmax'):
+                weight = layer['parameters']['weight']['value']
+                self.assertAlmostEqual(np.mean(weight == 0), 0.9, places=2)
+
+        # Original data shouldn't be modified
+        for layer in data['layers']:
+            if layer['class_name'] == 'Relu':
+                weight = layer['parameters']['weight']['value']
+                self.assertLess(np.mean(weight == 0), 0.1)
+
+        with self.assertRaisesRegexp(ValueError, "between 0 and 1"):
+            pruning.prune(data, sparsity=1)
+
+    def test_sparse_inference(self):
+        network = layers.join(
+            layers.Input(100),
+            layers.Relu(200),
+            layers.Sigmoid(50),
+            layers.Softmax(10),
+        )
+        data = pruning.prune(storage.save_dict(network), sparsity=0.9)
+        sparse_data = pruning.sparsify(data)
+
+        for layer in sparse_data['layers']:
+            if layer['class_name'] in ('Relu', 'Sigmoid', 'Softmax'):
+                self.assertNotIn('weight', layer['parameters'])
+                self.assertIn('weight_indptr', layer['parameters'])
+
+        X = asfloat(np.random.random((30, 100)))
+        plan = runtime.load_dict(data)
+        sparse_plan = runtime.load_dict(sparse_data)
+
+        np.testing.assert_array_almost_equal(
+            plan.predict(X), sparse_plan.predict(X, batch_size=7))
+        self.assertLess(
+            parameters_size(sparse_plan), 0.3 * parameters_size(plan))
+
+    def test_sparsify_skips_dense_weights(self):
+        network = layers.Input(10) >> layers.Relu(8) >> layers.Softmax(3)
+        sparse_data = pruning.sparsify(storage.save_dict(network))
+
+        for layer in sparse_data['layers']:
+            if layer['class_name'] in ('Relu', 'Softmax'):
+                self.assertIn('weight', layer['parameters'])
+
+    def test_store_sparse_network(self):
+        network = layers.Input(10) >> layers.Relu(300) >> layers.Softmax(3)
+        X = asfloat(np.random.random((30, 10)))
+
+        data = pruning.prune(storage.save_dict(network), sparsity=0.8)
+        sparse_data = pruning.sparsify(data)
+        expected_output = runtime.load_dict(data).predict(X)
+
+        formats = [
+            runtime.write_hdf5,
+            runtime.write_json,
+            runtime.write_pickle,
+        ]
+        loaders = [
+            runtime.load_hdf5,
+            runtime.load_json,
+            runtime.load_pickle,
+        ]
+
+        for write, load in zip(formats, loaders):
+            with tempfile.NamedTemporaryFile() as temp:
+                write(sparse_data, temp.name)
+                plan = load(temp.name)
+
+            for _, operation, _ in plan.operations:
+                if 'weight_indices' in operation.parameters:
+                    indices = operation.parameters['weight_indices']
+                    self.assertEqual(indices.dtype, np.int32)
+
+            np.testing.assert_array_almost_equal(
+                expected_output, plan.predict(X))
@@ -0,0 +1,145 @@
+import tempfile
+
+import mock
+import numpy as np
+
+from neupy import layers, storage, runtime, quantization
+from neupy.quantization import quantize_weight
+from neupy.utils import asfloat
+
+from base import BaseTestCase
+
+
+class QuantizationTestCase(BaseTestCase):
+    def test_quantize_weight(self):
+        weight = np.array([
+            [1.0, -0.5, 0],
+            [-2.0, 0.25, 0],
+        ])
+        quantized_weight, scale = quantize_weight(weight)
+
+        self.assertEqual(quantized_weight.dtype, np.int8)
+        np.testing.assert_array_almost_equal(scale, [2 / 127., 0.5 / 127., 1])
+        np.testing.assert_array_equal(
+            quantized_weight, [[64, -127, 0], [-127, 64, 0]])
+
+    def test_quantize_dense_network(self):
+        network = layers.join(
+            layers.Input(20),
+            layers.Relu(64),
+            layers.Dropout(0.5),
+            layers.Sigmoid(32),
+            layers.Softmax(4),
+        )
+        data = storage.save_dict(network)
+
+        X = asfloat(np.random.random((200, 20)))
+        target = network.predict(X).argmax(axis=1)
+        quantized_data = quantization.quantize(data, X[:100], batch_size=30)
+
+        for layer in quantized_data['layers']:
+            parameters = layer['parameters']
+
+            if layer['class_name'] in ('Relu', 'Sigmoid', 'Softmax'):
+                self.assertEqual(parameters['weight']['value'].dtype, np.int8)
+                self.assertIn('weight_scale', parameters)
+                self.assertIn('input_scale', parameters)
+
+        # Original data shouldn't be modified
+        for layer in data['layers']:
+            self.assertNotIn('input_scale', layer['parameters'])
+
+        report = quantization.quantization_report(
+            data, quantized_data, X[100:], target=target[100:])
+
+        self.assertLess(report['max_absolute_error'], 0.05)
+        self.assertGreater(report['agreement'], 0.8)
+        self.assertEqual(report['accuracy'], 1)
+        self.assertGreater(report['quantized_accuracy'], 0.8)
+        self.assertLess(
+            report['quantized_parameters_size'],
+            0.35 * report['parameters_size'])
+
+    def test_quantize_convolutional_network(self):
+        network = layers.join(
+            layers.Input((10, 10, 3)),
+            layers.Convolution((3, 3, 8), padding='same') >> layers.Relu(),
+            layers.MaxPooling((2, 2)),
+            layers.Convolution((3, 3, 8), bias=None) >> layers.Relu(),
+            layers.Reshape(),
+            layers.Linear(5),
+        )
+        data = storage.save_dict(network)
+        X = asfloat(np.random.random((20, 10, 10, 3)))
+
+        quantized_data = quantization.quantize(data, X)
+        report = quantization.quantization_report(data, quantized_data, X)
+
+        self.assertLess(
+            report['mean_absolute_error'],
+            0.02 * np.abs(network.predict(X)).mean())
+
+    def test_store_quantized_network(self):
+        network = layers.Input(10) >> layers.Relu(8) >> layers.Softmax(3)
+        X = asfloat(np.random.random((30, 10)))
+
+        quantized_data = quantization.quantize(storage.save_dict(network), X)
+        expected_output = runtime.load_dict(quantized_data).predict(X)
+
+        formats = [
+            runtime.write_hdf5,
+            runtime.write_json,
+            runtime.write_pickle,
+        ]
+        loaders = [
+            runtime.load_hdf5,
+            runtime.load_json,
+            runtime.load_pickle,
+        ]
+
+        for write, load in zip(formats, loaders):
+            with tempfile.NamedTemporaryFile() as temp:
+                write(quantized_data, temp.name)
+                plan = load(temp.name)
+
+            for _, operation, _ in plan.operations:
+                if 'weight' in operation.parameters:
+                    weight = operation.parameters['weight']
+                    self.assertEqual(weight.dtype, np.int8)
+
+            np.testing.assert_array_almost_equal(
+                expected_output, plan.predict(X))
+
+    def test_quantized_weight_converted_in_blocks(self):
+        network = layers.join(
+            layers.Input((6, 6, 2)),
+            layers.Convolution((3, 3, 7)) >> layers.Relu(),
+            layers.GlobalPooling('avg'),
+            layers.Sigmoid(9),
+        )
+        X = asfloat(np.random.random((10, 6, 6, 2)))
+
+        quantized_data = quantization.quantize(storage.save_dict(network), X)
+        expected_output = runtime.load_dict(quantized_data).predict(X)
+
+        with mock.patch('neupy.runtime.DEQUANTIZED_BLOCK_SIZE', 40):
+            plan = runtime.load_dict(quantized_data)
+            np.testing.assert_array_almost_equal(
+                expected_output, plan.predict(X))
+
+        # Weight never gets converted to floats at once
+        for _, operation, _ in plan.operations:
+            for (name, shape), _ in operation.buffers.items():
+                if name == 'weight-block':
+                    self.assertLess(np.prod(shape), 40)
+
+    def test_quantization_exceptions(self):
+        network = layers.Input(10) >> layers.Relu(8)
+        data = storage.save_dict(network)
+        X = np.random.random((10, 10))
+
+        with self.assertRaisesRegexp(ValueError, "1 inputs, but 2"):
+            quantization.quantize(data, X, X)
+
+        with self.assertRaisesRegexp(TypeError, "Unknown arguments"):
+            quantization.quantize(data, X, step=0.1)
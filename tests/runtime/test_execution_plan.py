@@ -0,0 +1,150 @@
+import sys
+import tempfile
+import subprocess
+
+import numpy as np
+
+from neupy import layers, storage, runtime
+from neupy.utils import asfloat
+
+from base import BaseTestCase
+
+
+class ExecutionPlanTestCase(BaseTestCase):
+    def assertSamePredictions(self, network, *inputs, **kwargs):
+        plan = runtime.compile_network(network)
+        np.testing.assert_array_almost_equal(
+            network.predict(*inputs),
+            plan.predict(*inputs, **kwargs),
+            decimal=5,
+        )
+
+    def test_dense_network(self):
+        network = layers.join(
+            layers.Input(10),
+            layers.Linear(8),
+            layers.BatchNorm(
+                running_mean=asfloat(np.random.random((1, 8))),
+                running_inv_std=asfloat(np.random.random((1, 8)) + 0.5),
+            ),
+            layers.Sigmoid(7),
+            layers.Tanh(6),
+            layers.Relu(6, alpha=0.1),
+            layers.LeakyRelu(5),
+            layers.Elu(5),
+            layers.PRelu(5),
+            layers.HardSigmoid(5),
+            layers.Softplus(5),
+            layers.Dropout(0.5),
+            layers.Softmax(3),
+        )
+        X = asfloat(np.random.random((20, 10)) * 4 - 2)
+
+        self.assertSamePredictions(network, X)
+        self.assertSamePredictions(network, X, batch_size=7)
+
+    def test_network_with_many_inputs(self):
+        network = layers.join(
+            layers.parallel(
+                layers.Input(3) >> layers.Relu(4),
+                layers.Input(2) >> layers.Sigmoid(4),
+                layers.Input(4),
+            ),
+            layers.Elementwise('multiply'),
+            layers.parallel(layers.Relu(6), layers.Tanh(6)),
+            layers.Concatenate(),
+            layers.Reshape((3, 4)),
+            layers.Transpose((0, 2, 1)),
+            layers.Reshape(),
+            layers.Softmax(2),
+        )
+        X1 = asfloat(np.random.random((6, 3)))
+        X2 = asfloat(np.random.random((6, 2)))
+        X3 = asfloat(np.random.random((6, 4)))
+
+        self.assertSamePredictions(network, X1, X2, X3)
+
+    def test_convolutional_network(self):
+        network = layers.join(
+            layers.Input((13, 13, 2)),
+            layers.Convolution((3, 3, 4), padding='same') >> layers.Relu(),
+            layers.MaxPooling((2, 2), padding='same'),
+            layers.Convolution((3, 3, 5), stride=2, padding=1),
+            layers.AveragePooling((3, 3), stride=1, padding='same'),
+            layers.Upscale((2, 2)),
+            layers.Convolution((3, 3, 5), dilation=2, bias=None),
+            layers.AveragePooling((2, 2)),
+            layers.GlobalPooling('max'),
+            layers.Softmax(3),
+        )
+        X = asfloat(np.random.random((5, 13, 13, 2)))
+        self.assertSamePredictions(network, X)
+
+    def test_embedding_network(self):
+        network = layers.join(
+            layers.Input(4),
+            layers.Embedding(10, 3, n_partitions=3),
+            layers.Reshape(),
+            layers.Tanh(2),
+        )
+        X = np.random.randint(10, size=(7, 4))
+        self.assertSamePredictions(network, X)
+
+    def test_load_plan_from_files(self):
+        network = layers.join(
+            layers.Input(5),
+            layers.Relu(4),
+            layers.Relu(),
+            layers.GlobalPooling('avg'),
+            layers.Softmax(2),
+        )
+        X = asfloat(np.random.random((4, 5)))
+        expected_output = network.predict(X)
+
+        formats = [
+            (storage.save_hdf5, runtime.load_hdf5),
+            (storage.save_json, runtime.load_json),
+            (storage.save_pickle, runtime.load_pickle),
+        ]
+
+        for save, load in formats:
+            with tempfile.NamedTemporaryFile() as temp:
+                save(network, temp.name)
+                plan = load(temp.name)
+
+            np.testing.assert_array_almost_equal(
+                expected_output, plan.predict(X))
+
+    def test_plan_reuses_buffers(self):
+        network = layers.Input(5) >> layers.Relu(4) >> layers.Softmax(2)
+        plan = runtime.compile_network(network)
+
+        X = asfloat(np.random.random((4, 5)))
+        output_1 = plan.predict(X)
+        output_2 = plan.predict(X + 1)
+
+        self.assertFalse(np.allclose(output_1, output_2))
+
+        for _, operation, _ in plan.operations:
+            self.assertLessEqual(len(operation.buffers), 1)
+
+    def test_plan_exceptions(self):
+        network = layers.Input((5, 2)) >> layers.LSTM(3)
+
+        with self.assertRaisesRegexp(ValueError, "LSTM"):
+            runtime.compile_network(network)
+
+        plan = runtime.compile_network(layers.Input(5) >> layers.Relu(4))
+
+        with self.assertRaisesRegexp(ValueError, "1 inputs, but 2"):
+            plan.predict(np.ones((2, 5)), np.ones((2, 5)))
+
+        with self.assertRaisesRegexp(TypeError, "Unknown arguments"):
+            plan.predict(np.ones((2, 5)), verbose=True)
+
+    def test_runtime_without_tensorflow(self):
+        code = (
+            "import sys; import neupy.runtime; "
+            "sys.exit('tensorflow' in sys.modules)"
+        )
+        self.assertEqual(subprocess.call([sys.executable, '-c', code]), 0)
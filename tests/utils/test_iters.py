@@ -62,6 +62,26 @@ class ItersUtilsTestCase(BaseTestCase):
         np.testing.assert_array_equal(collected_samples[1][0], [batch_2])
         np.testing.assert_array_equal(collected_samples[1][1], batch_2)
 
+    def test_bucket_minibatches(self):
+        lengths = np.array([5, 1, 4, 2, 5, 1, 4, 2])
+        data = np.arange(8), lengths
+        iterbatches = iters.bucket_minibatches(
+            data, lengths, batch_size=2, shuffle=True)
+
+        collected_samples = []
+        for samples, batch_lengths in iterbatches:
+            self.assertEqual(len(samples), 2)
+            # Each batch contains sequences with the same length
+            self.assertEqual(batch_lengths[0], batch_lengths[1])
+            np.testing.assert_array_equal(lengths[samples], batch_lengths)
+            collected_samples.extend(samples)
+
+        np.testing.assert_array_equal(sorted(collected_samples), np.arange(8))
+
+    def test_bucket_minibatches_exceptions(self):
+        with self.assertRaisesRegexp(ValueError, "doesn't match"):
+            next(iters.bucket_minibatches(np.arange(8), [1, 2, 3]))
+
     def test_minibatches_nested_inputs_with_nones(self):
         data = [np.arange(24)], None
         iterbatches = iters.minibatches(data, batch_size=12, shuffle=False)
@@ -2,7 +2,12 @@ import numpy as np
 import tensorflow as tf
 from scipy.sparse import csr_matrix
 
-from neupy.utils.processing import format_data, asfloat
+from neupy import algorithms, layers
+from neupy.exceptions import LayerConnectionError
+from neupy.utils.processing import (
+    format_data, asfloat, float_type,
+    get_float_type, set_float_type,
+)
 
 from base import BaseTestCase
 
@@ -47,3 +52,97 @@ class ProcessingUtilsTestCase(BaseTestCase):
         x = tf.placeholder(dtype=tf.int32)
         self.assertNotEqual(x.dtype, tf.float32)
         self.assertEqual(asfloat(x).dtype, tf.float32)
+
+    def test_float_type_context_manager(self):
+        self.assertEqual(get_float_type(), 'float32')
+
+        with float_type('float64'):
+            self.assertEqual(get_float_type(), 'float64')
+            self.assertEqual(asfloat(np.array([1, 2])).dtype, np.float64)
+            self.assertEqual(asfloat(1).dtype, np.float64)
+
+            network = layers.Input(2) >> layers.Sigmoid(3)
+            self.assertEqual(network.inputs.dtype, tf.float64)
+            self.assertEqual(network.outputs.dtype, tf.float64)
+
+        self.assertEqual(get_float_type(), 'float32')
+
+        with self.assertRaises(ValueError):
+            set_float_type('int32')
+
+    def test_float64_levenberg_marquardt(self):
+        x_train = np.random.random((10, 2))
+        y_train = np.random.random((10, 1))
+
+        with float_type('float64'):
+            optimizer = algorithms.LevenbergMarquardt(
+                layers.Input(2) >> layers.Sigmoid(3) >> layers.Sigmoid(1),
+                verbose=False,
+            )
+
+        optimizer.train(x_train, y_train, epochs=5)
+        self.assertEqual(optimizer.predict(x_train).dtype, np.float64)
+        self.assertLess(
+            optimizer.errors.train[-1], optimizer.errors.train[0])
+
+    def test_network_keeps_float_type_outside_of_context(self):
+        with float_type('float64'):
+            network = layers.Input(2) >> layers.Sigmoid(3)
+
+        self.assertEqual(network.float_type, 'float64')
+        self.assertEqual(network.inputs.dtype, tf.float64)
+        self.assertEqual(network.outputs.dtype, tf.float64)
+
+        for variable in network.variables.values():
+            self.assertEqual(variable.dtype.base_dtype, tf.float64)
+
+        # Layer's output doesn't depend on active float type
+        output = network.output(np.random.random((4, 2)))
+        self.assertEqual(output.dtype, tf.float64)
+
+    def test_connect_layers_with_different_float_types(self):
+        with float_type('float64'):
+            network = layers.Input(2) >> layers.Sigmoid(3)
+
+        with self.assertRaisesRegexp(LayerConnectionError, "float types"):
+            layers.join(network, layers.Sigmoid(1))
+
+    def test_float16_training_with_master_weights(self):
+        x_train = asfloat(np.random.random((20, 2)))
+        y_train = asfloat(np.random.random((20, 1)))
+
+        with float_type('float16'):
+            network = layers.join(
+                layers.Input(2),
+                layers.Sigmoid(3),
+                layers.Sigmoid(1),
+            )
+
+        optimizer = algorithms.Adam(
+            network,
+            step=0.01,
+            loss_scale=128,
+            batch_size=5,
+            verbose=False,
+        )
+        self.assertEqual(optimizer.float_type, 'float16')
+        optimizer.train(x_train, y_train, epochs=10)
+
+        master_variables = [
+            variable for variable in tf.global_variables()
+            if variable.name.endswith('/master:0')]
+
+        self.assertEqual(len(master_variables), 4)
+
+        for variable in master_variables:
+            self.assertEqual(variable.dtype.base_dtype, tf.float32)
+
+        self.assertEqual(optimizer.predict(x_train).dtype, np.float16)
+        self.assertLess(
+            optimizer.errors.train[-1], optimizer.errors.train[0])
+
+    def test_loss_scale_has_to_be_positive(self):
+        network = layers.Input(2) >> layers.Sigmoid(1)
+
+        with self.assertRaisesRegexp(ValueError, "excluding 0"):
+            algorithms.GradientDescent(network, loss_scale=0)